@@ -0,0 +1,185 @@
+# Importing simulation components
+from simulator.simulator import Simulator
+from simulator.helper_methods import *
+
+# Importing placement strategies
+from simulator.strategies import nsgaii
+from simulator.strategies.nsgaii import PlacementProblem, BACKENDS
+
+# Importing Python libraries
+from random import seed
+import importlib
+import argparse
+import time
+
+
+def run_nsgaii(parameters: dict, seed_value: int) -> dict:
+    """Runs the NSGA-II algorithm on the loaded scenario and resets the scenario afterwards.
+
+    Args:
+        parameters (dict): NSGA-II parameters.
+        seed_value (int): Seed value used to enable reproducibility.
+
+    Returns:
+        execution_metadata (dict): Information about the execution returned by the algorithm.
+    """
+    seed(seed_value)
+
+    start_time = time.time()
+    execution_metadata = nsgaii(parameters=parameters)
+    execution_metadata["execution_time"] = time.time() - start_time
+
+    reset_scenario()
+
+    return execution_metadata
+
+
+def benchmark_warm_start(datasets: list, parameters: dict, warm_start_fractions: list, seed_value: int):
+    """Compares how many generations the NSGA-II algorithm takes to reach the final quality of a randomly-seeded run when
+    part of its initial population is seeded with heuristic placements.
+
+    Args:
+        datasets (list): Dataset files.
+        parameters (dict): NSGA-II parameters.
+        warm_start_fractions (list): Fractions of the initial population seeded with heuristic placements.
+        seed_value (int): Seed value used to enable reproducibility.
+    """
+    for dataset in datasets:
+        Simulator().initialize(input_file=dataset)
+
+        # The quality reached by the randomly-seeded run after all generations is used as the target for the other runs
+        target_quality = run_nsgaii(parameters={**parameters, "warm_start": 0}, seed_value=seed_value)["best_quality"]
+
+        print(f"\n=== {dataset} (target quality: {round(target_quality, 4)}) ===")
+        print(f"{'warm_start':>10} | {'generations_to_target':>21} | {'best_quality':>12} | {'execution_time':>14}")
+
+        # The randomly-seeded run is repeated with the target set (runs with the same seed are identical), so that it reports the
+        # generation in which it first reached its final quality rather than the generation in which it stopped
+        for warm_start in [0] + warm_start_fractions:
+            result = run_nsgaii(
+                parameters={**parameters, "warm_start": warm_start, "target_quality": target_quality}, seed_value=seed_value
+            )
+            generations = result["generations_to_target"] if result["generations_to_target"] is not None else "not reached"
+            quality = round(result["best_quality"], 4)
+            print(f"{warm_start:>10} | {generations:>21} | {quality:>12} | {round(result['execution_time'], 2):>14}")
+
+
+def benchmark_graded_constraint(datasets: list, parameters: dict, capacity_factors: list, seed_values: list):
+    """Compares how many generations the NSGA-II algorithm takes to find its first feasible solution when the capacity constraint
+    is expressed as the number of overloaded data centers or as graded overload magnitudes.
+
+    Args:
+        datasets (list): Dataset files.
+        parameters (dict): NSGA-II parameters.
+        capacity_factors (list): Factors applied to the data center capacities to create tighter (harder) scenarios.
+        seed_values (list): Seed values of the repetitions of each configuration.
+    """
+    for dataset in datasets:
+        for capacity_factor in capacity_factors:
+            Simulator().initialize(input_file=dataset)
+
+            # Tightening the scenario by scaling the data center capacities
+            for data_center in DataCenter.all():
+                data_center.capacity = data_center.capacity * capacity_factor
+            invalidate_scenario_invariants()
+
+            print(f"\n=== {dataset} (capacity factor: {capacity_factor}) ===")
+            print(f"{'constraint':>15} | {'generations_to_feasible':>23} | {'best_quality':>12} | {'execution_time':>14}")
+
+            for constraint in PlacementProblem.CONSTRAINTS:
+                results = [run_nsgaii(parameters={**parameters, "constraint": constraint}, seed_value=value) for value in seed_values]
+
+                # Runs that never found a feasible solution are counted as taking all generations
+                generations = [result["generations_to_feasible"] or parameters["n_gen"] for result in results]
+                feasible_runs = sum(1 for result in results if result["generations_to_feasible"] is not None)
+                mean_generations = f"{round(sum(generations) / len(results), 1)} ({feasible_runs}/{len(results)} feasible)"
+                mean_quality = sum(result["best_quality"] for result in results) / len(results)
+                mean_time = sum(result["execution_time"] for result in results) / len(results)
+
+                print(f"{constraint:>15} | {mean_generations:>23} | {round(mean_quality, 4):>12} | {round(mean_time, 2):>14}")
+
+
+def benchmark_backends(datasets: list, parameters: dict, seed_values: list):
+    """Compares the Pareto fronts and execution times of the NSGA-II backends, and how the NumPy backend splits its time between
+    evaluating chromosomes and running the genetic operators (selection, crossover, mutation, duplicate elimination and survival).
+
+    Args:
+        datasets (list): Dataset files.
+        parameters (dict): NSGA-II parameters.
+        seed_values (list): Seed values of the repetitions of each configuration.
+    """
+    for dataset in datasets:
+        Simulator().initialize(input_file=dataset)
+
+        print(f"\n=== {dataset} ===")
+        print(
+            f"{'backend':>7} | {'hypervolume':>11} | {'best_quality':>12} | {'execution_time':>14} | {'evaluation_time':>15} | "
+            f"{'operator_time':>13}"
+        )
+
+        for backend in BACKENDS:
+            results = [run_nsgaii(parameters={**parameters, "backend": backend}, seed_value=value) for value in seed_values]
+
+            mean_hypervolume = sum(result["hypervolume"] for result in results) / len(results)
+            mean_quality = sum(result["best_quality"] for result in results) / len(results)
+            mean_time = sum(result["execution_time"] for result in results) / len(results)
+
+            # Only the NumPy backend tells apart the evaluation time from the time spent on the genetic operators
+            if "evaluation_time" in results[0]:
+                evaluation_time = round(sum(result["evaluation_time"] for result in results) / len(results), 2)
+                operator_time = round(sum(result["operator_time"] for result in results) / len(results), 2)
+            else:
+                evaluation_time, operator_time = "-", "-"
+
+            print(
+                f"{backend:>7} | {round(mean_hypervolume, 2):>11} | {round(mean_quality, 4):>12} | {round(mean_time, 2):>14} | "
+                f"{evaluation_time:>15} | {operator_time:>13}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("experiment", choices=["warm_start", "graded_constraint", "backends"], help="Benchmark that will be executed")
+    parser.add_argument("--datasets", "-d", nargs="+", help="Dataset files", default=["datasets/dataset1.json"])
+    parser.add_argument("--seed", "-s", help="Seed value", default="1")
+    parser.add_argument("--pop_size", "-p", help="Population size", default="100")
+    parser.add_argument("--n_gen", "-g", help="Number of generations", default="200")
+    parser.add_argument("--cross_prob", "-c", help="Crossover probability (0.0 to 1.0)", default="1")
+    parser.add_argument("--mut_prob", "-m", help="Mutation probability (0.0 to 1.0)", default="0.2")
+    parser.add_argument("--warm_start", "-w", nargs="+", help="Warm-start fractions (warm_start)", default=["0.1", "0.25"])
+    parser.add_argument("--capacity_factors", "-f", nargs="+", help="Capacity factors (graded_constraint)", default=["1", "0.5"])
+    parser.add_argument("--repetitions", "-r", help="Repetitions (with consecutive seeds) of each configuration", default="3")
+    args = parser.parse_args()
+
+    # Hiding the NSGA-II's progress output
+    importlib.import_module("simulator.strategies.nsgaii").VERBOSE = False
+
+    parameters = {
+        "pop_size": int(args.pop_size),
+        "n_gen": int(args.n_gen),
+        "cross_prob": float(args.cross_prob),
+        "mut_prob": float(args.mut_prob),
+    }
+
+    if args.experiment == "warm_start":
+        benchmark_warm_start(
+            datasets=args.datasets,
+            parameters=parameters,
+            warm_start_fractions=[float(fraction) for fraction in args.warm_start],
+            seed_value=int(args.seed),
+        )
+
+    elif args.experiment == "graded_constraint":
+        benchmark_graded_constraint(
+            datasets=args.datasets,
+            parameters=parameters,
+            capacity_factors=[float(factor) for factor in args.capacity_factors],
+            seed_values=[int(args.seed) + repetition for repetition in range(int(args.repetitions))],
+        )
+
+    elif args.experiment == "backends":
+        benchmark_backends(
+            datasets=args.datasets,
+            parameters=parameters,
+            seed_values=[int(args.seed) + repetition for repetition in range(int(args.repetitions))],
+        )
@@ -1,88 +1,112 @@
+# Importing the result store and the shared-directory work queue
+from simulator.result_store import compute_run_key, has_result
+from simulator.work_queue import create_queue, submit_job, open_queue, close_queue, get_queue_status, run_worker
+
+# Importing the successive-halving search over the NSGA-II parameters
+from simulator.simulator import Simulator
+from simulator.tuning import get_configurations, run_tuning
+
+# Importing the makespan-aware scheduler
+from simulator.scheduler import fit_cost_model, predict_cost, order_jobs, schedule_jobs, get_available_memory
+
+# Importing the shared-memory scenario arena
+from simulator.shared_scenario import SharedScenario, SHARED_SCENARIOS_VARIABLE
+
 # Importing Python libraries
-from subprocess import Popen, DEVNULL, TimeoutExpired
+from subprocess import Popen, TimeoutExpired
 import itertools
+import argparse
+import sys
 import os
 
 
-NUMBER_OF_PARALLEL_PROCESSES = os.cpu_count() - 2
+NUMBER_OF_PARALLEL_PROCESSES = max(os.cpu_count() - 2, 1)
 
 
-def run_simulation(dataset: str, algorithm: str, n_gen: int, pop_size: int, cross_prob: float, mut_prob: float):
-    """Executes the simulation with the specified parameters.
+def get_parameters(n_gen: int, pop_size: int, cross_prob: float, mut_prob: float, stagnation_window: int = 0) -> dict:
+    """Builds the algorithm parameters exactly as the simulator parses them from the command line, so that the run keys
+    computed by the sweep match the keys under which the simulator stores its results.
     Args:
-        dataset (str): Dataset being read.
-        algorithm (str): Algorithm being executed.
         n_gen (int): Number of generations of the NSGA-II algorithm.
         pop_size (int): Number of chromosomes in the NSGA-II's population.
         cross_prob (float): NSGA-II's crossover probability.
         mut_prob (float): NSGA-II's mutation probability.
+        stagnation_window (int, optional): Generations without improving the best feasible solution before NSGA-II stops. Defaults to 0 (disabled).
+    Returns:
+        parameters (dict): Algorithm parameters.
     """
-    # Running the simulation based on the parameters and gathering its execution time
-    cmd = f"python3 -B -m simulator -d {dataset} -a {algorithm} -p {pop_size} -g {n_gen} -c {cross_prob} -m {mut_prob}"
-
-    return Popen(cmd.split(" "), stdout=DEVNULL, stderr=DEVNULL)
-
-
-# Parameters
-datasets = ["datasets/dataset1.json"]
-algorithms = ["nsgaii"]
-
-population_sizes = [400]
-number_of_generations = [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000, 1100, 1200, 1300, 1400, 1500]
-crossover_probabilities = [1]
-mutation_probabilities = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1]
-
-print(f"Datasets: {datasets}")
-print(f"Algorithms: {algorithms}")
-print(f"Population sizes: {population_sizes}")
-print(f"Number of generations: {number_of_generations}")
-print(f"Crossover probabilities: {crossover_probabilities}")
-print(f"Mutation probabilities: {mutation_probabilities}")
-print()
-
-# Generating list of combinations with the parameters specified
-combinations = list(
-    itertools.product(
-        datasets,
-        algorithms,
-        population_sizes,
-        number_of_generations,
-        crossover_probabilities,
-        mutation_probabilities,
-    )
-)
-
-# Executing simulations and collecting results
-processes = []
-
-print(f"EXECUTING {len(combinations)} COMBINATIONS")
-
-for i, parameters in enumerate(combinations, 1):
-    # Parsing parameters
-    dataset = parameters[0]
-    algorithm = parameters[1]
-    pop_size = parameters[2]
-    n_gen = parameters[3]
-    cross_prob = parameters[4]
-    mut_prob = parameters[5]
-
-    print(f"\t[Execution {i}]")
-    print(f"\t\t[{algorithm}] dataset={dataset}. pop_size={pop_size}. n_gen={n_gen}. cross_prob={cross_prob}. mut_prob={mut_prob}")
-
-    # Executing algorithm
-    proc = run_simulation(
-        dataset=dataset,
-        algorithm=algorithm,
-        pop_size=pop_size,
-        n_gen=n_gen,
-        cross_prob=cross_prob,
-        mut_prob=mut_prob,
-    )
+    parameters = {
+        "pop_size": int(pop_size),
+        "n_gen": int(n_gen),
+        "cross_prob": float(cross_prob),
+        "mut_prob": float(mut_prob),
+    }
+    if stagnation_window > 0:
+        parameters["stagnation_window"] = int(stagnation_window)
+
+    return parameters
+
+
+def get_command(dataset: str, algorithm: str, parameters: dict, seed_value: int, result_store: str) -> list:
+    """Builds the command that executes the simulation with the specified parameters.
+    Args:
+        dataset (str): Dataset being read.
+        algorithm (str): Algorithm being executed.
+        parameters (dict): Algorithm parameters.
+        seed_value (int): Seed value.
+        result_store (str): Directory of the result store where the simulation stores its results.
+    Returns:
+        list: Command arguments.
+    """
+    cmd = f"python3 -B -m simulator -s {seed_value} -d {dataset} -a {algorithm} -p {parameters['pop_size']} -g {parameters['n_gen']}"
+    cmd += f" -c {parameters['cross_prob']} -m {parameters['mut_prob']} --result_store {result_store}"
+    if "stagnation_window" in parameters:
+        cmd += f" --stagnation_window {parameters['stagnation_window']}"
+
+    return cmd.split(" ")
 
-    processes.append(proc)
 
-    while len(processes) > NUMBER_OF_PARALLEL_PROCESSES:
-        for proc in processes:
+def start_local_workers(queue: str, n_workers: int, lease: float) -> list:
+    """Starts worker processes that execute the jobs of a shared-directory queue on this machine.
+    Args:
+        queue (str): Directory of the queue.
+        n_workers (int): Number of worker processes.
+        lease (float): Lease of job claims (in seconds).
+    Returns:
+        list: Worker processes.
+    """
+    cmd = [sys.executable, "-B", os.path.abspath(__file__), "--queue", queue, "--worker", "--lease", str(lease)]
+
+    return [Popen(cmd) for _ in range(n_workers)]
+
+
+def publish_scenarios(datasets: list) -> list:
+    """Publishes the compiled arrays of each dataset in shared memory, so that the runs started on this machine attach to them
+    instead of compiling their own copies (runs on other nodes do not find the arenas and compile their arrays as usual).
+    Args:
+        datasets (list): Dataset files.
+    Returns:
+        scenarios (list): Shared scenarios (must be closed once the runs finish, which destroys them).
+    """
+    scenarios = []
+    for dataset in datasets:
+        Simulator().initialize(input_file=dataset)
+        scenarios.append(SharedScenario.create(dataset=dataset))
+
+    # Processes started from now on inherit the names of the arenas
+    os.environ[SHARED_SCENARIOS_VARIABLE] = ",".join(scenario.name for scenario in scenarios)
+
+    return scenarios
+
+
+def wait_for_processes(processes: list, limit: int):
+    """Waits until the number of running processes drops to a given limit.
+    Args:
+        processes (list): Running processes (finished processes are removed from the list).
+        limit (int): Maximum number of processes left running.
+    """
+    while len(processes) > limit:
+        for proc in list(processes):
             try:
                 proc.wait(timeout=1)
 
@@ -93,4 +117,172 @@ for i, parameters in enumerate(combinations, 1):
                 processes.remove(proc)
                 print(f"PID {proc.pid} finished")
 
-    print(f"{len(processes)} processes running in parallel")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", "-s", help="Seed value", default="1")
+    parser.add_argument("--result_store", "-r", help="Directory of the content-addressed result store (defaults to logs/results)")
+    parser.add_argument("--force", "-f", help="Recomputes runs whose results are already stored", action="store_true")
+    parser.add_argument("--memory_fraction", help="Fraction of the available memory used by concurrent runs", default="0.8")
+
+    # Distributed sweep arguments (the coordinator submits the runs to a queue directory mounted by every node)
+    parser.add_argument("--queue", "-q", help="Shared directory of the work queue (enables the distributed sweep)", default=None)
+    parser.add_argument("--worker", "-w", help="Runs a worker that executes the queue's jobs", action="store_true")
+    parser.add_argument("--local_workers", "-l", help="Worker processes started on this machine by the coordinator", default="0")
+    parser.add_argument("--lease", help="Seconds after which claims of unresponsive workers expire", default="60")
+
+    # Tuning arguments (successive halving replaces the exhaustive grid, using the number of generations as the budget)
+    parser.add_argument("--tune", "-t", help="Searches the best configuration with successive halving", action="store_true")
+    parser.add_argument("--eta", help="Factor by which configurations are cut and budgets grow at each rung", default="3")
+    parser.add_argument("--metric", help="Metric compared by the search (best_quality or hypervolume)", default="best_quality")
+    parser.add_argument("--output", "-o", help="CSV file that receives the ranked configurations of each dataset", default=None)
+    args = parser.parse_args()
+
+    # Results of distributed sweeps are stored in the queue directory by default, as every node can reach it
+    if args.result_store is None:
+        args.result_store = f"{args.queue}/results" if args.queue else "logs/results"
+
+    if args.worker:
+        if not args.queue:
+            parser.error("--worker requires --queue")
+
+        summary = run_worker(queue=args.queue, lease=float(args.lease))
+        print(f"Worker {summary['worker']} finished ({summary['completed']} jobs completed, {summary['failed']} attempts failed)")
+        sys.exit(0)
+
+    # Parameters
+    datasets = ["datasets/dataset1.json"]
+    algorithms = ["nsgaii"]
+
+    population_sizes = [400]
+    number_of_generations = [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000, 1100, 1200, 1300, 1400, 1500]
+    crossover_probabilities = [1]
+    mutation_probabilities = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1]
+
+    # Generations without improvement after which NSGA-II stops before reaching "n_gen" (0 disables early termination)
+    stagnation_window = 100
+
+    print(f"Datasets: {datasets}")
+    print(f"Algorithms: {algorithms}")
+    print(f"Population sizes: {population_sizes}")
+    print(f"Number of generations: {number_of_generations}")
+    print(f"Crossover probabilities: {crossover_probabilities}")
+    print(f"Mutation probabilities: {mutation_probabilities}")
+    print(f"Stagnation window: {stagnation_window}")
+    print()
+
+    if args.tune:
+        # The smallest and largest numbers of generations are the budgets of the first and last rungs
+        configurations = get_configurations(
+            pop_sizes=population_sizes, cross_probs=crossover_probabilities, mut_probs=mutation_probabilities
+        )
+        tuning_parameters = {
+            "min_gen": min(number_of_generations),
+            "max_gen": max(number_of_generations),
+            "eta": int(args.eta),
+            "metric": args.metric,
+            "seed_value": int(args.seed),
+        }
+
+        for dataset in datasets:
+            print(f"TUNING {len(configurations)} CONFIGURATIONS ON {dataset}")
+            Simulator().initialize(input_file=dataset)
+
+            output_file = f"{args.output.rsplit('.', 1)[0]}-{os.path.basename(dataset).rsplit('.', 1)[0]}.csv" if args.output else None
+            summary = run_tuning(configurations=configurations, parameters=tuning_parameters, output_file=output_file)
+
+            for key, value in summary.items():
+                print(f"{key}: {value}")
+
+        sys.exit(0)
+
+    # Generating list of combinations with the parameters specified
+    combinations = list(
+        itertools.product(
+            datasets,
+            algorithms,
+            population_sizes,
+            number_of_generations,
+            crossover_probabilities,
+            mutation_probabilities,
+        )
+    )
+
+    # Predicting the cost of each run from its parameters, calibrated to the runtimes of the runs in the result store
+    cost_model = fit_cost_model(result_store=args.result_store)
+    for algorithm, scales in cost_model.items():
+        print(f"Cost model ({algorithm}): {scales}")
+
+    # Gathering the runs that must be executed
+    jobs = []
+    skipped = 0
+
+    if args.queue:
+        create_queue(queue=args.queue)
+        open_queue(queue=args.queue)
+
+    print(f"EXECUTING {len(combinations)} COMBINATIONS")
+
+    for i, combination in enumerate(combinations, 1):
+        # Parsing parameters
+        dataset = combination[0]
+        algorithm = combination[1]
+        parameters = get_parameters(
+            pop_size=combination[2],
+            n_gen=combination[3],
+            cross_prob=combination[4],
+            mut_prob=combination[5],
+            stagnation_window=stagnation_window,
+        )
+
+        print(f"\t[Execution {i}]")
+        print(f"\t\t[{algorithm}] dataset={dataset}. {'. '.join(f'{key}={value}' for key, value in parameters.items())}")
+
+        # Skipping runs whose results are already stored (unless their recomputation is forced)
+        run_key = compute_run_key(dataset=dataset, algorithm=algorithm, parameters=parameters, seed_value=int(args.seed))
+        if not args.force and has_result(result_store=args.result_store, key=run_key):
+            print(f"\t\tSkipped (result {run_key[:12]} already stored)")
+            skipped += 1
+            continue
+
+        predicted_time, predicted_memory = predict_cost(model=cost_model, dataset=dataset, algorithm=algorithm, parameters=parameters)
+        print(f"\t\tPredicted cost: {predicted_time:.1f} s, {predicted_memory:.0f} MB")
+
+        cmd = get_command(
+            dataset=dataset, algorithm=algorithm, parameters=parameters, seed_value=int(args.seed), result_store=args.result_store
+        )
+        jobs.append({"id": run_key, "command": cmd, "predicted_time": predicted_time, "predicted_memory": predicted_memory})
+
+    # Sharing the scenario arrays among the runs executed on this machine
+    scenarios = []
+    if len(jobs) > 0 and (not args.queue or int(args.local_workers) > 0):
+        scenarios = publish_scenarios(datasets=datasets)
+
+    try:
+        if args.queue:
+            # Submitting the runs to the work queue instead of executing them on this machine (workers claim the costliest runs first)
+            for job in order_jobs(jobs=jobs):
+                if not submit_job(queue=args.queue, job_id=job["id"], command=job["command"], priority=job["predicted_time"]):
+                    print(f"Skipped (job {job['id'][:12]} already completed)")
+                    skipped += 1
+
+            close_queue(queue=args.queue)
+            print(f"Submitted {len(combinations) - skipped} combinations to {args.queue} ({skipped} skipped)")
+
+            # Workers on other nodes are started with "python run_experiments.py --queue <directory> --worker"
+            processes = start_local_workers(queue=args.queue, n_workers=int(args.local_workers), lease=float(args.lease))
+            wait_for_processes(processes=processes, limit=0)
+
+            print(f"Queue status: {get_queue_status(queue=args.queue, lease=float(args.lease))}")
+            sys.exit(0)
+
+        # Executing the costliest runs first, with as many runs at once as the CPU cores and the available memory allow
+        available_memory = get_available_memory()
+        memory_budget = available_memory * float(args.memory_fraction) if available_memory is not None else None
+        summary = schedule_jobs(jobs=jobs, max_processes=NUMBER_OF_PARALLEL_PROCESSES, memory_budget=memory_budget)
+
+        print(f"Executed {len(combinations) - skipped} combinations ({skipped} skipped)")
+        print(f"Makespan: {summary['makespan']:.1f} s (predicted lower bound: {summary['predicted_makespan_lower_bound']:.1f} s)")
+    finally:
+        for scenario in scenarios:
+            scenario.close()
@@ -9,18 +9,39 @@ from simulator.strategies import *
 # Importing Python libraries
 from random import seed
 import argparse
+import signal
 import time
 import csv
+import sys
 
 
-def main(seed_value: int, algorithm: str, dataset: str, parameters: dict = {}):
+# Parameters whose values are paths, which are left out of output file names (their separators would turn names into paths)
+PATH_PARAMETERS = ["archive_dir", "migration_dir"]
+
+
+def main(
+    seed_value: int, algorithm: str, dataset: str, parameters: dict = {}, instrumentation: bool = False, result_store: str = None
+):
     # Setting a seed value to enable reproducibility
     seed(seed_value)
 
-    # Creating a Simulator object
+    # Identifying the run in the result store before executing it (the key covers the dataset content and the code version)
+    if result_store:
+        from simulator.result_store import compute_run_key, save_result
+        from simulator.scheduler import get_peak_memory
+
+        run_key = compute_run_key(dataset=dataset, algorithm=algorithm, parameters=parameters, seed_value=seed_value)
+
+    # Counting calls to hot paths and gathering cache statistics (if requested)
+    if instrumentation:
+        from simulator import instrumentation as instrumentation_registry
+
+        instrumentation_registry.enable()
+
+    # Creating a Simulator object (the seed value also reaches algorithms that seed their own processes, such as islands)
     simulator = Simulator(
         placement_algorithm=eval(algorithm),
-        placement_algorithm_parameters=parameters,
+        placement_algorithm_parameters={**parameters, "seed": seed_value},
     )
 
     # Loading the dataset
@@ -34,25 +55,25 @@ def main(seed_value: int, algorithm: str, dataset: str, parameters: dict = {}):
     print(f"=== REGIONS ===")
     for region in Region.all():
         print(f"{region}. Data Centers: {len(region.data_centers)}")
-    exit(1)
 
     # Executing the simulation
-    simulator.run()
+    execution_metadata = simulator.run()
 
     metrics = calculate_metrics()
     print("\n\n==== SIMULATION OUTPUT ====")
     print(f"Algorithm: {algorithm}")
-    for metric_name, metric_value in metrics.items():
+    for metric_name, metric_value in {**metrics, **execution_metadata}.items():
         print(f"{metric_name}: {metric_value}")
     print("")
 
-    simulation_output = {"algorithm": algorithm, **parameters, **metrics}
+    simulation_output = {"algorithm": algorithm, **parameters, **metrics, **execution_metadata}
 
     # Exporting the simulation results to a CSV file
     # Parsing the algorithm's parameters string
     output_file_name = f"{str(time.time()).replace('.', '-')}-{algorithm};"
     for key, value in parameters.items():
-        output_file_name += f"{key}={value};"
+        if key not in PATH_PARAMETERS:
+            output_file_name += f"{key}={value};"
 
     if algorithm == "nsgaii":
         with open(f"logs/{output_file_name}.csv", "w") as file:
@@ -60,11 +81,291 @@ def main(seed_value: int, algorithm: str, dataset: str, parameters: dict = {}):
             writer.writeheader()
             writer.writerow(simulation_output)
 
+    # Storing the results so that sweeps can skip this run in the future
+    if result_store:
+        # The peak memory usage is stored so that sweep schedulers can predict how many runs fit in memory at once
+        result = {"dataset": dataset, "seed": seed_value, **simulation_output, "peak_memory": get_peak_memory()}
+        save_result(result_store=result_store, key=run_key, result=result)
+
+    # Exporting the instrumentation data alongside the simulation results
+    if instrumentation:
+        instrumentation_data = instrumentation_registry.dump(output_file=f"logs/{output_file_name}-instrumentation.json")
+        instrumentation_registry.disable()
+
+        print("==== INSTRUMENTATION ====")
+        for name, counter in instrumentation_data["calls"].items():
+            print(f"{name}: {counter['calls']} calls ({round(counter['time'], 4)} s)")
+        for name, statistics in instrumentation_data["caches"].items():
+            print(f"{name}: {statistics}")
+
+    # Resetting the simulation scenario
+    reset_scenario()
+
+
+def serve(seed_value: int, dataset: str, host: str, port: int, unix_socket: str, batch_window: float):
+    # Importing the placement server only when it is requested
+    from simulator.server import serve as serve_placements
+
+    # Setting a seed value to enable reproducibility
+    seed(seed_value)
+
+    # Creating a Simulator object and loading the dataset only once for all requests
+    simulator = Simulator()
+    simulator.initialize(input_file=dataset)
+
+    serve_placements(simulator=simulator, host=host, port=port, unix_socket=unix_socket, batch_window=batch_window)
+
+
+def mobility(seed_value: int, algorithm: str, dataset: str, parameters: dict, mobility_parameters: dict):
+    # Importing the mobility simulation only when it is requested
+    from simulator.mobility import simulate_mobility
+
+    # Setting a seed value to enable reproducibility
+    seed(seed_value)
+
+    # Computing the initial placement with the chosen strategy
+    simulator = Simulator(placement_algorithm=eval(algorithm), placement_algorithm_parameters={**parameters, "seed": seed_value})
+    simulator.initialize(input_file=dataset)
+    simulator.run()
+    print(f"Initial placement ({algorithm}): {calculate_metrics()}")
+
+    summary = simulate_mobility(**mobility_parameters)
+
+    print("\n\n==== MOBILITY SIMULATION OUTPUT ====")
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+
     # Resetting the simulation scenario
     reset_scenario()
 
 
+def what_if(seed_value: int, algorithm: str, dataset: str, parameters: dict, failure_types: list, failover: str, output_file: str):
+    # Importing the failure analysis only when it is requested
+    from simulator.what_if import run_what_if_analysis
+
+    # Setting a seed value to enable reproducibility
+    seed(seed_value)
+
+    # Computing the placement that will be analyzed with the chosen strategy
+    simulator = Simulator(placement_algorithm=eval(algorithm), placement_algorithm_parameters={**parameters, "seed": seed_value})
+    simulator.initialize(input_file=dataset)
+    simulator.run()
+    print(f"Placement ({algorithm}): {calculate_metrics()}")
+
+    summary = run_what_if_analysis(failure_types=failure_types, failover=failover, output_file=output_file)
+
+    print("\n\n==== WHAT-IF ANALYSIS OUTPUT ====")
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+
+    # Resetting the simulation scenario
+    reset_scenario()
+
+
+def robustness(seed_value: int, algorithms: list, dataset: str, parameters: dict, robustness_parameters: dict, output_file: str):
+    # Importing the robustness analysis only when it is requested
+    from simulator.robustness import run_robustness_analysis
+
+    simulator = Simulator()
+    simulator.initialize(input_file=dataset)
+
+    # Computing the placement of each strategy on the same scenario
+    placements = {}
+    for algorithm in algorithms:
+        # Setting a seed value to enable reproducibility
+        seed(seed_value)
+
+        simulator.placement_algorithm = eval(algorithm)
+        simulator.placement_algorithm_parameters = {**parameters, "seed": seed_value}
+        simulator.run()
+        print(f"Placement ({algorithm}): {calculate_metrics()}")
+
+        # Placements that leave services unprovisioned have no route or demand to perturb, so they are left out of the analysis
+        unprovisioned = sum(1 for service in Service.all() if service.data_center is None)
+        if unprovisioned > 0:
+            print(f"Skipping {algorithm}: {unprovisioned} of {Service.count()} services were not provisioned.")
+        else:
+            placements[algorithm] = [service.data_center.id for service in Service.all()]
+        reset_scenario()
+
+    if not placements:
+        raise Exception("None of the strategies provisioned every service, so there are no placements to analyze.")
+
+    results = run_robustness_analysis(placements=placements, parameters=robustness_parameters, output_file=output_file)
+
+    print("\n\n==== ROBUSTNESS ANALYSIS OUTPUT ====")
+    for result in results:
+        print(f"{result['placement']}: {result}")
+
+
+def publish(dataset: str, name: str = None):
+    # Importing the shared scenario only when it is requested
+    from simulator.shared_scenario import SharedScenario
+
+    Simulator().initialize(input_file=dataset)
+
+    # Keeping the shared scenario available until the process is interrupted
+    # Simulator processes on this host attach to it when its name is listed in the "SIMULATOR_SHARED_SCENARIOS" variable
+    with SharedScenario.create(name=name, dataset=dataset) as scenario:
+        size = round(scenario.shm.size / 1024, 2)
+        print(f"Shared scenario '{scenario.name}' published ({size} KB). Press Ctrl+C to stop sharing it.", flush=True)
+
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            signal.pause()
+        except KeyboardInterrupt:
+            pass
+
+
 if __name__ == "__main__":
+    # Launching a long-lived placement server (e.g., "python -m simulator serve -d datasets/dataset1.json")
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        parser = argparse.ArgumentParser(prog="python -m simulator serve")
+        parser.add_argument("--seed", "-s", help="Seed value for EdgeSimPy", default="1")
+        parser.add_argument("--dataset", "-d", help="Dataset file")
+        parser.add_argument("--host", help="Host address used when serving over TCP", default="127.0.0.1")
+        parser.add_argument("--port", help="Port used when serving over TCP", default="8765")
+        parser.add_argument("--socket", help="Unix socket path (takes precedence over host and port)", default=None)
+        parser.add_argument("--batch_window", help="Time (in seconds) spent gathering concurrent requests", default="0.005")
+
+        args = parser.parse_args(sys.argv[2:])
+
+        serve(
+            seed_value=int(args.seed),
+            dataset=args.dataset,
+            host=args.host,
+            port=int(args.port),
+            unix_socket=args.socket,
+            batch_window=float(args.batch_window),
+        )
+        sys.exit(0)
+
+    # Scoring externally produced placements (e.g., "python -m simulator score -d datasets/dataset1.json -i placements.npy")
+    if len(sys.argv) > 1 and sys.argv[1] == "score":
+        from simulator.scoring import score_placements
+
+        parser = argparse.ArgumentParser(prog="python -m simulator score")
+        parser.add_argument("--dataset", "-d", help="Dataset file")
+        parser.add_argument("--input", "-i", help="JSONL or .npy file with the placements that will be scored")
+        parser.add_argument("--output", "-o", help="JSONL or CSV output file (defaults to the standard output)", default=None)
+        parser.add_argument("--batch_size", "-b", help="Number of placements scored at once", default="10000")
+        parser.add_argument("--processes", "-n", help="Number of worker processes", default="1")
+        parser.add_argument("--shared_scenario", help="Name of a shared scenario published with 'publish'", default=None)
+
+        args = parser.parse_args(sys.argv[2:])
+
+        score_placements(
+            dataset=args.dataset,
+            input_file=args.input,
+            output_file=args.output,
+            batch_size=int(args.batch_size),
+            processes=int(args.processes),
+            shared_scenario=args.shared_scenario,
+        )
+        sys.exit(0)
+
+    # Publishing the compiled scenario in shared memory (e.g., "python -m simulator publish -d datasets/dataset1.json -n thea")
+    if len(sys.argv) > 1 and sys.argv[1] == "publish":
+        parser = argparse.ArgumentParser(prog="python -m simulator publish")
+        parser.add_argument("--dataset", "-d", help="Dataset file")
+        parser.add_argument("--name", "-n", help="Name of the shared scenario (defaults to a random name)", default=None)
+
+        args = parser.parse_args(sys.argv[2:])
+
+        publish(dataset=args.dataset, name=args.name)
+        sys.exit(0)
+
+    # Time-stepped simulation with user mobility (e.g., "python -m simulator mobility -d datasets/dataset1.json -a proposed_algorithm")
+    if len(sys.argv) > 1 and sys.argv[1] == "mobility":
+        parser = argparse.ArgumentParser(prog="python -m simulator mobility")
+        parser.add_argument("--seed", "-s", help="Seed value for EdgeSimPy", default="1")
+        parser.add_argument("--dataset", "-d", help="Dataset file")
+        parser.add_argument(
+            "--algorithm",
+            "-a",
+            help="Algorithm that computes the initial placement and re-places applications (strategies that only place whole "
+            "scenarios, such as portfolio, re-place applications with proposed_algorithm)",
+            default="proposed_algorithm",
+        )
+        parser.add_argument("--steps", "-n", help="Number of simulation steps", default="1000")
+        parser.add_argument("--trace", "-t", help="CSV or JSONL mobility trace (defaults to a random-walk model)", default=None)
+        parser.add_argument("--mobility_probability", help="Probability of each user moving in a step (random walk)", default="0.05")
+        parser.add_argument("--replacement", "-r", help="Re-placement policy (none, on_violation or always)", default="on_violation")
+        parser.add_argument("--output", "-o", help="CSV file that receives the metrics of each step", default=None)
+
+        args = parser.parse_args(sys.argv[2:])
+
+        mobility(
+            seed_value=int(args.seed),
+            algorithm=args.algorithm,
+            dataset=args.dataset,
+            parameters={},
+            mobility_parameters={
+                "n_steps": int(args.steps),
+                "trace_file": args.trace,
+                "mobility_probability": float(args.mobility_probability),
+                "replacement": args.replacement,
+                "algorithm": args.algorithm,
+                "output_file": args.output,
+            },
+        )
+        sys.exit(0)
+
+    # N-1 failure analysis of a placement (e.g., "python -m simulator what_if -d datasets/dataset1.json -a proposed_algorithm")
+    if len(sys.argv) > 1 and sys.argv[1] == "what_if":
+        parser = argparse.ArgumentParser(prog="python -m simulator what_if")
+        parser.add_argument("--seed", "-s", help="Seed value for EdgeSimPy", default="1")
+        parser.add_argument("--dataset", "-d", help="Dataset file")
+        parser.add_argument("--algorithm", "-a", help="Algorithm that computes the analyzed placement", default="proposed_algorithm")
+        parser.add_argument("--failures", "-f", help="Failed components (data_center and/or link)", default="data_center,link")
+        parser.add_argument("--failover", help="Failover of services on failed data centers (none or nearest)", default="nearest")
+        parser.add_argument("--output", "-o", help="CSV file that receives the metrics of each failure scenario", default=None)
+
+        args = parser.parse_args(sys.argv[2:])
+
+        what_if(
+            seed_value=int(args.seed),
+            algorithm=args.algorithm,
+            dataset=args.dataset,
+            parameters={},
+            failure_types=[failure_type.strip() for failure_type in args.failures.split(",") if failure_type.strip()],
+            failover=args.failover,
+            output_file=args.output,
+        )
+        sys.exit(0)
+
+    # Monte Carlo robustness of placements (e.g., "python -m simulator robustness -d datasets/dataset1.json -a best_fit,worst_fit")
+    if len(sys.argv) > 1 and sys.argv[1] == "robustness":
+        parser = argparse.ArgumentParser(prog="python -m simulator robustness")
+        parser.add_argument("--seed", "-s", help="Seed value for EdgeSimPy", default="1")
+        parser.add_argument("--dataset", "-d", help="Dataset file")
+        parser.add_argument("--algorithms", "-a", help="Compared algorithms (comma-separated)", default="proposed_algorithm")
+        parser.add_argument("--samples", "-n", help="Number of Monte Carlo samples", default="1000")
+        parser.add_argument("--delay_noise", help="Coefficient of variation of link delays", default="0.2")
+        parser.add_argument("--demand_noise", help="Coefficient of variation of service demands", default="0.1")
+        parser.add_argument("--distribution", help="Distribution of the noise (lognormal or normal)", default="lognormal")
+        parser.add_argument("--percentiles", "-p", help="Percentiles reported (comma-separated)", default="5,50,95,99")
+        parser.add_argument("--output", "-o", help="CSV file that receives the results of each placement", default=None)
+
+        args = parser.parse_args(sys.argv[2:])
+
+        robustness(
+            seed_value=int(args.seed),
+            algorithms=[algorithm.strip() for algorithm in args.algorithms.split(",") if algorithm.strip()],
+            dataset=args.dataset,
+            parameters={},
+            robustness_parameters={
+                "n_samples": int(args.samples),
+                "delay_noise": float(args.delay_noise),
+                "demand_noise": float(args.demand_noise),
+                "distribution": args.distribution,
+                "percentiles": [float(percentile) for percentile in args.percentiles.split(",")],
+                "seed_value": int(args.seed),
+            },
+            output_file=args.output,
+        )
+        sys.exit(0)
+
     # Parsing named arguments from the command line
     parser = argparse.ArgumentParser()
 
@@ -72,12 +373,40 @@ if __name__ == "__main__":
     parser.add_argument("--seed", "-s", help="Seed value for EdgeSimPy", default="1")
     parser.add_argument("--dataset", "-d", help="Dataset file")
     parser.add_argument("--algorithm", "-a", help="Algorithm that will be executed")
+    parser.add_argument("--time_budget", "-t", help="Wall-clock budget (in seconds) of the placement job", default=None)
+    parser.add_argument("--result_store", help="Directory of the content-addressed result store", default=None)
+    parser.add_argument("--instrumentation", "-i", help="Dumps hot path call counters with the results", action="store_true")
 
     # NSGA-II arguments
     parser.add_argument("--pop_size", "-p", help="Population size", default="0")
     parser.add_argument("--n_gen", "-g", help="Number of generations", default="0")
     parser.add_argument("--cross_prob", "-c", help="Crossover probability (0.0 to 1.0)", default="1")
     parser.add_argument("--mut_prob", "-m", help="Mutation probability (0.0 to 1.0)", default="0")
+    parser.add_argument("--backend", help="NSGA-II implementation (pymoo or numpy)", default="pymoo")
+    parser.add_argument("--fitness_cache_size", help="Memory bound (in MB) of the NSGA-II fitness cache (0 disables it)", default="0")
+    parser.add_argument("--warm_start", help="Fraction of the NSGA-II population seeded with heuristics (0.0 to 1.0)", default="0")
+    parser.add_argument("--target_quality", help="NSGA-II quality target (sum of normalized objectives)", default=None)
+    parser.add_argument("--constraint", help="NSGA-II capacity constraint (count, overload or per_data_center)", default="count")
+    parser.add_argument("--stagnation_window", help="Generations without improving the best feasible solution (NSGA-II)", default="0")
+    parser.add_argument("--hv_window", help="Sliding window (in generations) of the hypervolume stagnation criterion", default="0")
+    parser.add_argument("--hv_tol", help="Relative hypervolume improvement below which NSGA-II stops", default="0.001")
+    parser.add_argument("--archive_dir", help="Directory where every chromosome evaluated by NSGA-II is archived", default=None)
+
+    # Local search arguments
+    parser.add_argument("--local_search", "-l", help="Local search run after the algorithm (tabu or annealing)", default=None)
+    parser.add_argument("--local_search_time", help="Time budget (in seconds) of the local search", default="10")
+
+    # Island-model NSGA-II arguments
+    parser.add_argument("--n_islands", help="Number of islands (island_nsgaii)", default="0")
+    parser.add_argument("--migration_interval", help="Generations between migrations (island_nsgaii)", default="0")
+    parser.add_argument("--n_migrants", help="Number of elite chromosomes sent in each migration (island_nsgaii)", default="0")
+    parser.add_argument("--migration_dir", help="Shared directory used to exchange migrants (island_nsgaii)", default=None)
+
+    # Portfolio arguments
+    parser.add_argument("--heuristics", help="Comma-separated heuristics run by the portfolio", default=None)
+    parser.add_argument("--restarts", help="Number of randomized restarts (portfolio)", default="0")
+    parser.add_argument("--objectives", help="Comma-separated metrics compared in order to pick the best placement", default=None)
+    parser.add_argument("--processes", help="Number of worker processes (portfolio)", default="0")
 
     args = parser.parse_args()
 
@@ -88,4 +417,51 @@ if __name__ == "__main__":
         "mut_prob": float(args.mut_prob),
     }
 
-    main(seed_value=int(args.seed), algorithm=args.algorithm, dataset=args.dataset, parameters=parameters)
+    # Optional parameters are only included when set, keeping the output file names of regular runs unchanged
+    if args.time_budget is not None:
+        parameters["time_budget"] = float(args.time_budget)
+    if args.backend != "pymoo":
+        parameters["backend"] = args.backend
+    if float(args.fitness_cache_size) > 0:
+        parameters["fitness_cache_size"] = float(args.fitness_cache_size)
+    if float(args.warm_start) > 0:
+        parameters["warm_start"] = float(args.warm_start)
+    if args.target_quality is not None:
+        parameters["target_quality"] = float(args.target_quality)
+    if args.constraint != "count":
+        parameters["constraint"] = args.constraint
+    if int(args.stagnation_window) > 0:
+        parameters["stagnation_window"] = int(args.stagnation_window)
+    if int(args.hv_window) > 0:
+        parameters["hv_window"] = int(args.hv_window)
+        parameters["hv_tol"] = float(args.hv_tol)
+    if args.local_search:
+        parameters["local_search"] = args.local_search
+        parameters["local_search_time"] = float(args.local_search_time)
+    if args.archive_dir:
+        parameters["archive_dir"] = args.archive_dir
+    if int(args.n_islands) > 0:
+        parameters["n_islands"] = int(args.n_islands)
+    if int(args.migration_interval) > 0:
+        parameters["migration_interval"] = int(args.migration_interval)
+    if int(args.n_migrants) > 0:
+        parameters["n_migrants"] = int(args.n_migrants)
+    if args.migration_dir:
+        parameters["migration_dir"] = args.migration_dir
+    if args.heuristics:
+        parameters["heuristics"] = args.heuristics
+    if int(args.restarts) > 0:
+        parameters["restarts"] = int(args.restarts)
+    if args.objectives:
+        parameters["objectives"] = args.objectives
+    if int(args.processes) > 0:
+        parameters["processes"] = int(args.processes)
+
+    main(
+        seed_value=int(args.seed),
+        algorithm=args.algorithm,
+        dataset=args.dataset,
+        parameters=parameters,
+        instrumentation=args.instrumentation,
+        result_store=args.result_store,
+    )
@@ -0,0 +1,176 @@
+"""Contains an append-only archive of evaluated chromosomes that can be read back through memory-mapped files.
+
+An archive is a directory with the following files:
+    - metadata.json: data types and number of columns of each array.
+    - X.bin, F.bin, G.bin: raw rows of chromosomes, objective values and constraint values.
+    - index.bin: pairs of int64 values (generation, number of rows archived up to the end of that append).
+"""
+# Python libraries
+import numpy as np
+import json
+import os
+
+
+class ChromosomeArchive:
+    """Appends evaluated chromosomes and their objective and constraint values to a set of binary files."""
+
+    def __init__(self, directory: str, n_data_centers: int, buffer_size: int = 8 * 1024 * 1024) -> object:
+        """Creates a ChromosomeArchive object.
+
+        Args:
+            directory (str): Directory where the archive files are stored (must not contain a previous archive).
+            n_data_centers (int): Number of data centers (used to pick the narrowest integer type able to store the genes).
+            buffer_size (int, optional): Size (in bytes) of the write buffer of each file. Defaults to 8 MB.
+
+        Returns:
+            object: Created ChromosomeArchive object.
+        """
+        if os.path.exists(f"{directory}/metadata.json"):
+            raise Exception(f"Directory '{directory}' already contains an archive.")
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.buffer_size = buffer_size
+        self.x_dtype = np.min_scalar_type(n_data_centers)
+
+        # Number of rows archived so far
+        self.rows = 0
+
+        # Files are only opened on the first append, once the number of columns of each array is known
+        self.files = None
+
+    def append(self, generation: int, X: object, F: object, G: object):
+        """Appends a batch of evaluated chromosomes to the archive.
+
+        Args:
+            generation (int): Generation in which the chromosomes were evaluated.
+            X (object): Chromosomes.
+            F (object): Objective values.
+            G (object): Constraint values.
+        """
+        X = np.asarray(X).astype(self.x_dtype)
+        F = np.asarray(F, dtype=np.float64).reshape(len(X), -1)
+        G = np.asarray(G, dtype=np.float64).reshape(len(X), -1)
+
+        if self.files is None:
+            self.open(n_var=X.shape[1], n_obj=F.shape[1], n_constr=G.shape[1])
+
+        self.files["X"].write(X.tobytes())
+        self.files["F"].write(F.tobytes())
+        self.files["G"].write(G.tobytes())
+
+        self.rows += len(X)
+        self.files["index"].write(np.array([generation, self.rows], dtype=np.int64).tobytes())
+
+    def open(self, n_var: int, n_obj: int, n_constr: int):
+        """Creates the archive files.
+
+        Args:
+            n_var (int): Number of genes of each chromosome.
+            n_obj (int): Number of objectives.
+            n_constr (int): Number of constraints.
+        """
+        metadata = {
+            "x_dtype": np.dtype(self.x_dtype).str,
+            "n_var": n_var,
+            "n_obj": n_obj,
+            "n_constr": n_constr,
+        }
+        with open(f"{self.directory}/metadata.json", "w", encoding="UTF-8") as file:
+            json.dump(metadata, file, indent=4)
+
+        self.files = {
+            name: open(f"{self.directory}/{name}.bin", "wb", buffering=self.buffer_size) for name in ["X", "F", "G", "index"]
+        }
+
+    def flush(self):
+        """Flushes the write buffers to disk."""
+        if self.files is not None:
+            for file in self.files.values():
+                file.flush()
+
+    def close(self):
+        """Flushes and closes the archive files."""
+        if self.files is not None:
+            for file in self.files.values():
+                file.close()
+            self.files = None
+
+
+class ArchiveReader:
+    """Reads an archive through memory-mapped files, so that slicing a generation does not load the whole archive."""
+
+    def __init__(self, directory: str) -> object:
+        """Creates an ArchiveReader object.
+
+        Args:
+            directory (str): Directory where the archive files are stored.
+
+        Returns:
+            object: Created ArchiveReader object.
+        """
+        with open(f"{directory}/metadata.json", "r", encoding="UTF-8") as file:
+            metadata = json.load(file)
+
+        self.directory = directory
+
+        # Only complete appends (i.e., those registered in the index) are visible to the reader
+        index = np.fromfile(f"{directory}/index.bin", dtype=np.int64).reshape(-1, 2)
+        self.rows = int(index[-1, 1]) if len(index) > 0 else 0
+
+        self.X = self.map(name="X", dtype=np.dtype(metadata["x_dtype"]), columns=metadata["n_var"])
+        self.F = self.map(name="F", dtype=np.float64, columns=metadata["n_obj"])
+        self.G = self.map(name="G", dtype=np.float64, columns=metadata["n_constr"])
+
+        # Row ranges of each generation (a generation may span several appends)
+        self.generation_ranges = {}
+        start = 0
+        for generation, end in index.tolist():
+            first_row = self.generation_ranges.get(generation, (start, end))[0]
+            self.generation_ranges[generation] = (first_row, end)
+            start = end
+
+    def map(self, name: str, dtype: object, columns: int) -> object:
+        """Maps one of the archive files into memory.
+
+        Args:
+            name (str): Array name.
+            dtype (object): Data type of the array.
+            columns (int): Number of columns of the array.
+
+        Returns:
+            array (object): Memory-mapped array.
+        """
+        if self.rows == 0:
+            return np.empty((0, columns), dtype=dtype)
+
+        return np.memmap(f"{self.directory}/{name}.bin", dtype=dtype, mode="r", shape=(self.rows, columns))
+
+    def __len__(self) -> int:
+        """Returns the number of chromosomes archived.
+
+        Returns:
+            int: Number of chromosomes archived.
+        """
+        return self.rows
+
+    def generations(self) -> list:
+        """Returns the generations stored in the archive.
+
+        Returns:
+            list: Generations stored in the archive.
+        """
+        return sorted(self.generation_ranges.keys())
+
+    def generation(self, generation: int) -> tuple:
+        """Returns the chromosomes evaluated in a given generation.
+
+        Args:
+            generation (int): Generation number.
+
+        Returns:
+            tuple: Memory-mapped slices of the chromosomes, objective values and constraint values of the generation.
+        """
+        start, end = self.generation_ranges[generation]
+        return self.X[start:end], self.F[start:end], self.G[start:end]
@@ -55,6 +55,17 @@ class NetworkLink(dict, ComponentManager):
         """
         self[attribute_name] = attribute_value
 
+    def __setitem__(self, key: str, value: object):
+        """Overrides the value of a link property, discarding cached delays of the topology when the link delay changes.
+        Args:
+            key (str): Name of the property to be changed.
+            value (object): Value for the property.
+        """
+        dict.__setitem__(self, key, value)
+
+        if key == "delay" and self.get("topology") is not None:
+            self["topology"].invalidate_delay_caches()
+
     def __delattr__(self, attribute_name: str):
         """Deletes an object attribute by its name.
         Args:
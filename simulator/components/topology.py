@@ -3,6 +3,7 @@
 from simulator.component_manager import ComponentManager
 
 # Python libraries
+from bisect import bisect_right
 import networkx as nx
 
 
@@ -23,6 +24,18 @@ class Topology(ComponentManager, nx.Graph):
         # Calling NetworkX's constructor
         nx.Graph.__init__(self)
 
+        # Cache of delays between regions (origin region -> {target region: delay})
+        self.region_delays = {}
+
+        # Cache of delays of communication chains (sequence of regions -> delay) and its statistics
+        self.chain_delays = {}
+        self.chain_delay_hits = 0
+        self.chain_delay_misses = 0
+
+        # Index of data centers sorted by their delay from each origin region, and its slices for each delay SLA
+        self.data_centers_by_delay = {}
+        self.reachability_index = {}
+
     def calculate_path_delay(self, path: list) -> int:
         """Calculates the communication delay of a network path.
         Args:
@@ -36,3 +49,93 @@ class Topology(ComponentManager, nx.Graph):
         path_delay = nx.classes.function.path_weight(G=self, path=path, weight="delay")
 
         return path_delay
+
+    def calculate_region_delay(self, origin_region: object, target_region: object) -> int:
+        """Calculates the delay of the shortest path between two regions. Delays from a given origin to every other region are
+        computed at once (using Dijkstra's algorithm) and cached until the delay of a network link changes.
+        Args:
+            origin_region (object): Origin region.
+            target_region (object): Target region.
+        Returns:
+            delay (int): Delay between the origin and target regions.
+        """
+        if origin_region not in self.region_delays:
+            self.region_delays[origin_region] = nx.single_source_dijkstra_path_length(G=self, source=origin_region, weight="delay")
+
+        delay = self.region_delays[origin_region][target_region]
+
+        return delay
+
+    def calculate_chain_delay(self, chain: tuple) -> int:
+        """Calculates the delay of a communication chain (i.e., the sum of the delays between each pair of consecutive regions).
+        Args:
+            chain (tuple): Sequence of regions that compose the communication chain.
+        Returns:
+            delay (int): Communication chain delay.
+        """
+        delay = self.chain_delays.get(chain)
+
+        if delay is None:
+            self.chain_delay_misses += 1
+
+            delay = 0
+            for i in range(len(chain) - 1):
+                if chain[i] != chain[i + 1]:
+                    delay += self.calculate_region_delay(origin_region=chain[i], target_region=chain[i + 1])
+
+            self.chain_delays[chain] = delay
+        else:
+            self.chain_delay_hits += 1
+
+        return delay
+
+    def get_reachable_data_centers(self, origin_region: object, delay_sla: int) -> list:
+        """Gets the data centers located in regions whose delay from a given origin region is within a delay SLA.
+        Args:
+            origin_region (object): Origin region.
+            delay_sla (int): Delay SLA.
+        Returns:
+            data_centers (list): Data centers within reach, sorted by their delay from the origin region.
+        """
+        key = (origin_region, delay_sla)
+
+        if key not in self.reachability_index:
+            if origin_region not in self.data_centers_by_delay:
+                # Making sure the delays from the origin region to every reachable region are cached
+                self.calculate_region_delay(origin_region=origin_region, target_region=origin_region)
+
+                data_centers = []
+                for region, delay in self.region_delays[origin_region].items():
+                    data_centers.extend((delay, data_center.id, data_center) for data_center in region.data_centers)
+
+                data_centers.sort(key=lambda item: (item[0], item[1]))
+                self.data_centers_by_delay[origin_region] = ([item[0] for item in data_centers], [item[2] for item in data_centers])
+
+            delays, data_centers = self.data_centers_by_delay[origin_region]
+            self.reachability_index[key] = data_centers[: bisect_right(delays, delay_sla)]
+
+        return self.reachability_index[key]
+
+    def chain_delay_statistics(self) -> dict:
+        """Summarizes the usage of the communication chain delay cache.
+        Returns:
+            dict: Cache statistics.
+        """
+        lookups = self.chain_delay_hits + self.chain_delay_misses
+
+        return {
+            "hits": self.chain_delay_hits,
+            "misses": self.chain_delay_misses,
+            "hit_rate": self.chain_delay_hits / lookups if lookups > 0 else 0,
+            "entries": len(self.chain_delays),
+        }
+
+    def invalidate_delay_caches(self):
+        """Discards cached paths and delays. Must be called whenever the delay of a network link changes."""
+        self.region_delays = {}
+        self.chain_delays = {}
+        self.data_centers_by_delay = {}
+        self.reachability_index = {}
+
+        if hasattr(self, "delay_shortest_paths"):
+            self.delay_shortest_paths = {}
@@ -39,6 +39,9 @@ class User(ComponentManager):
         # User's communication path (list of links used to communicate the user to the services that compose his application)
         self.communication_path = []
 
+        # Sequence of regions that compose the user's communication chain (None when the path is user-specified)
+        self.communication_chain = None
+
         # User's coordinates
         self.coordinates = 0
 
@@ -78,6 +81,11 @@ class User(ComponentManager):
         # Resetting the user delay
         self.delay = 0
 
+        # Communication chains derived from the placement have their delays cached by the topology
+        if self.communication_chain is not None:
+            self.delay = topology.calculate_chain_delay(chain=self.communication_chain)
+            return self.delay
+
         # Adding the communication path delay to the application's delay
         for path in self.communication_path:
             self.delay += topology.calculate_path_delay(path=[Region.find_by_id(i) for i in path])
@@ -98,11 +106,13 @@ class User(ComponentManager):
         # Defining communication path
         if len(communication_path) > 0:
             self.communication_path = communication_path
+            self.communication_chain = None
         else:
             self.communication_path = []
 
             service_hosts_regions = [service.data_center.region for service in self.application.services if service.data_center]
             communication_chain = [self.region] + service_hosts_regions
+            self.communication_chain = tuple(communication_chain)
 
             # Defining a set of links to connect the items in the application's service chain
             for i in range(len(communication_chain) - 1):
@@ -2,20 +2,30 @@
 # Simulator components
 from simulator.components.topology import Topology
 from simulator.components.data_center import DataCenter
+from simulator.components.region import Region
 from simulator.components.user import User
+from simulator.components.application import Application
 from simulator.components.service import Service
 
 # Python libraries
 import networkx as nx
 
+# Values derived from the scenario's structure that do not change during a run (built by "compute_scenario_invariants")
+SCENARIO_INVARIANTS = {"fingerprint": None}
 
-def provision_service(user: object, service: object, data_center: object):
+# Users grouped by region, delay SLA and sequence of regions that host their applications (see "group_equivalent_users").
+# Users whose region or placement changed are listed as outdated and only they are regrouped the next time classes are read.
+USER_CLASSES = {"fingerprint": None, "classes": {}, "keys": {}, "outdated": set()}
+
+
+def provision_service(user: object, service: object, data_center: object, update_communication_path: bool = True):
     """Provisions a service on a data center.
 
     Args:
         user (object): User that accesses the application.
         service (object): Service to be provisioned.
         data_center (object): Data center that will host the service.
+        update_communication_path (bool, optional): Whether the user's communication path is updated. Defaults to True.
     """
     # Updating the data center's resource usage
     data_center.demand += service.demand
@@ -23,8 +33,49 @@ def provision_service(user: object, service: object, data_center: object):
     # Creating relationship between the host and the registry
     service.data_center = data_center
     data_center.services.append(service)
+    USER_CLASSES["outdated"].add(service.application.user)
+
+    if update_communication_path:
+        user.set_communication_path()
+
+
+def deprovision_service(service: object):
+    """Removes a service from the data center that hosts it.
+
+    Args:
+        service (object): Service to be deprovisioned.
+    """
+    data_center = service.data_center
+
+    # Updating the data center's resource usage
+    data_center.demand -= service.demand
+
+    # Removing the relationship between the host and the service
+    data_center.services.remove(service)
+    service.data_center = None
+    USER_CLASSES["outdated"].add(service.application.user)
 
-    user.set_communication_path()
+
+def move_user(user: object, region: object):
+    """Moves a user to another region, updating its equivalence class and the delay of its application.
+
+    Args:
+        user (object): User that is moving.
+        region (object): Region the user is moving to.
+    """
+    previous_region = user.region
+    if previous_region == region:
+        return
+
+    if user in previous_region.users:
+        previous_region.users.remove(user)
+    region.users.append(user)
+    user.region = region
+    USER_CLASSES["outdated"].add(user)
+
+    # Updating the user's delay if its application is already placed
+    if any(service.data_center for service in user.application.services):
+        user.set_communication_path()
 
 
 def apply_placement(solution: list):
@@ -37,7 +88,173 @@ def apply_placement(solution: list):
         service = Service.find_by_id(service_id)
         data_center = DataCenter.find_by_id(data_center_id)
 
-        provision_service(user=service.application.user, service=service, data_center=data_center)
+        provision_service(user=service.application.user, service=service, data_center=data_center, update_communication_path=False)
+
+    # Defining the communication paths only once all services are provisioned
+    set_communication_paths()
+
+
+def get_scenario_fingerprint() -> tuple:
+    """Gets a lightweight fingerprint of the scenario's structure, which changes whenever components are created or removed
+    (or the scenario is reloaded).
+
+    Returns:
+        fingerprint (tuple): Identity and size of the lists of instances of each component class.
+    """
+    component_classes = [Region, DataCenter, User, Application, Service]
+    fingerprint = tuple((id(component_class.all()), component_class.count()) for component_class in component_classes)
+    return fingerprint
+
+
+def compute_scenario_invariants() -> dict:
+    """Computes values that only depend on the scenario's structure (e.g., normalization constants and allocation cost vectors),
+    so that evaluators and strategies do not need to re-derive them for every placement.
+
+    Returns:
+        invariants (dict): Scenario invariants.
+    """
+    labels = sorted({service.label for service in Service.all()})
+
+    # Allocation costs of each type of service (one entry per data center, following the order of "DataCenter.all()")
+    allocation_costs = {label: [data_center.allocation_cost[label] for data_center in DataCenter.all()] for label in labels}
+
+    SCENARIO_INVARIANTS.clear()
+    SCENARIO_INVARIANTS.update(
+        {
+            "fingerprint": get_scenario_fingerprint(),
+            "users": User.count(),
+            "services": Service.count(),
+            "data_centers": DataCenter.count(),
+            "labels": labels,
+            "allocation_costs": allocation_costs,
+            "min_allocation_cost": {label: min(costs) for label, costs in allocation_costs.items()},
+            "max_allocation_cost": {label: max(costs) for label, costs in allocation_costs.items()},
+            "overall_capacity": sum(data_center.capacity for data_center in DataCenter.all()),
+            "overall_demand": sum(service.demand for service in Service.all()),
+            "max_allocation_cost_possible": sum([max(dc.allocation_cost.values()) * dc.capacity for dc in DataCenter.all()]),
+        }
+    )
+
+    return SCENARIO_INVARIANTS
+
+
+def get_scenario_invariants() -> dict:
+    """Gets the scenario invariants, recomputing them only if the scenario's structure has changed since they were computed.
+
+    Returns:
+        invariants (dict): Scenario invariants.
+    """
+    if SCENARIO_INVARIANTS["fingerprint"] != get_scenario_fingerprint():
+        compute_scenario_invariants()
+
+    return SCENARIO_INVARIANTS
+
+
+def invalidate_scenario_invariants():
+    """Discards the scenario invariants. Must be called after changing attributes that they depend on (e.g., data center
+    capacities or allocation costs) without creating or removing components."""
+    SCENARIO_INVARIANTS.clear()
+    SCENARIO_INVARIANTS["fingerprint"] = None
+
+
+def group_equivalent_users() -> list:
+    """Groups users that share the same region, delay SLA and sequence of regions that host their applications' services into
+    equivalence classes. Users within a class follow the same communication chain, so their delays and paths are computed once
+    per class. Only the users whose region or placement changed since the classes were last read are regrouped.
+
+    Returns:
+        user_classes (list): List of user classes, each one with the shared region, delay SLA, chain, delay, and member users.
+    """
+    # Regrouping every user when the scenario is loaded or its structure changes
+    fingerprint = get_scenario_fingerprint()
+    if USER_CLASSES["fingerprint"] != fingerprint:
+        USER_CLASSES.update({"fingerprint": fingerprint, "classes": {}, "keys": {}, "outdated": set(User.all())})
+
+    classes = USER_CLASSES["classes"]
+    keys = USER_CLASSES["keys"]
+
+    for user in USER_CLASSES["outdated"]:
+        chain = get_delay_pattern(user=user)
+        key = (chain, user.delay_sla)
+
+        if keys.get(user) != key:
+            if user in keys:
+                previous_class = classes[keys[user]]
+                previous_class["users"].remove(user)
+                if len(previous_class["users"]) == 0:
+                    del classes[keys[user]]
+
+            if key not in classes:
+                classes[key] = {"region": user.region, "delay_sla": user.delay_sla, "chain": chain, "delay": None, "users": set()}
+            classes[key]["users"].add(user)
+            keys[user] = key
+
+        # Users take the delay of their class (classes created in this call get their delays when SLA violations are computed)
+        if classes[key]["delay"] is not None:
+            user.delay = classes[key]["delay"]
+
+    USER_CLASSES["outdated"] = set()
+
+    return list(classes.values())
+
+
+def get_delay_pattern(user: object) -> tuple:
+    """Gets the sequence of regions that compose the communication chain of a user and its application.
+
+    Args:
+        user (object): User whose communication chain is gathered.
+
+    Returns:
+        pattern (tuple): User's region followed by the regions that host its application's services.
+    """
+    pattern = (user.region,) + tuple(service.data_center.region for service in user.application.services if service.data_center)
+    return pattern
+
+
+def set_communication_paths():
+    """Updates the communication paths of all users. Paths are computed once for each distinct sequence of regions and
+    shared among the users of the classes that follow it."""
+    paths = {}
+
+    for user_class in group_equivalent_users():
+        users = iter(user_class["users"])
+
+        if user_class["chain"] not in paths:
+            representative = next(users)
+            representative.set_communication_path()
+            paths[user_class["chain"]] = (representative.communication_path, representative.delay)
+
+        communication_path, delay = paths[user_class["chain"]]
+        user_class["delay"] = delay
+        for user in users:
+            user.communication_path = [list(path) for path in communication_path]
+            user.communication_chain = user_class["chain"]
+            user.delay = delay
+
+
+def calculate_sla_violations() -> int:
+    """Calculates the number of SLA violations. The delay of each user class is computed once and weighted by the number of
+    users in the class, so only the users whose region or placement changed are visited.
+
+    Returns:
+        sla_violations (int): Number of users whose delay exceeds their delay SLA.
+    """
+    topology = Topology.first()
+    sla_violations = 0
+
+    for user_class in group_equivalent_users():
+        # Delays are read from the topology (which caches them until a link delay changes), and the members of the class are
+        # only updated when the delay of their class changes
+        delay = topology.calculate_chain_delay(chain=user_class["chain"])
+        if delay != user_class["delay"]:
+            user_class["delay"] = delay
+            for user in user_class["users"]:
+                user.delay = delay
+
+        if delay > user_class["delay_sla"]:
+            sla_violations += len(user_class["users"])
+
+    return sla_violations
 
 
 def reset_scenario():
@@ -53,6 +270,8 @@ def reset_scenario():
     for user in User.all():
         user.delay = float("inf")
         user.communication_path = []
+        user.communication_chain = None
+    USER_CLASSES["outdated"].update(User.all())
 
 
 def find_shortest_path(origin_region: object, target_region: object) -> int:
@@ -90,12 +309,26 @@ def calculate_path_delay(origin_region: object, target_region: object) -> int:
     """
     topology = Topology.first()
 
-    path = find_shortest_path(origin_region=origin_region, target_region=target_region)
-    delay = topology.calculate_path_delay(path=path)
+    delay = topology.calculate_region_delay(origin_region=origin_region, target_region=target_region)
 
     return delay
 
 
+def get_reachable_data_centers(origin_region: object, delay_sla: int) -> list:
+    """Gets the data centers that can be reached from a region without exceeding a delay SLA.
+    Args:
+        origin_region (object): Origin region.
+        delay_sla (int): Delay SLA.
+    Returns:
+        data_centers (list): Data centers within reach, sorted by their delay from the origin region.
+    """
+    topology = Topology.first()
+
+    data_centers = topology.get_reachable_data_centers(origin_region=origin_region, delay_sla=delay_sla)
+
+    return data_centers
+
+
 def calculate_metrics():
     # Declaring the variables that will accommodate the placement metrics
     sla_violations = 0
@@ -103,10 +336,7 @@ def calculate_metrics():
     overloaded_data_centers = 0
 
     # Calculating the number of SLA violations
-    for user in User.all():
-        user._compute_delay()
-        if user.delay > user.delay_sla:
-            sla_violations += 1
+    sla_violations = calculate_sla_violations()
 
     # Calculating the allocation cost
     for data_center in DataCenter.all():
@@ -127,17 +357,29 @@ def calculate_metrics():
     return metrics
 
 
+def calculate_data_center_overloads() -> list:
+    """Calculates by how much the demand of each data center exceeds its capacity.
+
+    Returns:
+        overloads (list): Overload of each data center (following the order of "DataCenter.all()").
+    """
+    overloads = [max(0, data_center.demand - data_center.capacity) for data_center in DataCenter.all()]
+    return overloads
+
+
 def evaluate_placement():
     """Evaluates a placement scheme based on the normalized number of SLA violations (delay) and allocation cost."""
     # Gathering placement metrics
     metrics = calculate_metrics()
 
+    # Gathering the normalization constants of the scenario
+    invariants = get_scenario_invariants()
+
     # Gathering a normalized number of SLA violations
-    sla_violations = metrics["sla_violations"] / User.count() * 100
+    sla_violations = metrics["sla_violations"] / invariants["users"] * 100
 
     # Gathering a normalized allocation cost
-    max_allocation_cost_possible = sum([max(dc.allocation_cost.values()) * dc.capacity for dc in DataCenter.all()])
-    overall_allocation_cost = metrics["overall_allocation_cost"] / max_allocation_cost_possible * 100
+    overall_allocation_cost = metrics["overall_allocation_cost"] / invariants["max_allocation_cost_possible"] * 100
 
     # Gathering the number of overloaded data centers
     overloaded_data_centers = metrics["overloaded_data_centers"]
@@ -0,0 +1,242 @@
+"""Contains a switchable registry that counts calls and accumulates the time spent in hot paths and reports cache statistics.
+
+Hot paths are instrumented by replacing functions and methods with counting wrappers when the registry is enabled and restoring
+the originals when it is disabled, so disabled instrumentation adds no overhead at all. As modules often import helper methods
+with "from ... import *", every module of the simulator holding a reference to an instrumented function is patched as well.
+
+Times are inclusive (e.g., the time spent in "set_communication_path" includes the Dijkstra runs it triggers).
+
+Example:
+    instrumentation.enable()
+    simulator.run()
+    print(instrumentation.snapshot())
+    instrumentation.disable()
+"""
+# Python libraries
+from time import perf_counter
+import json
+import sys
+
+# Flag that tells whether the instrumentation is enabled
+ENABLED = False
+
+# Call counters (hot path name -> [number of calls, accumulated time in seconds])
+COUNTERS = {}
+
+# Hot paths that can be instrumented (name -> (module or class that owns the attribute, attribute name))
+HOT_PATHS = {}
+
+# Functions that summarize the usage of caches (name -> function returning a dictionary of statistics)
+CACHES = {}
+
+# Original functions replaced by wrappers while the instrumentation is enabled (name -> list of (owner, attribute, original))
+PATCHES = {}
+
+
+def register_hot_path(name: str, owner: object, attribute: str):
+    """Registers a function or method whose calls will be counted and timed while the instrumentation is enabled.
+
+    Args:
+        name (str): Name under which the hot path is reported.
+        owner (object): Module or class that holds the function or method.
+        attribute (str): Name of the function or method.
+    """
+    HOT_PATHS[name] = (owner, attribute)
+
+    if ENABLED and name not in PATCHES:
+        patch(name=name)
+
+
+def register_cache(name: str, statistics: object):
+    """Registers a cache whose statistics are reported by the instrumentation.
+
+    Args:
+        name (str): Name under which the cache is reported.
+        statistics (object): Function that returns a dictionary with the cache statistics.
+    """
+    CACHES[name] = statistics
+
+
+def register_default_hot_paths():
+    """Registers the hot paths and caches of the simulator."""
+    # Modules are imported here to avoid circular imports, as components and helper methods are loaded after this module
+    from simulator.component_manager import ComponentManager
+    from simulator.components.topology import Topology
+    from simulator.components.user import User
+    import simulator.helper_methods as helper_methods
+    import networkx as nx
+
+    register_hot_path(name="dijkstra_single_source", owner=nx, attribute="single_source_dijkstra_path_length")
+    register_hot_path(name="dijkstra_shortest_path", owner=nx, attribute="shortest_path")
+    register_hot_path(name="find_by_id", owner=ComponentManager, attribute="find_by_id")
+    register_hot_path(name="calculate_path_delay", owner=helper_methods, attribute="calculate_path_delay")
+    register_hot_path(name="find_shortest_path", owner=helper_methods, attribute="find_shortest_path")
+    register_hot_path(name="reset_scenario", owner=helper_methods, attribute="reset_scenario")
+    register_hot_path(name="apply_placement", owner=helper_methods, attribute="apply_placement")
+    register_hot_path(name="calculate_metrics", owner=helper_methods, attribute="calculate_metrics")
+    register_hot_path(name="Topology.calculate_path_delay", owner=Topology, attribute="calculate_path_delay")
+    register_hot_path(name="Topology.calculate_region_delay", owner=Topology, attribute="calculate_region_delay")
+    register_hot_path(name="Topology.calculate_chain_delay", owner=Topology, attribute="calculate_chain_delay")
+    register_hot_path(name="User.set_communication_path", owner=User, attribute="set_communication_path")
+
+    register_cache(name="chain_delays", statistics=chain_delay_statistics)
+    register_cache(name="delay_shortest_paths", statistics=delay_shortest_paths_statistics)
+
+
+def chain_delay_statistics() -> dict:
+    """Summarizes the usage of the topology's communication chain delay cache.
+
+    Returns:
+        dict: Cache statistics.
+    """
+    from simulator.components.topology import Topology
+
+    topology = Topology.first()
+    return topology.chain_delay_statistics() if topology is not None else {}
+
+
+def delay_shortest_paths_statistics() -> dict:
+    """Summarizes the usage of the topology's shortest path cache (filled by "find_shortest_path"). As an entry is created on
+    each miss, misses are given by the number of entries and hits by the remaining calls counted by the instrumentation.
+
+    Returns:
+        dict: Cache statistics.
+    """
+    from simulator.components.topology import Topology
+
+    topology = Topology.first()
+    entries = len(getattr(topology, "delay_shortest_paths", {})) if topology is not None else 0
+    lookups = COUNTERS.get("find_shortest_path", [0, 0])[0]
+    hits = max(lookups - entries, 0)
+
+    return {"lookups": lookups, "hits": hits, "hit_rate": hits / lookups if lookups > 0 else 0, "entries": entries}
+
+
+def count_calls(name: str, function: object) -> object:
+    """Wraps a function with a counter of calls and accumulated time.
+
+    Args:
+        name (str): Name under which the calls are counted.
+        function (object): Function to be wrapped.
+
+    Returns:
+        wrapper (object): Wrapped function.
+    """
+    counter = COUNTERS.setdefault(name, [0, 0.0])
+
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            counter[0] += 1
+            counter[1] += perf_counter() - start
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = getattr(function, "__name__", name)
+    wrapper.__doc__ = getattr(function, "__doc__", None)
+
+    return wrapper
+
+
+def patch(name: str):
+    """Replaces a hot path with a counting wrapper in its owner and in every simulator module (including the entry point) that
+    references it.
+
+    Args:
+        name (str): Hot path name.
+    """
+    owner, attribute = HOT_PATHS[name]
+    original = owner.__dict__[attribute] if isinstance(owner, type) else getattr(owner, attribute)
+
+    # Class and static methods are unwrapped before counting their calls and wrapped again afterwards
+    if isinstance(original, (classmethod, staticmethod)):
+        replacement = type(original)(count_calls(name=name, function=original.__func__))
+    else:
+        replacement = count_calls(name=name, function=original)
+
+    patches = [(owner, attribute, original)]
+    setattr(owner, attribute, replacement)
+
+    # Entry points run as "__main__" (e.g., "python -m simulator") hold their own references to the hot paths too
+    if not isinstance(owner, type):
+        for module_name, module in list(sys.modules.items()):
+            if not (module_name.startswith("simulator") or module_name == "__main__"):
+                continue
+            if module is not None and module.__dict__.get(attribute) is original:
+                patches.append((module, attribute, original))
+                setattr(module, attribute, replacement)
+
+    PATCHES[name] = patches
+
+
+def is_enabled() -> bool:
+    """Checks whether the instrumentation is enabled.
+
+    Returns:
+        bool: Whether the instrumentation is enabled.
+    """
+    return ENABLED
+
+
+def enable():
+    """Enables the instrumentation, replacing the registered hot paths with counting wrappers."""
+    global ENABLED
+
+    if ENABLED:
+        return
+
+    if len(HOT_PATHS) == 0:
+        register_default_hot_paths()
+
+    ENABLED = True
+    for name in HOT_PATHS:
+        patch(name=name)
+
+
+def disable():
+    """Disables the instrumentation, restoring the original hot paths (counters are kept until "reset" is called)."""
+    global ENABLED
+
+    for patches in PATCHES.values():
+        for owner, attribute, original in patches:
+            setattr(owner, attribute, original)
+
+    PATCHES.clear()
+    ENABLED = False
+
+
+def reset():
+    """Resets the call counters."""
+    for counter in COUNTERS.values():
+        counter[0] = 0
+        counter[1] = 0.0
+
+
+def snapshot() -> dict:
+    """Gathers the call counters and the statistics of the registered caches.
+
+    Returns:
+        dict: Number of calls and accumulated time (in seconds) of each hot path, and statistics of each cache.
+    """
+    return {
+        "calls": {name: {"calls": counter[0], "time": counter[1]} for name, counter in sorted(COUNTERS.items()) if counter[0] > 0},
+        "caches": {name: statistics() for name, statistics in CACHES.items()},
+    }
+
+
+def dump(output_file: str) -> dict:
+    """Writes a snapshot of the instrumentation to a JSON file.
+
+    Args:
+        output_file (str): Output file.
+
+    Returns:
+        data (dict): Snapshot written to the file.
+    """
+    data = snapshot()
+
+    with open(output_file, "w", encoding="UTF-8") as file:
+        json.dump(data, file, indent=4)
+
+    return data
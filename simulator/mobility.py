@@ -0,0 +1,312 @@
+"""Contains a time-stepped simulation in which users move between regions and their applications are re-placed incrementally.
+
+Mobility is driven either by a trace or by a random-walk model. Traces are CSV files (with "step", "user" and "region" columns)
+or JSONL files (one {"step": ..., "user": ..., "region": ...} object per line), where "user" and "region" are component IDs. In
+the random-walk model, each user moves to a neighboring region of the network topology with a given probability at every step.
+
+Only the users that moved (and the data centers affected by migrations) are re-evaluated at each step. Re-placement policies:
+    - "none": services stay where they are.
+    - "on_violation": applications of users that moved and had their delay SLA violated are re-placed.
+    - "always": applications of all users that moved are re-placed.
+
+Applications are re-placed one at a time by the strategy that computed the initial placement when it can place single
+applications ("proposed_algorithm", "best_fit" and "worst_fit"). Strategies that only place whole scenarios at once (NSGA-II
+variants, local search and the portfolio) re-place applications with the proposed heuristic.
+"""
+# Simulation components
+from simulator.components import *
+
+# Helper methods
+from simulator.helper_methods import *
+
+# Placement strategies (versions that provision a single application)
+from simulator.strategies.proposed_algorithm import provision_application as provision_application_proposed_algorithm
+from simulator.strategies.best_fit import provision_application as provision_application_best_fit
+from simulator.strategies.worst_fit import provision_application as provision_application_worst_fit
+
+# Python libraries
+from collections import defaultdict
+import random
+import json
+import time
+import csv
+
+# Columns of the per-step output
+OUTPUT_FIELDS = ["step", "moved_users", "migrated_services", "sla_violations", "overall_allocation_cost", "overloaded_data_centers"]
+
+# Strategies that re-place single applications (strategy name -> function that provisions an application)
+REPLACEMENT_STRATEGIES = {
+    "proposed_algorithm": provision_application_proposed_algorithm,
+    "best_fit": provision_application_best_fit,
+    "worst_fit": provision_application_worst_fit,
+}
+
+# Strategy that re-places applications when the strategy of the initial placement cannot place single applications
+DEFAULT_REPLACEMENT_STRATEGY = "proposed_algorithm"
+
+
+def read_mobility_trace(trace_file: str) -> dict:
+    """Reads a mobility trace.
+
+    Args:
+        trace_file (str): CSV or JSONL file with the trace.
+
+    Returns:
+        moves (dict): Moves of each step (lists of user ID and destination region ID pairs).
+    """
+    moves = defaultdict(list)
+
+    with open(trace_file, "r", encoding="UTF-8") as file:
+        if trace_file.endswith(".csv"):
+            entries = csv.DictReader(file)
+        else:
+            entries = (json.loads(line) for line in file if line.strip())
+
+        for entry in entries:
+            moves[int(entry["step"])].append((int(entry["user"]), int(entry["region"])))
+
+    return moves
+
+
+def validate_mobility_trace(trace: dict):
+    """Checks that every user and region referenced by a mobility trace exists in the scenario.
+
+    Args:
+        trace (dict): Moves of each step (see "read_mobility_trace").
+    """
+    unknown_users = sorted({user_id for moves in trace.values() for user_id, _ in moves if User.find_by_id(user_id) is None})
+    if unknown_users:
+        valid_ids = [user.id for user in User.all()]
+        raise Exception(f"Unknown user IDs in the mobility trace: {unknown_users}. Valid IDs: {valid_ids}.")
+
+    unknown_regions = sorted({region_id for moves in trace.values() for _, region_id in moves if Region.find_by_id(region_id) is None})
+    if unknown_regions:
+        valid_ids = [region.id for region in Region.all()]
+        raise Exception(f"Unknown region IDs in the mobility trace: {unknown_regions}. Valid IDs: {valid_ids}.")
+
+
+def random_walk(users: list, mobility_probability: float) -> list:
+    """Random-walk mobility model in which each user moves to a neighboring region with a given probability.
+
+    Args:
+        users (list): Users that may move.
+        mobility_probability (float): Probability of each user moving in a step.
+
+    Returns:
+        moves (list): Pairs of users and destination regions.
+    """
+    topology = Topology.first()
+
+    moves = []
+    for user in users:
+        if random.random() < mobility_probability:
+            neighbors = list(topology.neighbors(user.region))
+            if len(neighbors) > 0:
+                moves.append((user, random.choice(neighbors)))
+
+    return moves
+
+
+class MobilitySimulation:
+    """Keeps track of the metrics of the placement applied to the scenario as users move and their applications are re-placed."""
+
+    def __init__(self, replacement: str = "on_violation", algorithm: str = DEFAULT_REPLACEMENT_STRATEGY) -> object:
+        """Creates a MobilitySimulation object. The scenario must already have a placement applied (e.g., by a strategy).
+
+        Args:
+            replacement (str, optional): Re-placement policy ("none", "on_violation" or "always"). Defaults to "on_violation".
+            algorithm (str, optional): Strategy that computed the placement, which also re-places applications when it can place
+                single applications (see "REPLACEMENT_STRATEGIES"). Defaults to "proposed_algorithm".
+
+        Returns:
+            object: Created MobilitySimulation object.
+        """
+        if replacement not in ["none", "on_violation", "always"]:
+            raise Exception(f"Unknown re-placement policy: {replacement}.")
+
+        self.replacement = replacement
+        self.replacement_algorithm = algorithm if algorithm in REPLACEMENT_STRATEGIES else DEFAULT_REPLACEMENT_STRATEGY
+        self.step = 0
+
+        # Metrics of the current placement (updated incrementally from this point on)
+        metrics = calculate_metrics()
+        self.overall_allocation_cost = metrics["overall_allocation_cost"]
+        self.violating_users = {user for user in User.all() if user.delay > user.delay_sla}
+        self.overloaded_data_centers = {data_center for data_center in DataCenter.all() if data_center.demand > data_center.capacity}
+
+        # Execution statistics
+        self.moved_users = 0
+        self.migrated_services = 0
+
+    def metrics(self) -> dict:
+        """Gets the metrics of the current placement.
+
+        Returns:
+            dict: Placement metrics (same keys as "calculate_metrics").
+        """
+        return {
+            "sla_violations": len(self.violating_users),
+            "overall_allocation_cost": self.overall_allocation_cost,
+            "overloaded_data_centers": len(self.overloaded_data_centers),
+        }
+
+    def update_user(self, user: object):
+        """Re-evaluates whether a user has its delay SLA violated.
+
+        Args:
+            user (object): User whose delay changed.
+        """
+        if user.delay > user.delay_sla:
+            self.violating_users.add(user)
+        else:
+            self.violating_users.discard(user)
+
+    def update_data_center(self, data_center: object):
+        """Re-evaluates whether a data center is overloaded.
+
+        Args:
+            data_center (object): Data center whose demand changed.
+        """
+        if data_center.demand > data_center.capacity:
+            self.overloaded_data_centers.add(data_center)
+        else:
+            self.overloaded_data_centers.discard(data_center)
+
+    def replace_application(self, application: object) -> int:
+        """Re-places the services of an application, keeping the previous hosts of services that stay in the same place.
+
+        Args:
+            application (object): Application whose services will be re-placed.
+
+        Returns:
+            migrations (int): Number of services that changed hosts.
+        """
+        previous_hosts = {service: service.data_center for service in application.services}
+
+        # Services that were never provisioned have no host to release
+        for service in application.services:
+            if service.data_center is not None:
+                self.overall_allocation_cost -= service.data_center.allocation_cost[service.label] * service.demand
+                deprovision_service(service=service)
+
+        REPLACEMENT_STRATEGIES[self.replacement_algorithm](application=application)
+
+        # Services that could not be re-placed return to their previous hosts (if they had one)
+        for service in application.services:
+            if service.data_center is None and previous_hosts[service] is not None:
+                provision_service(
+                    user=application.user, service=service, data_center=previous_hosts[service], update_communication_path=False
+                )
+            if service.data_center is not None:
+                self.overall_allocation_cost += service.data_center.allocation_cost[service.label] * service.demand
+
+        application.user.set_communication_path()
+
+        affected_data_centers = set(previous_hosts.values()) | {service.data_center for service in application.services}
+        for data_center in affected_data_centers - {None}:
+            self.update_data_center(data_center=data_center)
+
+        migrations = sum(1 for service in application.services if service.data_center != previous_hosts[service])
+
+        return migrations
+
+    def run_step(self, moves: list) -> dict:
+        """Moves users and re-places their applications according to the re-placement policy.
+
+        Args:
+            moves (list): Pairs of users and destination regions.
+
+        Returns:
+            step_output (dict): Metrics of the placement at the end of the step.
+        """
+        self.step += 1
+
+        moved_users = []
+        for user, region in moves:
+            if user.region != region:
+                move_user(user=user, region=region)
+                self.update_user(user=user)
+                moved_users.append(user)
+
+        migrated_services = 0
+        if self.replacement != "none":
+            for user in moved_users:
+                if self.replacement == "always" or user in self.violating_users:
+                    migrated_services += self.replace_application(application=user.application)
+                    self.update_user(user=user)
+
+        self.moved_users += len(moved_users)
+        self.migrated_services += migrated_services
+
+        step_output = {"step": self.step, "moved_users": len(moved_users), "migrated_services": migrated_services, **self.metrics()}
+
+        return step_output
+
+
+def simulate_mobility(
+    n_steps: int,
+    trace_file: str = None,
+    mobility_probability: float = 0.05,
+    replacement: str = "on_violation",
+    algorithm: str = DEFAULT_REPLACEMENT_STRATEGY,
+    output_file: str = None,
+) -> dict:
+    """Runs a time-stepped simulation in which users move between regions. The scenario must already have a placement applied.
+
+    Args:
+        n_steps (int): Number of steps.
+        trace_file (str, optional): Mobility trace (users follow the random-walk model if not informed). Defaults to None.
+        mobility_probability (float, optional): Probability of each user moving in a step (random-walk model). Defaults to 0.05.
+        replacement (str, optional): Re-placement policy ("none", "on_violation" or "always"). Defaults to "on_violation".
+        algorithm (str, optional): Strategy that computed the placement (see "MobilitySimulation"). Defaults to "proposed_algorithm".
+        output_file (str, optional): CSV file that receives the metrics of each step. Defaults to None.
+
+    Returns:
+        summary (dict): Summary of the simulation (placement stability and final metrics).
+    """
+    trace = None
+    if trace_file:
+        trace = read_mobility_trace(trace_file=trace_file)
+        validate_mobility_trace(trace=trace)
+
+    simulation = MobilitySimulation(replacement=replacement, algorithm=algorithm)
+    if replacement != "none":
+        print(f"Applications are re-placed with {simulation.replacement_algorithm}")
+
+    output = open(output_file, "w", newline="", encoding="UTF-8") if output_file else None
+    writer = csv.DictWriter(output, fieldnames=OUTPUT_FIELDS) if output else None
+    if writer is not None:
+        writer.writeheader()
+
+    start_time = time.time()
+    sla_violations = 0
+
+    try:
+        for _ in range(n_steps):
+            if trace is not None:
+                step_moves = trace.get(simulation.step + 1, [])
+                moves = [(User.find_by_id(user_id), Region.find_by_id(region_id)) for user_id, region_id in step_moves]
+            else:
+                moves = random_walk(users=User.all(), mobility_probability=mobility_probability)
+
+            step_output = simulation.run_step(moves=moves)
+            sla_violations += step_output["sla_violations"]
+
+            if writer is not None:
+                writer.writerow(step_output)
+    finally:
+        if output is not None:
+            output.close()
+
+    summary = {
+        "steps": n_steps,
+        "replacement_algorithm": simulation.replacement_algorithm,
+        "moved_users": simulation.moved_users,
+        "migrated_services": simulation.migrated_services,
+        "migrations_per_step": simulation.migrated_services / n_steps if n_steps > 0 else 0,
+        "mean_sla_violations": sla_violations / n_steps if n_steps > 0 else 0,
+        **simulation.metrics(),
+        "execution_time": time.time() - start_time,
+    }
+
+    return summary
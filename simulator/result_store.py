@@ -0,0 +1,122 @@
+"""Contains a content-addressed store of simulation results, used to skip runs whose results have already been computed.
+
+Each run is identified by a hash of the dataset content, algorithm, parameters, seed and code version (a hash of the simulator's
+source files), so that results are recomputed whenever any of them changes. Results are stored as "<key>.json" files inside the
+store directory and are only written once a run finishes, so interrupted runs are executed again.
+"""
+# Python libraries
+import hashlib
+import json
+import glob
+import os
+
+# Hashes of the files read so far (path -> (modification time, size, hash)), avoiding re-reading unchanged files
+FILE_HASHES = {}
+
+
+def hash_file(path: str) -> str:
+    """Computes the SHA-256 hash of a file's content.
+
+    Args:
+        path (str): File path.
+
+    Returns:
+        str: Hexadecimal hash of the file's content.
+    """
+    status = os.stat(path)
+    cached = FILE_HASHES.get(path)
+
+    if cached is None or cached[:2] != (status.st_mtime_ns, status.st_size):
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+        cached = (status.st_mtime_ns, status.st_size, digest.hexdigest())
+        FILE_HASHES[path] = cached
+
+    return cached[2]
+
+
+def get_code_version() -> str:
+    """Computes a hash of the simulator's source files, which changes whenever the simulator's code changes.
+
+    Returns:
+        str: Hexadecimal hash of the simulator's source code.
+    """
+    package_directory = os.path.dirname(os.path.abspath(__file__))
+
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(f"{package_directory}/**/*.py", recursive=True)):
+        digest.update(os.path.relpath(path, package_directory).encode("UTF-8"))
+        digest.update(hash_file(path=path).encode("UTF-8"))
+
+    return digest.hexdigest()
+
+
+def compute_run_key(dataset: str, algorithm: str, parameters: dict, seed_value: int) -> str:
+    """Computes the key that identifies a run in the result store.
+
+    Args:
+        dataset (str): Dataset file.
+        algorithm (str): Algorithm executed.
+        parameters (dict): Algorithm parameters.
+        seed_value (int): Seed value.
+
+    Returns:
+        str: Hexadecimal run key.
+    """
+    description = {
+        # Datasets loaded from URLs are identified by their address
+        "dataset": hash_file(path=dataset) if os.path.exists(dataset) else dataset,
+        "algorithm": algorithm,
+        "parameters": parameters,
+        "seed": seed_value,
+        "code_version": get_code_version(),
+    }
+
+    return hashlib.sha256(json.dumps(description, sort_keys=True, default=str).encode("UTF-8")).hexdigest()
+
+
+def has_result(result_store: str, key: str) -> bool:
+    """Checks whether the result of a run has already been stored.
+
+    Args:
+        result_store (str): Directory of the result store.
+        key (str): Run key.
+
+    Returns:
+        bool: Whether the result is stored.
+    """
+    return os.path.exists(f"{result_store}/{key}.json")
+
+
+def load_result(result_store: str, key: str) -> dict:
+    """Loads the result of a run.
+
+    Args:
+        result_store (str): Directory of the result store.
+        key (str): Run key.
+
+    Returns:
+        dict: Stored result.
+    """
+    with open(f"{result_store}/{key}.json", "r", encoding="UTF-8") as file:
+        return json.load(file)
+
+
+def save_result(result_store: str, key: str, result: dict):
+    """Stores the result of a run (the file is written atomically, so partially written results are never seen as complete).
+
+    Args:
+        result_store (str): Directory of the result store.
+        key (str): Run key.
+        result (dict): Result of the run.
+    """
+    os.makedirs(result_store, exist_ok=True)
+
+    file_name = f"{result_store}/{key}.json"
+    temporary_file_name = f"{file_name}.{os.getpid()}.tmp"
+    with open(temporary_file_name, "w", encoding="UTF-8") as file:
+        json.dump({"key": key, **result}, file, indent=4, default=str)
+    os.replace(temporary_file_name, file_name)
@@ -0,0 +1,253 @@
+"""Contains a Monte Carlo engine that estimates how robust placements are to fluctuations of link delays and service demands.
+
+Link delays and service demands are perturbed by random multiplicative factors (with mean 1) and the metrics of each placement
+are computed for thousands of samples at once with array operations:
+    - Delays: routes are fixed to the shortest paths of the nominal topology (routing does not re-converge with delay jitter),
+      so each user's delay is the product of the sampled link delays by the number of times the user's chain crosses each link.
+    - Demands: data center demands and allocation costs are recomputed from the sampled service demands.
+
+All placements are evaluated with the same samples (common random numbers), so their percentiles can be compared directly.
+
+Example:
+    results = evaluate_robustness(placements={"proposed_algorithm": placement}, n_samples=5000, delay_noise=0.2)
+"""
+# Simulation components
+from simulator.components.topology import Topology
+from simulator.components.region import Region
+from simulator.components.network_link import NetworkLink
+
+# Vectorized evaluator
+from simulator.vectorized import get_data_center_indices, get_hop_regions, calculate_data_center_demands
+
+# Scenario arrays (compiled or attached from a shared scenario)
+from simulator.shared_scenario import get_scenario_arrays
+
+# Python libraries
+import networkx as nx
+import numpy as np
+import time
+import csv
+
+# Distributions of the noise factors
+NOISE_DISTRIBUTIONS = ["lognormal", "normal"]
+
+# Metrics whose distributions are estimated
+METRICS = ["sla_violations", "overall_allocation_cost", "overloaded_data_centers"]
+
+# Percentiles reported by default
+PERCENTILES = [5, 50, 95, 99]
+
+
+def sample_factors(rng: object, size: tuple, noise: float, distribution: str = "lognormal") -> object:
+    """Draws multiplicative noise factors with mean 1.
+
+    Args:
+        rng (object): NumPy random generator.
+        size (tuple): Shape of the matrix of factors.
+        noise (float): Coefficient of variation of the factors (0 disables the noise).
+        distribution (str, optional): Distribution of the factors (see "NOISE_DISTRIBUTIONS"). Defaults to "lognormal".
+
+    Returns:
+        factors (object): Matrix of factors.
+    """
+    if noise <= 0:
+        return np.ones(size)
+
+    if distribution == "lognormal":
+        sigma = np.sqrt(np.log1p(noise**2))
+        factors = rng.lognormal(mean=-(sigma**2) / 2, sigma=sigma, size=size)
+    elif distribution == "normal":
+        # Negative delays and demands are meaningless, so factors are truncated at zero
+        factors = np.maximum(rng.normal(loc=1, scale=noise, size=size), 0)
+    else:
+        raise Exception(f"Unknown noise distribution: {distribution}. Valid options: {NOISE_DISTRIBUTIONS}.")
+
+    return factors
+
+
+def compile_routes(arrays: dict, indices: object, paths: dict = None) -> tuple:
+    """Counts how many times the communication chain of each user crosses each network link under a placement.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        indices (object): Data center index of each service.
+        paths (dict, optional): Cache of shortest paths from each origin region (shared by placements). Defaults to None.
+
+    Returns:
+        output (tuple): Matrix of link crossings (one row per user and one column per link) and mask of users whose chains
+            include unreachable regions.
+    """
+    topology = Topology.first()
+    regions = Region.all()
+    link_index = {link.id: index for index, link in enumerate(NetworkLink.all())}
+
+    n_users = len(arrays["user_region"])
+    crossings = np.zeros((n_users, len(link_index)))
+    unreachable = np.zeros(n_users, dtype=bool)
+
+    previous_regions, service_regions = get_hop_regions(arrays=arrays, indices=indices.reshape(1, -1))
+
+    # Shortest paths are computed once per origin region and reused by every hop that leaves it
+    if paths is None:
+        paths = {}
+    for user, origin, target in zip(arrays["service_user"], previous_regions[0], service_regions[0]):
+        if origin == target:
+            continue
+
+        if origin not in paths:
+            source = regions[origin]
+            paths[origin] = nx.single_source_dijkstra_path(G=topology, source=source, weight="delay") if source in topology else {}
+
+        path = paths[origin].get(regions[target])
+        if path is None:
+            unreachable[user] = True
+            continue
+
+        for i in range(len(path) - 1):
+            crossings[user, link_index[topology[path[i]][path[i + 1]].id]] += 1
+
+    output = (crossings, unreachable)
+
+    return output
+
+
+def summarize_samples(samples: object, percentiles: list) -> dict:
+    """Summarizes the samples of a metric into its mean and percentiles.
+
+    Args:
+        samples (object): Samples of the metric.
+        percentiles (list): Percentiles reported.
+
+    Returns:
+        summary (dict): Mean and percentiles of the metric.
+    """
+    summary = {"mean": float(np.mean(samples))}
+    for percentile, value in zip(percentiles, np.percentile(samples, percentiles)):
+        summary[f"p{percentile:g}"] = float(value)
+
+    return summary
+
+
+def evaluate_robustness(
+    placements: dict,
+    n_samples: int = 1000,
+    delay_noise: float = 0.2,
+    demand_noise: float = 0.1,
+    distribution: str = "lognormal",
+    percentiles: list = PERCENTILES,
+    seed_value: int = None,
+    batch_size: int = 1000,
+    arrays: dict = None,
+) -> list:
+    """Estimates the distributions of the metrics of placements under random link delays and service demands.
+
+    Args:
+        placements (dict): Placements evaluated (name -> data center ID of each service).
+        n_samples (int, optional): Number of samples. Defaults to 1000.
+        delay_noise (float, optional): Coefficient of variation of link delays. Defaults to 0.2.
+        demand_noise (float, optional): Coefficient of variation of service demands. Defaults to 0.1.
+        distribution (str, optional): Distribution of the noise factors (see "NOISE_DISTRIBUTIONS"). Defaults to "lognormal".
+        percentiles (list, optional): Percentiles reported. Defaults to "PERCENTILES".
+        seed_value (int, optional): Seed of the random generator. Defaults to None.
+        batch_size (int, optional): Number of samples evaluated at once (bounds memory usage). Defaults to 1000.
+        arrays (dict, optional): Scenario arrays. Defaults to the arrays of the current scenario (see "get_scenario_arrays").
+
+    Returns:
+        results (list): Mean and percentiles of each metric, plus the probability of overloading data centers, of each placement.
+    """
+    if distribution not in NOISE_DISTRIBUTIONS:
+        raise Exception(f"Unknown noise distribution: {distribution}. Valid options: {NOISE_DISTRIBUTIONS}.")
+
+    if arrays is None:
+        arrays = get_scenario_arrays()
+
+    link_delays = np.array([link.delay for link in NetworkLink.all()], dtype=np.float64)
+    n_services = len(arrays["service_demand"])
+
+    # Compiling the routes of each placement
+    compiled = []
+    paths = {}
+    for name, placement in placements.items():
+        indices = get_data_center_indices(arrays=arrays, placements=placement)[0]
+        crossings, unreachable = compile_routes(arrays=arrays, indices=indices, paths=paths)
+        service_costs = arrays["service_cost"][np.arange(n_services), indices]
+        compiled.append((name, indices, crossings, unreachable, service_costs))
+
+    samples = {name: {metric: np.zeros(n_samples) for metric in METRICS} for name in placements}
+
+    rng = np.random.default_rng(seed_value)
+    for start in range(0, n_samples, batch_size):
+        batch = min(batch_size, n_samples - start)
+
+        # Placements share the samples, so differences between their metrics are not due to sampling noise
+        delay_factors = sample_factors(rng=rng, size=(batch, len(link_delays)), noise=delay_noise, distribution=distribution)
+        demand_factors = sample_factors(rng=rng, size=(batch, n_services), noise=demand_noise, distribution=distribution)
+        sampled_link_delays = link_delays * delay_factors
+        sampled_demands = arrays["service_demand"] * demand_factors
+
+        for name, indices, crossings, unreachable, service_costs in compiled:
+            user_delays = sampled_link_delays @ crossings.T
+            user_delays[:, unreachable] = np.inf
+
+            demands = calculate_data_center_demands(
+                arrays=arrays, indices=np.broadcast_to(indices, (batch, n_services)), service_demand=sampled_demands
+            )
+
+            samples[name]["sla_violations"][start : start + batch] = (user_delays > arrays["user_delay_sla"]).sum(axis=1)
+            samples[name]["overall_allocation_cost"][start : start + batch] = demand_factors @ service_costs
+            samples[name]["overloaded_data_centers"][start : start + batch] = (demands > arrays["data_center_capacity"]).sum(axis=1)
+
+    results = []
+    for name in placements:
+        result = {"placement": name}
+        for metric in METRICS:
+            for statistic, value in summarize_samples(samples=samples[name][metric], percentiles=percentiles).items():
+                result[f"{metric}_{statistic}"] = value
+        result["overload_probability"] = float((samples[name]["overloaded_data_centers"] > 0).mean())
+        results.append(result)
+
+    return results
+
+
+def rank_by_robustness(results: list, percentile: float = 95) -> list:
+    """Ranks placements by their tail metrics (overloaded data centers first, then SLA violations and allocation cost).
+
+    Args:
+        results (list): Results of "evaluate_robustness".
+        percentile (float, optional): Percentile compared. Defaults to 95.
+
+    Returns:
+        list: Results sorted from the most to the least robust placement.
+    """
+    keys = [f"overloaded_data_centers_p{percentile:g}", f"sla_violations_p{percentile:g}", f"overall_allocation_cost_p{percentile:g}"]
+
+    return sorted(results, key=lambda result: [result[key] for key in keys])
+
+
+def run_robustness_analysis(placements: dict, parameters: dict = {}, output_file: str = None) -> list:
+    """Runs a Monte Carlo robustness analysis of placements and ranks them.
+
+    Args:
+        placements (dict): Placements evaluated (name -> data center ID of each service).
+        parameters (dict, optional): Arguments of "evaluate_robustness". Defaults to {}.
+        output_file (str, optional): CSV file that receives the results of each placement. Defaults to None.
+
+    Returns:
+        results (list): Results of each placement, from the most to the least robust, with the execution time of the analysis.
+    """
+    start_time = time.time()
+    results = evaluate_robustness(placements=placements, **parameters)
+    execution_time = time.time() - start_time
+
+    percentile = max(parameters.get("percentiles", PERCENTILES))
+    results = rank_by_robustness(results=results, percentile=percentile)
+    for result in results:
+        result["execution_time"] = execution_time
+
+    if output_file:
+        with open(output_file, "w", newline="", encoding="UTF-8") as file:
+            writer = csv.DictWriter(file, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+
+    return results
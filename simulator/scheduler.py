@@ -0,0 +1,250 @@
+"""Contains a makespan-aware scheduler that orders sweep runs by their predicted cost and bounds their concurrency by CPU and memory.
+
+The cost of a run is predicted from its amount of work (population size, generations and services) with models whose scale is
+calibrated to the runtimes and peak memory usage of past runs kept in the result store. Runs are started longest first (longest
+processing time rule), which avoids the long tail of idle cores left when the costliest runs are started last. A run is only
+started when it fits in the memory that is still free, and smaller runs that fit are started ahead of larger runs that do not
+(backfilling).
+"""
+# Python libraries
+from subprocess import Popen, DEVNULL, TimeoutExpired
+import numpy as np
+import json
+import glob
+import time
+import sys
+import os
+
+# Default cost models, measured with NSGA-II runs on a single core. Runtimes grow with the number of evaluations (population
+# size x generations x services) and with the pairwise comparisons of non-dominated sorting (population size^2 x generations),
+# while memory grows with the pairwise comparisons held by the sorting (population size^2). Past runs only rescale these models.
+RUNTIME_MODEL = {"base": 1.5, "evaluations": 2.2e-5, "comparisons": 1.3e-6}
+MEMORY_MODEL = {"base": 70, "pairs": 2e-4}
+
+# Number of services of each dataset (path -> number of services)
+DATASET_SIZES = {}
+
+
+def get_dataset_size(dataset: str) -> int:
+    """Counts the services of a dataset (datasets that cannot be read, such as remote ones, count as a single service).
+
+    Args:
+        dataset (str): Dataset file.
+
+    Returns:
+        int: Number of services.
+    """
+    if dataset not in DATASET_SIZES:
+        try:
+            with open(dataset, "r", encoding="UTF-8") as file:
+                DATASET_SIZES[dataset] = max(len(json.load(file).get("Service", [])), 1)
+        except (OSError, ValueError):
+            DATASET_SIZES[dataset] = 1
+
+    return DATASET_SIZES[dataset]
+
+
+def get_cost_features(dataset: str, parameters: dict, generations: int = None) -> dict:
+    """Measures the amount of work of a run.
+
+    Args:
+        dataset (str): Dataset file.
+        parameters (dict): Algorithm parameters.
+        generations (int, optional): Generations actually executed (runs may stop before "n_gen"). Defaults to "n_gen".
+
+    Returns:
+        features (dict): Amounts of work that drive the runtime and memory usage of the run.
+    """
+    services = get_dataset_size(dataset=dataset)
+    pop_size = parameters.get("pop_size", 1)
+    n_gen = generations if generations is not None else parameters.get("n_gen", 1)
+
+    features = {
+        "base": 1,
+        "evaluations": pop_size * n_gen * services,
+        "comparisons": pop_size**2 * n_gen,
+        "pairs": pop_size**2,
+    }
+
+    return features
+
+
+def apply_model(model: dict, features: dict) -> float:
+    """Applies a linear cost model to the features of a run.
+
+    Args:
+        model (dict): Coefficient of each feature.
+        features (dict): Features of the run.
+
+    Returns:
+        float: Predicted cost.
+    """
+    return sum(coefficient * features[feature] for feature, coefficient in model.items())
+
+
+def get_peak_memory() -> float:
+    """Gets the peak memory usage of the current process.
+
+    Returns:
+        float: Peak resident memory (in MB), or None on platforms that do not report it.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports the peak memory in kilobytes, while macOS reports it in bytes
+    return peak_memory / 1024**2 if sys.platform == "darwin" else peak_memory / 1024
+
+
+def get_available_memory() -> float:
+    """Gets the memory available for new processes.
+
+    Returns:
+        float: Available memory (in MB), or None on platforms that do not report it.
+    """
+    try:
+        with open("/proc/meminfo", "r", encoding="UTF-8") as file:
+            for line in file:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 1024**2
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def fit_cost_model(result_store: str) -> dict:
+    """Calibrates the default cost models to the runtimes and peak memory usage of each algorithm's runs in the result store.
+
+    Args:
+        result_store (str): Directory of the result store.
+
+    Returns:
+        model (dict): Runtime and memory scales of each algorithm (factors applied to the default models).
+    """
+    history = {}
+    for file_name in glob.glob(f"{result_store}/*.json"):
+        try:
+            with open(file_name, "r", encoding="UTF-8") as file:
+                result = json.load(file)
+        except (OSError, ValueError):
+            continue
+
+        if "execution_time" not in result or "dataset" not in result:
+            continue
+
+        features = get_cost_features(dataset=result["dataset"], parameters=result, generations=result.get("generations"))
+        history.setdefault(result["algorithm"], []).append(
+            (result["execution_time"] / apply_model(model=RUNTIME_MODEL, features=features), result.get("peak_memory"), features)
+        )
+
+    model = {}
+    for algorithm, runs in history.items():
+        memory_ratios = [
+            peak_memory / apply_model(model=MEMORY_MODEL, features=features) for _, peak_memory, features in runs if peak_memory
+        ]
+
+        model[algorithm] = {
+            # The median runtime ratio is robust to runs slowed down by other processes, while the largest memory ratio avoids
+            # starting more runs than the memory can hold
+            "runtime_scale": float(np.median([runtime_ratio for runtime_ratio, _, _ in runs])),
+            "memory_scale": max(memory_ratios) if memory_ratios else 1,
+            "runs": len(runs),
+        }
+
+    return model
+
+
+def predict_cost(model: dict, dataset: str, algorithm: str, parameters: dict) -> tuple:
+    """Predicts the runtime and peak memory usage of a run.
+
+    Args:
+        model (dict): Calibrated cost model (see "fit_cost_model").
+        dataset (str): Dataset file.
+        algorithm (str): Algorithm executed.
+        parameters (dict): Algorithm parameters.
+
+    Returns:
+        output (tuple): Predicted runtime (in seconds) and peak memory usage (in MB).
+    """
+    features = get_cost_features(dataset=dataset, parameters=parameters)
+    scales = model.get(algorithm, {"runtime_scale": 1, "memory_scale": 1})
+
+    output = (
+        scales["runtime_scale"] * apply_model(model=RUNTIME_MODEL, features=features),
+        scales["memory_scale"] * apply_model(model=MEMORY_MODEL, features=features),
+    )
+
+    return output
+
+
+def order_jobs(jobs: list) -> list:
+    """Orders jobs from the longest to the shortest predicted runtime.
+
+    Args:
+        jobs (list): Jobs (dictionaries with the "predicted_time" of each job).
+
+    Returns:
+        list: Ordered jobs.
+    """
+    return sorted(jobs, key=lambda job: -job["predicted_time"])
+
+
+def schedule_jobs(jobs: list, max_processes: int, memory_budget: float = None) -> dict:
+    """Runs jobs longest first, keeping the number of running jobs and their predicted memory usage within the given limits.
+
+    Args:
+        jobs (list): Jobs (dictionaries with the "command", "predicted_time" and "predicted_memory" of each job).
+        max_processes (int): Maximum number of jobs running at once.
+        memory_budget (float, optional): Memory (in MB) shared by the running jobs. Defaults to None (unbounded).
+
+    Returns:
+        summary (dict): Makespan of the sweep and its lower bound according to the predicted runtimes.
+    """
+    pending = order_jobs(jobs=jobs)
+    running = []
+    start_time = time.time()
+
+    while pending or running:
+        # Starting the longest pending jobs that fit in the free memory (a job runs alone if it does not fit in the budget)
+        used_memory = sum(job["predicted_memory"] for job, _ in running)
+        for job in list(pending):
+            if len(running) >= max_processes:
+                break
+
+            if memory_budget is None or len(running) == 0 or used_memory + job["predicted_memory"] <= memory_budget:
+                process = Popen(job["command"], stdout=DEVNULL, stderr=DEVNULL)
+                print(f"PID {process.pid} started (predicted: {job['predicted_time']:.1f} s, {job['predicted_memory']:.0f} MB)")
+
+                running.append((job, process))
+                pending.remove(job)
+                used_memory += job["predicted_memory"]
+
+        # Waiting for any running job to finish
+        finished = False
+        while not finished:
+            for job, process in list(running):
+                if process.poll() is not None:
+                    running.remove((job, process))
+                    finished = True
+                    print(f"PID {process.pid} finished")
+
+            if not finished:
+                try:
+                    running[0][1].wait(timeout=0.1)
+                except TimeoutExpired:
+                    pass
+
+    total_time = sum(job["predicted_time"] for job in jobs)
+    summary = {
+        "makespan": time.time() - start_time,
+        "predicted_makespan_lower_bound": max(total_time / max_processes, max((job["predicted_time"] for job in jobs), default=0)),
+    }
+
+    return summary
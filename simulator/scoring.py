@@ -0,0 +1,209 @@
+"""Contains the bulk scoring of externally produced placement schemes.
+
+Placements are read from a JSONL file (one placement per line, either a list of data center IDs or an object with a
+"placement" key) or from a ".npy" file (2D integer array). Metrics are streamed to a JSONL or CSV file as batches are scored.
+"""
+# Simulator class
+from simulator.simulator import Simulator
+
+# Vectorized evaluator
+from simulator.vectorized import calculate_metrics_batch, get_objectives_and_penalties
+
+# Shared-memory scenario arena
+from simulator.shared_scenario import SharedScenario, find_shared_scenario
+
+# Python libraries
+import multiprocessing as mp
+import numpy as np
+import json
+import time
+import csv
+import sys
+
+# Scenario arrays used by the worker processes (attached to the shared scenario by "initialize_worker")
+WORKER_ARRAYS = {}
+
+# Shared scenario attached by the worker process (kept referenced so that its memory stays mapped)
+WORKER_SCENARIO = []
+
+# Columns of the scoring output
+OUTPUT_FIELDS = [
+    "index",
+    "sla_violations",
+    "overall_allocation_cost",
+    "overloaded_data_centers",
+    "norm_sla_violations",
+    "norm_allocation_cost",
+]
+
+
+def read_placement_batches(input_file: str, batch_size: int):
+    """Reads placements from the input file in batches.
+
+    Args:
+        input_file (str): JSONL or ".npy" file with the placements.
+        batch_size (int): Number of placements per batch.
+
+    Yields:
+        batch (tuple): Index of the first placement in the batch and the placement matrix.
+    """
+    if input_file.endswith(".npy"):
+        # Memory-mapping the file to avoid loading all placements at once
+        placements = np.load(input_file, mmap_mode="r")
+        for start in range(0, len(placements), batch_size):
+            yield start, np.array(placements[start : start + batch_size])
+
+    else:
+        start = 0
+        batch = []
+        with open(input_file, "r", encoding="UTF-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+
+                placement = json.loads(line)
+                batch.append(placement["placement"] if type(placement) == dict else placement)
+
+                if len(batch) == batch_size:
+                    yield start, np.array(batch)
+                    start += len(batch)
+                    batch = []
+
+        if len(batch) > 0:
+            yield start, np.array(batch)
+
+
+def score_batch(arrays: dict, start: int, placements: object) -> list:
+    """Scores a batch of placements.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        start (int): Index of the first placement in the batch.
+        placements (object): Placement matrix.
+
+    Returns:
+        rows (list): Metrics of each placement.
+    """
+    metrics = calculate_metrics_batch(arrays=arrays, placements=placements)
+    objectives, _ = get_objectives_and_penalties(arrays=arrays, metrics=metrics)
+
+    rows = [
+        {
+            "index": start + i,
+            "sla_violations": int(metrics["sla_violations"][i]),
+            "overall_allocation_cost": float(metrics["overall_allocation_cost"][i]),
+            "overloaded_data_centers": int(metrics["overloaded_data_centers"][i]),
+            "norm_sla_violations": float(objectives[i][0]),
+            "norm_allocation_cost": float(objectives[i][1]),
+        }
+        for i in range(len(placements))
+    ]
+
+    return rows
+
+
+def initialize_worker(shared_scenario: str):
+    """Attaches a worker process to the shared scenario, so that workers neither load the dataset nor copy its arrays.
+
+    Args:
+        shared_scenario (str): Name of the shared scenario.
+    """
+    scenario = SharedScenario.attach(name=shared_scenario)
+    WORKER_SCENARIO.append(scenario)
+    WORKER_ARRAYS.update(scenario.arrays)
+
+
+def score_batch_in_worker(batch: tuple) -> list:
+    """Scores a batch of placements inside a worker process.
+
+    Args:
+        batch (tuple): Index of the first placement in the batch and the placement matrix.
+
+    Returns:
+        rows (list): Metrics of each placement.
+    """
+    return score_batch(arrays=WORKER_ARRAYS, start=batch[0], placements=batch[1])
+
+
+def score_placements(
+    dataset: str, input_file: str, output_file: str = None, batch_size: int = 10000, processes: int = 1, shared_scenario: str = None
+) -> int:
+    """Scores the placements stored in a file, streaming their metrics to the output file.
+
+    Args:
+        dataset (str): Dataset file (only loaded when no shared scenario was compiled from it, see "find_shared_scenario").
+        input_file (str): JSONL or ".npy" file with the placements.
+        output_file (str, optional): JSONL or CSV output file (metrics are written to the standard output if not informed). Defaults to None.
+        batch_size (int, optional): Number of placements scored at once. Defaults to 10000.
+        processes (int, optional): Number of worker processes. Defaults to 1.
+        shared_scenario (str, optional): Name of a shared scenario published by another process. Defaults to None.
+
+    Returns:
+        scored (int): Number of placements scored.
+    """
+    output = open(output_file, "w", newline="", encoding="UTF-8") if output_file else sys.stdout
+    writer = None
+    if output_file and output_file.endswith(".csv"):
+        writer = csv.DictWriter(output, fieldnames=OUTPUT_FIELDS)
+        writer.writeheader()
+
+    batches = read_placement_batches(input_file=input_file, batch_size=batch_size)
+    scored = 0
+    start_time = time.time()
+
+    # Attaching to the shared scenario published for the dataset on this host (e.g., by "run_experiments.py"), if any
+    if shared_scenario is None and dataset is not None:
+        published_scenario = find_shared_scenario(dataset=dataset)
+        if published_scenario is not None:
+            shared_scenario = published_scenario.name
+
+    # Compiling the scenario in this process and sharing it with the workers (unless it has already been published)
+    scenario = None
+    if shared_scenario is None:
+        Simulator().initialize(input_file=dataset)
+        scenario = SharedScenario.create(dataset=dataset)
+        shared_scenario = scenario.name
+
+    try:
+        if processes > 1:
+            with mp.Pool(processes=processes, initializer=initialize_worker, initargs=(shared_scenario,)) as pool:
+                results = pool.imap(score_batch_in_worker, batches)
+                for rows in results:
+                    write_rows(output=output, writer=writer, rows=rows)
+                    scored += len(rows)
+        else:
+            initialize_worker(shared_scenario=shared_scenario)
+            for batch in batches:
+                rows = score_batch_in_worker(batch=batch)
+                write_rows(output=output, writer=writer, rows=rows)
+                scored += len(rows)
+    finally:
+        if output_file:
+            output.close()
+
+        # Releasing the views of the arrays before detaching from the shared scenario (and destroying it if it was created here)
+        WORKER_ARRAYS.clear()
+        for attached_scenario in WORKER_SCENARIO:
+            attached_scenario.close()
+        WORKER_SCENARIO.clear()
+
+        if scenario is not None:
+            scenario.close()
+
+    print(f"Scored {scored} placements in {round(time.time() - start_time, 2)} seconds", file=sys.stderr)
+
+    return scored
+
+
+def write_rows(output: object, writer: object, rows: list):
+    """Writes the metrics of a batch of placements to the output stream.
+
+    Args:
+        output (object): Output stream.
+        writer (object): CSV writer (None when the output is written as JSONL).
+        rows (list): Metrics of each placement.
+    """
+    if writer is not None:
+        writer.writerows(rows)
+    else:
+        output.write("".join(json.dumps(row) + "\n" for row in rows))
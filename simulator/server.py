@@ -0,0 +1,263 @@
+"""Contains a long-lived placement service that keeps a simulation scenario loaded in memory.
+
+The service speaks newline-delimited JSON over a TCP or Unix socket. Each request is a single line such as:
+    {"id": 1, "method": "evaluate", "params": {"placement": [3, 1, 7, ...]}}
+
+Supported methods:
+    - "placement": runs a placement strategy (params: "algorithm" and optional "parameters", which may set a "time_budget").
+    - "evaluate": returns the objectives and penalties of a placement scheme (params: "placement").
+    - "metrics": returns the raw metrics of a placement scheme (params: "placement").
+    - "info": returns a summary of the scenario loaded by the service.
+
+Responses mirror the request id and carry either a "result" or an "error" key.
+"""
+# Simulation components
+from simulator.components import *
+
+# Helper methods
+from simulator.helper_methods import *
+
+# Placement strategies
+from simulator import strategies
+
+# Python libraries
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import os
+
+# Placement strategies that clients may request (only these names are accepted, so requests cannot reach other attributes)
+PLACEMENT_STRATEGIES = {
+    "proposed_algorithm": strategies.proposed_algorithm,
+    "best_fit": strategies.best_fit,
+    "worst_fit": strategies.worst_fit,
+    "nsgaii": strategies.nsgaii,
+    "island_nsgaii": strategies.island_nsgaii,
+    "local_search": strategies.local_search,
+    "portfolio": strategies.portfolio,
+}
+
+
+class PlacementServer:
+    """Asynchronous server that answers placement requests using a preloaded simulation scenario."""
+
+    def __init__(self, simulator: object, batch_window: float = 0.005, max_batch_size: int = 256) -> object:
+        """Creates a PlacementServer object.
+
+        Args:
+            simulator (object): Simulator object whose scenario has already been initialized.
+            batch_window (float, optional): Time (in seconds) spent gathering concurrent requests into a batch. Defaults to 0.005.
+            max_batch_size (int, optional): Maximum number of requests processed within a single batch. Defaults to 256.
+
+        Returns:
+            object: Created PlacementServer object.
+        """
+        self.simulator = simulator
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+
+        # Queue of pending requests (each item is a tuple with the request and the future that will receive its response)
+        self.queue = None
+
+        # The scenario is stored in class-level state, so batches are processed one at a time by a single worker thread
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765, unix_socket: str = None) -> None:
+        """Starts serving requests until the process is interrupted.
+
+        Args:
+            host (str, optional): Host address used when serving over TCP. Defaults to "127.0.0.1".
+            port (int, optional): Port used when serving over TCP. Defaults to 8765.
+            unix_socket (str, optional): Unix socket path. When informed, it takes precedence over "host" and "port". Defaults to None.
+        """
+        self.queue = asyncio.Queue()
+
+        if unix_socket:
+            if os.path.exists(unix_socket):
+                os.remove(unix_socket)
+            server = await asyncio.start_unix_server(self.handle_connection, path=unix_socket)
+            print(f"Placement server listening on {unix_socket}")
+        else:
+            server = await asyncio.start_server(self.handle_connection, host=host, port=port)
+            print(f"Placement server listening on {host}:{port}")
+
+        batch_worker = asyncio.ensure_future(self.process_batches())
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batch_worker.cancel()
+            self.executor.shutdown(wait=False)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Reads newline-delimited JSON requests from a client connection and writes their responses back.
+
+        Args:
+            reader (asyncio.StreamReader): Stream from which requests are read.
+            writer (asyncio.StreamWriter): Stream to which responses are written.
+        """
+        pending_responses = set()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                if not line.strip():
+                    continue
+
+                # Requests from the same connection are answered as soon as they are ready (responses carry the request id)
+                task = asyncio.ensure_future(self.answer(line=line, writer=writer))
+                pending_responses.add(task)
+                task.add_done_callback(pending_responses.discard)
+
+            if pending_responses:
+                await asyncio.gather(*pending_responses)
+
+        finally:
+            writer.close()
+
+    async def answer(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        """Enqueues a request and writes its response once the batch that contains it is processed.
+
+        Args:
+            line (bytes): Raw request.
+            writer (asyncio.StreamWriter): Stream to which the response is written.
+        """
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exception:
+            response = {"id": None, "error": f"Invalid JSON request: {exception}"}
+        else:
+            future = asyncio.get_running_loop().create_future()
+            await self.queue.put((request, future))
+            response = await future
+
+        writer.write((json.dumps(response) + "\n").encode("UTF-8"))
+        await writer.drain()
+
+    async def process_batches(self) -> None:
+        """Groups requests that arrive concurrently and processes them in a single pass over the scenario."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Waiting for the first request of the batch and giving concurrent requests a chance to join it
+            batch = [await self.queue.get()]
+            await asyncio.sleep(self.batch_window)
+
+            while not self.queue.empty() and len(batch) < self.max_batch_size:
+                batch.append(self.queue.get_nowait())
+
+            requests = [request for request, _ in batch]
+            responses = await loop.run_in_executor(self.executor, self.handle_batch, requests)
+
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+
+    def handle_batch(self, requests: list) -> list:
+        """Processes a batch of requests. Identical requests within the batch are processed only once.
+
+        Args:
+            requests (list): List of requests.
+
+        Returns:
+            responses (list): List of responses (in the same order as the requests).
+        """
+        results = {}
+        responses = []
+
+        for request in requests:
+            request_id = request.get("id") if type(request) == dict else None
+
+            try:
+                if type(request) != dict:
+                    raise ValueError("Requests must be JSON objects.")
+
+                key = json.dumps([request.get("method"), request.get("params", {})], sort_keys=True)
+                if key not in results:
+                    results[key] = self.handle_request(method=request.get("method"), params=request.get("params", {}))
+
+                responses.append({"id": request_id, "result": results[key]})
+
+            except Exception as exception:
+                # Making sure a failed request does not leave a partial placement behind
+                reset_scenario()
+                responses.append({"id": request_id, "error": f"{type(exception).__name__}: {exception}"})
+
+        return responses
+
+    def handle_request(self, method: str, params: dict) -> dict:
+        """Processes a single request.
+
+        Args:
+            method (str): Name of the requested method.
+            params (dict): Request parameters.
+
+        Returns:
+            result (dict): Request result.
+        """
+        if method == "info":
+            result = {
+                "data_centers": DataCenter.count(),
+                "services": Service.count(),
+                "users": User.count(),
+                "regions": Region.count(),
+            }
+
+        elif method == "placement":
+            algorithm = params.get("algorithm")
+            if not isinstance(algorithm, str) or algorithm not in PLACEMENT_STRATEGIES:
+                raise ValueError(f"Unknown placement algorithm: {algorithm}. Valid options: {list(PLACEMENT_STRATEGIES)}.")
+
+            # Running the strategy through the simulator so that time budgets and local search are honored
+            self.simulator.placement_algorithm = PLACEMENT_STRATEGIES[algorithm]
+            self.simulator.placement_algorithm_parameters = params.get("parameters", {})
+            execution_metadata = self.simulator.run()
+
+            result = {
+                "placement": [service.data_center.id if service.data_center else None for service in Service.all()],
+                "metrics": calculate_metrics(),
+                "execution": execution_metadata,
+            }
+            reset_scenario()
+
+        elif method in ["evaluate", "metrics"]:
+            placement = params.get("placement")
+            if type(placement) != list or len(placement) != Service.count():
+                raise ValueError(f"Placements must be lists with one data center ID per service ({Service.count()} items).")
+
+            apply_placement(solution=placement)
+
+            if method == "evaluate":
+                objectives, penalties = evaluate_placement()
+                result = {"objectives": list(objectives), "penalties": penalties}
+            else:
+                result = calculate_metrics()
+
+            reset_scenario()
+
+        else:
+            raise ValueError(f"Unknown method: {method}.")
+
+        return result
+
+
+def serve(simulator: object, host: str = "127.0.0.1", port: int = 8765, unix_socket: str = None, batch_window: float = 0.005):
+    """Runs the placement server on top of an initialized Simulator object.
+
+    Args:
+        simulator (object): Simulator object whose scenario has already been initialized.
+        host (str, optional): Host address used when serving over TCP. Defaults to "127.0.0.1".
+        port (int, optional): Port used when serving over TCP. Defaults to 8765.
+        unix_socket (str, optional): Unix socket path. Defaults to None.
+        batch_window (float, optional): Time (in seconds) spent gathering concurrent requests into a batch. Defaults to 0.005.
+    """
+    server = PlacementServer(simulator=simulator, batch_window=batch_window)
+
+    try:
+        asyncio.run(server.start(host=host, port=port, unix_socket=unix_socket))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,264 @@
+"""Contains a shared-memory arena that holds the compiled scenario arrays, so that processes on the same host can attach to a
+single copy of the arrays instead of compiling their own.
+
+The arena is a single shared memory block laid out as follows:
+    - 8 bytes: length of the header (little-endian unsigned integer).
+    - header: JSON object with the data type, shape and offset of each array.
+    - arrays: raw array data (each array starts at a 64-byte aligned offset).
+
+The header also identifies the dataset the arrays were compiled from. Simulator processes started with the
+"SIMULATOR_SHARED_SCENARIOS" environment variable (comma-separated names of arenas, set by "run_experiments.py") get the arrays
+of the arena that matches their dataset from "get_scenario_arrays" instead of compiling their own copy. The arrays describe the
+dataset as loaded, so the variable must not be set for processes that change the scenario after loading it.
+
+Scope: only bulk scoring ("python -m simulator score") works on the arrays alone, so scoring workers neither load the dataset
+nor build the object graph and topology. Simulation runs still load the dataset and build both, as placement strategies,
+heuristic initial populations (NumPy NSGA-II backend and tuning), route compilation (robustness analysis) and the reported
+metrics operate on the object graph, and the default NSGA-II backend (pymoo) evaluates placements on it. For those runs, the
+arena only replaces the compiled copy of the arrays (e.g., the region delay and service x data center cost matrices), so
+their memory still grows with the scenario size.
+
+Example:
+    arena = SharedScenario.create(arrays=compile_scenario())  # Publisher process
+    arena = SharedScenario.attach(name=arena.name)  # Worker processes (arrays are read-only views of the shared block)
+"""
+# Simulation components
+from simulator.simulator import Simulator
+from simulator.components.data_center import DataCenter
+from simulator.components.service import Service
+
+# Vectorized evaluator
+from simulator.vectorized import compile_scenario
+
+# Result store (identifies datasets by the hash of their content)
+from simulator.result_store import hash_file
+
+# Python libraries
+from multiprocessing import shared_memory, resource_tracker
+import numpy as np
+import json
+import os
+
+# Alignment (in bytes) of the arrays within the shared memory block
+ALIGNMENT = 64
+
+# Size (in bytes) of the field that stores the length of the header
+HEADER_LENGTH_SIZE = 8
+
+# Environment variable that lists the shared scenarios that simulator processes may attach to
+SHARED_SCENARIOS_VARIABLE = "SIMULATOR_SHARED_SCENARIOS"
+
+# Shared scenarios attached by this process (name -> SharedScenario, or None if the scenario does not exist on this host)
+ATTACHED_SCENARIOS = {}
+
+
+def align(offset: int) -> int:
+    """Rounds an offset up to the next multiple of the arrays' alignment.
+
+    Args:
+        offset (int): Offset (in bytes).
+
+    Returns:
+        int: Aligned offset.
+    """
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def get_dataset_id(dataset: str) -> str:
+    """Identifies a dataset by the hash of its content (datasets loaded from URLs are identified by their address).
+
+    Args:
+        dataset (str): Dataset file.
+
+    Returns:
+        str: Dataset ID.
+    """
+    return hash_file(path=dataset) if os.path.exists(dataset) else dataset
+
+
+def open_shared_memory(name: str) -> object:
+    """Opens an existing shared memory block without tracking it, as Python's resource tracker would otherwise destroy the block
+    when the attaching process exits (the process that created the block remains responsible for unlinking it).
+
+    Args:
+        name (str): Name of the shared memory block.
+
+    Returns:
+        shm (object): Shared memory block.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python versions older than 3.13 always register the block with the resource tracker
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class SharedScenario:
+    """Compiled scenario arrays stored in (or attached from) a shared memory block."""
+
+    def __init__(self, shm: object, owner: bool) -> object:
+        """Creates a SharedScenario object. Use "SharedScenario.create" or "SharedScenario.attach" instead.
+
+        Args:
+            shm (object): Shared memory block.
+            owner (bool): Whether this object created the block (and is responsible for unlinking it).
+
+        Returns:
+            object: Created SharedScenario object.
+        """
+        self.shm = shm
+        self.owner = owner
+
+        header_length = int(np.frombuffer(shm.buf, dtype="<u8", count=1)[0])
+        self.header = json.loads(bytes(shm.buf[HEADER_LENGTH_SIZE : HEADER_LENGTH_SIZE + header_length]).decode("UTF-8"))
+
+        # Zero-copy views of the arrays (attached processes get read-only views)
+        self.arrays = {}
+        for key, layout in self.header["arrays"].items():
+            array = np.ndarray(shape=tuple(layout["shape"]), dtype=np.dtype(layout["dtype"]), buffer=shm.buf, offset=layout["offset"])
+            array.flags.writeable = owner
+            self.arrays[key] = array
+
+    @property
+    def dataset(self) -> str:
+        """ID of the dataset the arrays were compiled from (see "get_dataset_id").
+
+        Returns:
+            str: Dataset ID (None if the arena was created without informing the dataset).
+        """
+        return self.header.get("dataset")
+
+    @property
+    def name(self) -> str:
+        """Name used by other processes to attach to the shared memory block.
+
+        Returns:
+            str: Name of the shared memory block.
+        """
+        return self.shm.name
+
+    @classmethod
+    def create(cls, arrays: dict = None, name: str = None, dataset: str = None) -> object:
+        """Copies the scenario arrays into a new shared memory block.
+
+        Args:
+            arrays (dict, optional): Scenario arrays. Defaults to the arrays compiled from the scenario currently loaded.
+            name (str, optional): Name of the shared memory block. Defaults to a random name.
+            dataset (str, optional): Dataset file the arrays were compiled from. Defaults to None.
+
+        Returns:
+            object: Created SharedScenario object.
+        """
+        if arrays is None:
+            arrays = compile_scenario()
+
+        arrays = {key: np.ascontiguousarray(array) for key, array in arrays.items()}
+
+        # Computing the layout of the arrays (the header size is estimated with generous room for the offsets)
+        layout = {key: {"dtype": array.dtype.str, "shape": list(array.shape), "offset": 0} for key, array in arrays.items()}
+        metadata = {"dataset": get_dataset_id(dataset=dataset) if dataset else None, "arrays": layout}
+        offset = align(HEADER_LENGTH_SIZE + len(json.dumps(metadata)) + 32 * len(layout))
+        for key, array in arrays.items():
+            layout[key]["offset"] = offset
+            offset = align(offset + array.nbytes)
+
+        header = json.dumps(metadata).encode("UTF-8")
+        if len(layout) > 0 and HEADER_LENGTH_SIZE + len(header) > min(entry["offset"] for entry in layout.values()):
+            raise Exception("The header of the shared scenario overlaps its arrays.")
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(offset, 1))
+
+        shm.buf[:HEADER_LENGTH_SIZE] = np.array([len(header)], dtype="<u8").tobytes()
+        shm.buf[HEADER_LENGTH_SIZE : HEADER_LENGTH_SIZE + len(header)] = header
+        for key, array in arrays.items():
+            shm.buf[layout[key]["offset"] : layout[key]["offset"] + array.nbytes] = array.tobytes()
+
+        return cls(shm=shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> object:
+        """Attaches to a shared memory block created by another process.
+
+        Args:
+            name (str): Name of the shared memory block.
+
+        Returns:
+            object: Attached SharedScenario object.
+        """
+        return cls(shm=open_shared_memory(name=name), owner=False)
+
+    def close(self):
+        """Detaches from the shared memory block (and destroys it if this object created it)."""
+        # Views must be released before the block is closed
+        self.arrays = {}
+
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self) -> object:
+        """Allows the arena to be used as a context manager.
+
+        Returns:
+            object: SharedScenario object.
+        """
+        return self
+
+    def __exit__(self, *args):
+        """Detaches from (or destroys) the shared memory block when leaving the context."""
+        self.close()
+
+
+def find_shared_scenario(dataset: str) -> object:
+    """Finds a shared scenario compiled from a dataset among the ones listed in the "SIMULATOR_SHARED_SCENARIOS" environment
+    variable. The dataset does not need to be loaded, so processes that only need the arrays can skip loading it.
+
+    Args:
+        dataset (str): Dataset file.
+
+    Returns:
+        object: Attached SharedScenario object (None if no shared scenario on this host was compiled from the dataset).
+    """
+    names = [name for name in os.environ.get(SHARED_SCENARIOS_VARIABLE, "").split(",") if name]
+    if len(names) == 0:
+        return None
+
+    dataset = get_dataset_id(dataset=dataset)
+
+    for name in names:
+        if name not in ATTACHED_SCENARIOS:
+            try:
+                ATTACHED_SCENARIOS[name] = SharedScenario.attach(name=name)
+            except FileNotFoundError:
+                # Shared scenarios only exist on the host that published them (e.g., not on other nodes of a distributed sweep)
+                ATTACHED_SCENARIOS[name] = None
+
+        scenario = ATTACHED_SCENARIOS[name]
+        if scenario is not None and scenario.dataset == dataset:
+            return scenario
+
+    return None
+
+
+def get_scenario_arrays() -> dict:
+    """Gets the arrays of the scenario currently loaded, from a shared scenario compiled from the same dataset when one is listed
+    in the "SIMULATOR_SHARED_SCENARIOS" environment variable, or by compiling the scenario otherwise.
+
+    Returns:
+        dict: Scenario arrays.
+    """
+    if Simulator.count() > 0 and Simulator.last().input_file is not None:
+        scenario = find_shared_scenario(dataset=Simulator.last().input_file)
+
+        # Arrays of scenarios whose components were added or removed after loading the dataset would not match
+        if scenario is not None:
+            arrays = scenario.arrays
+            if arrays["service_demand"].shape[0] == Service.count() and arrays["data_center_capacity"].shape[0] == DataCenter.count():
+                return arrays
+
+    return compile_scenario()
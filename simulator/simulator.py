@@ -5,9 +5,13 @@ from simulator.component_manager import ComponentManager
 # Simulation components
 from simulator.components import *
 
+# Helper methods
+from simulator.helper_methods import compute_scenario_invariants
+
 # Python libraries
 import os
 import json
+import time
 from urllib.parse import urlparse
 from urllib.request import urlopen
 from typing import Callable
@@ -35,6 +39,9 @@ class Simulator(ComponentManager):
         # Attribute that stores the network topology used during the simulation
         self.topology = None
 
+        # Dataset from which the simulation scenario was loaded (allows worker processes to rebuild the scenario)
+        self.input_file = None
+
         # Storing a reference to the Simulator object inside the ComponentManager class
         ComponentManager._ComponentManager__model = self
 
@@ -68,6 +75,8 @@ class Simulator(ComponentManager):
         if type(data) is not dict:
             raise TypeError("The simulator could not load the dataset based on the specified arguments.")
 
+        self.input_file = input_file
+
         # Creating simulator components based on the specified input data
         missing_keys = [key for key in data.keys() if key not in globals()]
         if len(missing_keys) > 0:
@@ -159,5 +168,32 @@ class Simulator(ComponentManager):
             self.topology._adj[link.nodes[0]][link.nodes[1]] = link
             self.topology._adj[link.nodes[1]][link.nodes[0]] = link
 
-    def run(self) -> None:
-        self.placement_algorithm(parameters=self.placement_algorithm_parameters)
+        # Precomputing values that only depend on the scenario's structure
+        compute_scenario_invariants()
+
+    def run(self) -> dict:
+        """Executes the placement algorithm (and the local search post-optimizer, if requested).
+        When the "time_budget" parameter (in seconds) is informed, the algorithms receive the wall-clock "deadline" at which they
+        must stop and return the best placement found so far.
+        Returns:
+            execution_metadata (dict): Information about the execution, including its elapsed time and the reason for stopping.
+        """
+        start_time = time.time()
+
+        parameters = self.placement_algorithm_parameters
+        if parameters.get("time_budget") is not None:
+            parameters = {**parameters, "deadline": start_time + parameters["time_budget"]}
+
+        # Algorithms that do not iterate (e.g., greedy heuristics) always run to completion
+        execution_metadata = {"stop_reason": "completed"}
+        execution_metadata.update(self.placement_algorithm(parameters=parameters) or {})
+
+        # Refining the placement found by the algorithm through local search (if requested)
+        if parameters.get("local_search"):
+            from simulator.strategies.local_search import local_search
+
+            execution_metadata.update(local_search(parameters=parameters))
+
+        execution_metadata["execution_time"] = time.time() - start_time
+
+        return execution_metadata
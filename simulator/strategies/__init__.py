@@ -6,3 +6,6 @@ from .proposed_algorithm import proposed_algorithm
 from .best_fit import best_fit
 from .worst_fit import worst_fit
 from .nsgaii import nsgaii
+from .island_nsgaii import island_nsgaii
+from .local_search import local_search
+from .portfolio import portfolio
@@ -9,11 +9,21 @@ from simulator.helper_methods import *
 def best_fit(parameters={}):
     """Provisions services on the data centers with the least amount of free resources that could accommodate them."""
     for application in Application.all():
-        for service in application.services:
-            data_centers = sorted(DataCenter.all(), key=lambda data_center: data_center.capacity - data_center.demand)
+        provision_application(application=application)
 
-            for data_center in data_centers:
-                # Checking if the data center would have resources to host the service
-                if data_center.demand + service.demand <= data_center.capacity:
-                    provision_service(data_center=data_center, service=service, user=service.application.user)
-                    break
+
+def provision_application(application: object):
+    """Provisions the services of an application on the data centers with the least amount of free resources that could
+    accommodate them.
+
+    Args:
+        application (object): Application to be provisioned.
+    """
+    for service in application.services:
+        data_centers = sorted(DataCenter.all(), key=lambda data_center: data_center.capacity - data_center.demand)
+
+        for data_center in data_centers:
+            # Checking if the data center would have resources to host the service
+            if data_center.demand + service.demand <= data_center.capacity:
+                provision_service(data_center=data_center, service=service, user=service.application.user)
+                break
@@ -0,0 +1,368 @@
+# Importing simulator components
+from simulator.simulator import Simulator
+from simulator.components.data_center import DataCenter
+from simulator.components.service import Service
+
+# Importing helper methods
+from simulator.helper_methods import *
+
+# Importing NSGA-II building blocks
+from simulator.strategies.nsgaii import (
+    PlacementProblem,
+    PlacementTermination,
+    FitnessCache,
+    generate_initial_population,
+    select_best_solution,
+)
+
+# Importing the archive of evaluated chromosomes
+from simulator.archive import ChromosomeArchive
+
+# Importing Pymoo components
+from pymoo.core.population import Population
+from pymoo.factory import get_crossover, get_mutation
+from pymoo.algorithms.moo.nsga2 import NSGA2
+from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
+
+# Importing Python libraries
+import multiprocessing as mp
+import numpy as np
+from queue import Empty
+from random import seed
+import time
+import glob
+import os
+
+
+# Time (in seconds) granted to island processes to exit once their solutions were gathered before they are terminated
+ISLAND_JOIN_TIMEOUT = 30
+
+
+class QueueMigration:
+    """Exchanges migrants among islands running on the same host through multiprocessing queues (ring topology)."""
+
+    def __init__(self, inbox: object, outbox: object) -> object:
+        """Creates a QueueMigration object.
+        Args:
+            inbox (object): Queue from which the island receives migrants.
+            outbox (object): Queue to which the island sends migrants.
+        Returns:
+            object: Created QueueMigration object.
+        """
+        self.inbox = inbox
+        self.outbox = outbox
+
+    def emigrate(self, generation: int, migrants: object):
+        """Sends a set of chromosomes to the neighbor island.
+        Args:
+            generation (int): Current generation of the island.
+            migrants (object): Chromosomes that will migrate.
+        """
+        self.outbox.put(migrants)
+
+    def immigrate(self, generation: int) -> list:
+        """Collects the chromosomes sent by the neighbor island since the last migration.
+        Args:
+            generation (int): Current generation of the island.
+        Returns:
+            immigrants (list): List of chromosome arrays received.
+        """
+        immigrants = []
+        while True:
+            try:
+                immigrants.append(self.inbox.get_nowait())
+            except Empty:
+                break
+
+        return immigrants
+
+    def close(self):
+        """Stops exchanging migrants. Islands may stop at different generations, so migrants sent to a neighbor that already
+        stopped are never read. Pending migrants are thus drained from the inbox and discarded from the outbox, as otherwise the
+        processes would block at exit while flushing them into the queues.
+        """
+        self.immigrate(generation=None)
+        self.outbox.cancel_join_thread()
+
+
+class DirectoryMigration:
+    """Exchanges migrants among islands through files in a shared directory (islands may run on different nodes)."""
+
+    def __init__(self, directory: str, island_id: int, neighbor_id: int) -> object:
+        """Creates a DirectoryMigration object.
+        Args:
+            directory (str): Shared directory used to exchange migrants.
+            island_id (int): ID of the island that owns the object.
+            neighbor_id (int): ID of the island from which migrants are received.
+        Returns:
+            object: Created DirectoryMigration object.
+        """
+        self.directory = directory
+        self.island_id = island_id
+        self.neighbor_id = neighbor_id
+
+        # Set of migration files already consumed by the island
+        self.consumed = set()
+
+    def emigrate(self, generation: int, migrants: object):
+        """Writes a set of chromosomes to the shared directory (files are renamed atomically once fully written).
+        Args:
+            generation (int): Current generation of the island.
+            migrants (object): Chromosomes that will migrate.
+        """
+        file_name = f"{self.directory}/island-{self.island_id}-gen-{generation}.npy"
+        with open(f"{file_name}.tmp", "wb") as file:
+            np.save(file, migrants)
+        os.replace(f"{file_name}.tmp", file_name)
+
+    def immigrate(self, generation: int) -> list:
+        """Reads the chromosomes written by the neighbor island that were not consumed yet.
+        Args:
+            generation (int): Current generation of the island.
+        Returns:
+            immigrants (list): List of chromosome arrays received.
+        """
+        immigrants = []
+        for file_name in sorted(glob.glob(f"{self.directory}/island-{self.neighbor_id}-gen-*.npy")):
+            if file_name not in self.consumed:
+                immigrants.append(np.load(file_name))
+                self.consumed.add(file_name)
+
+        return immigrants
+
+    def close(self):
+        """Stops exchanging migrants (migration files are kept in the shared directory)."""
+        pass
+
+
+def incorporate_immigrants(algorithm: object, immigrants: object):
+    """Evaluates a set of immigrants and lets them compete with the island's population for survival.
+    Args:
+        algorithm (object): NSGA-II algorithm running on the island.
+        immigrants (object): Chromosomes received from other islands.
+    """
+    immigrants = Population.new(X=immigrants)
+
+    # Discarding immigrants that are already part of the island's population
+    immigrants = algorithm.eliminate_duplicates.do(immigrants, algorithm.pop)
+    if len(immigrants) == 0:
+        return
+
+    algorithm.evaluator.eval(algorithm.problem, immigrants, algorithm=algorithm)
+
+    merged_population = Population.merge(algorithm.pop, immigrants)
+    algorithm.pop = algorithm.survival.do(algorithm.problem, merged_population, n_survive=algorithm.pop_size)
+
+
+def run_island(island_id: int, input_file: str, parameters: dict, migration: object) -> tuple:
+    """Runs an NSGA-II population that periodically exchanges elite chromosomes with its neighbor island.
+    Args:
+        island_id (int): Island ID.
+        input_file (str): Dataset used to rebuild the scenario when the island runs in a fresh interpreter.
+        parameters (dict): Algorithm parameters.
+        migration (object): Object responsible for sending and receiving migrants.
+    Returns:
+        front (tuple): Chromosomes, fitness scores and constraint violations of the island's final solutions and why it stopped.
+    """
+    # Rebuilding the simulation scenario if the island does not share the memory of the process that launched it
+    if Service.count() == 0:
+        Simulator().initialize(input_file=input_file)
+
+    # Each island explores the search space with a different random stream
+    seed(parameters.get("seed", 1) + island_id)
+
+    pop_size = parameters["pop_size"]
+    migration_interval = parameters.get("migration_interval", 10)
+    n_migrants = parameters.get("n_migrants", 5)
+    fitness_cache_size = parameters.get("fitness_cache_size", 0)
+
+    algorithm = NSGA2(
+        pop_size=pop_size,
+        sampling=np.array(generate_initial_population(pop_size=pop_size, warm_start=parameters.get("warm_start", 0))),
+        crossover=get_crossover("int_ux", prob=parameters["cross_prob"]),
+        mutation=get_mutation("int_pm", prob=parameters["mut_prob"]),
+        eliminate_duplicates=True,
+    )
+
+    fitness_cache = FitnessCache(max_memory=fitness_cache_size) if fitness_cache_size > 0 else None
+
+    # Each island stores the chromosomes it evaluates in its own archive
+    archive_dir = parameters.get("archive_dir")
+    archive = None
+    if archive_dir:
+        archive = ChromosomeArchive(directory=f"{archive_dir}/island-{island_id}", n_data_centers=DataCenter.count())
+
+    problem = PlacementProblem(fitness_cache=fitness_cache, archive=archive, constraint=parameters.get("constraint", "count"))
+    termination = PlacementTermination(
+        n_gen=parameters["n_gen"],
+        deadline=parameters.get("deadline"),
+        stagnation_window=parameters.get("stagnation_window", 0),
+        hv_window=parameters.get("hv_window", 0),
+        hv_tol=parameters.get("hv_tol", 0.001),
+    )
+    algorithm.setup(problem, termination=termination, seed=parameters.get("seed", 1) + island_id, verbose=False)
+
+    while algorithm.has_next():
+        algorithm.next()
+
+        if algorithm.n_gen % migration_interval == 0 and algorithm.has_next():
+            # Surviving populations are sorted by rank and crowding distance, so the first chromosomes are the island's elite
+            migration.emigrate(generation=algorithm.n_gen, migrants=algorithm.pop.get("X")[:n_migrants].astype(int))
+
+            for immigrants in migration.immigrate(generation=algorithm.n_gen):
+                incorporate_immigrants(algorithm=algorithm, immigrants=immigrants)
+
+    migration.close()
+
+    if archive is not None:
+        archive.close()
+
+    X, F, CV = algorithm.pop.get("X", "F", "CV")
+    front = (X.astype(int), F, CV, termination.stop_reason)
+
+    return front
+
+
+def island_worker(island_id: int, input_file: str, parameters: dict, migration: object, results: object):
+    """Entry point of the processes that run the islands.
+    Args:
+        island_id (int): Island ID.
+        input_file (str): Dataset used to rebuild the scenario when the island runs in a fresh interpreter.
+        parameters (dict): Algorithm parameters.
+        migration (object): Object responsible for sending and receiving migrants.
+        results (object): Queue that receives the island's final solutions (None when results are written to a directory).
+    """
+    X, F, CV, stop_reason = run_island(island_id=island_id, input_file=input_file, parameters=parameters, migration=migration)
+
+    if results is not None:
+        results.put((island_id, X, F, CV, stop_reason))
+    else:
+        file_name = f"{parameters['migration_dir']}/island-{island_id}-final.npz"
+        with open(f"{file_name}.tmp", "wb") as file:
+            np.savez(file, X=X, F=F, CV=CV, stop_reason=stop_reason)
+        os.replace(f"{file_name}.tmp", file_name)
+
+
+def merge_fronts(X: object, F: object, CV: object) -> tuple:
+    """Merges the solutions found by all islands into a global Pareto front.
+    Args:
+        X (object): Chromosomes of the solutions.
+        F (object): Fitness scores of the solutions.
+        CV (object): Constraint violations of the solutions.
+    Returns:
+        front (tuple): Chromosomes, fitness scores and constraint violations of the non-dominated solutions.
+    """
+    # Only the least infeasible solutions are considered when no island found a feasible placement
+    candidates = np.where(CV[:, 0] <= 0)[0]
+    if len(candidates) == 0:
+        candidates = np.where(CV[:, 0] == CV[:, 0].min())[0]
+
+    # Removing duplicated chromosomes found by different islands
+    _, unique_indices = np.unique(X[candidates], axis=0, return_index=True)
+    candidates = candidates[np.sort(unique_indices)]
+
+    non_dominated = candidates[NonDominatedSorting().do(F[candidates], only_non_dominated_front=True)]
+    front = (X[non_dominated], F[non_dominated], CV[non_dominated])
+
+    return front
+
+
+def island_nsgaii(parameters: dict = {}) -> dict:
+    """Island-model NSGA-II that runs several populations in separate processes with periodic migration of elite chromosomes.
+
+    Besides the regular NSGA-II parameters, the algorithm accepts:
+        - n_islands: overall number of islands. Defaults to the number of CPU cores.
+        - migration_interval: number of generations between migrations. Defaults to 10.
+        - n_migrants: number of elite chromosomes sent in each migration. Defaults to 5.
+        - migration_dir: shared directory used to exchange migrants (a fresh directory must be used for each run).
+          Islands use local queues when it is not informed.
+        - island_ids: islands executed by this process when islands are split among nodes sharing "migration_dir".
+          Defaults to all islands.
+        - deadline: time (as in "time.time()") at which every island stops and returns its current population.
+        - seed: seed of the islands (each island adds its ID to it, so that islands explore different random streams). Defaults to 1.
+
+    Args:
+        parameters (dict, optional): Algorithm parameters. Defaults to {}.
+
+    Returns:
+        dict: Information about the execution (reason why the islands stopped).
+    """
+    print(parameters)
+    n_islands = parameters.get("n_islands", os.cpu_count())
+    migration_dir = parameters.get("migration_dir")
+    island_ids = parameters.get("island_ids", list(range(n_islands)))
+    input_file = Simulator.last().input_file
+
+    processes = []
+    results = None
+
+    if migration_dir is None:
+        # Connecting islands in a ring topology through local queues
+        results = mp.Queue()
+        queues = [mp.Queue() for _ in range(n_islands)]
+        migrations = [QueueMigration(inbox=queues[i], outbox=queues[(i + 1) % n_islands]) for i in range(n_islands)]
+    else:
+        os.makedirs(migration_dir, exist_ok=True)
+        migrations = [
+            DirectoryMigration(directory=migration_dir, island_id=i, neighbor_id=(i - 1) % n_islands) for i in range(n_islands)
+        ]
+
+    for island_id in island_ids:
+        process = mp.Process(
+            target=island_worker,
+            kwargs={
+                "island_id": island_id,
+                "input_file": input_file,
+                "parameters": parameters,
+                "migration": migrations[island_id],
+                "results": results,
+            },
+        )
+        process.start()
+        processes.append(process)
+
+    # Gathering the final solutions found by each island
+    fronts = []
+    if results is not None:
+        # Polling the results queue so that islands that die before reporting their solutions do not block the execution
+        while len(fronts) < len(processes):
+            try:
+                fronts.append(results.get(timeout=1))
+            except Empty:
+                if any(not process.is_alive() and process.exitcode != 0 for process in processes):
+                    raise Exception("An island executed by this process failed.")
+    else:
+        # Waiting for the islands running on every node that shares the migration directory
+        while len(glob.glob(f"{migration_dir}/island-*-final.npz")) < n_islands:
+            if any(not process.is_alive() and process.exitcode != 0 for process in processes):
+                raise Exception("An island executed by this process failed.")
+            time.sleep(1)
+
+        for island_id in range(n_islands):
+            with np.load(f"{migration_dir}/island-{island_id}-final.npz") as data:
+                fronts.append((island_id, data["X"], data["F"], data["CV"], str(data["stop_reason"])))
+
+    # Islands that do not exit in time (e.g., blocked on a migration queue) are terminated, as their solutions were already gathered
+    for process in processes:
+        process.join(timeout=ISLAND_JOIN_TIMEOUT)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+    # Merging the solutions found by all islands into a global Pareto front
+    X, F, CV = merge_fronts(
+        X=np.concatenate([front[1] for front in fronts]),
+        F=np.concatenate([front[2] for front in fronts]),
+        CV=np.concatenate([front[3] for front in fronts]),
+    )
+    print(f"Global Pareto front: {len(X)} solutions merged from {len(fronts)} islands")
+
+    # Applying the a placement scheme found by the island-model NSGA-II algorithm
+    best_solution = select_best_solution(X=X, F=F, CV=CV)
+    apply_placement(solution=best_solution)
+
+    # The execution is reported as cut short by the time budget if any island was
+    stop_reasons = [front[4] for front in fronts]
+    execution_metadata = {"stop_reason": "time_budget" if "time_budget" in stop_reasons else stop_reasons[0]}
+
+    return execution_metadata
@@ -0,0 +1,341 @@
+# Importing simulator components
+from simulator.components.data_center import DataCenter
+from simulator.components.service import Service
+
+# Importing helper methods
+from simulator.helper_methods import *
+
+# Importing the scenario arrays used by the vectorized evaluator
+from simulator.shared_scenario import get_scenario_arrays
+
+# Importing the communication chain helpers of the proposed heuristic
+from simulator.strategies.proposed_algorithm import get_previous_region
+
+# Importing Python libraries
+import numpy as np
+import random
+import math
+import time
+
+# Weight of each overloaded data center in the fitness function (larger than the maximum sum of the normalized objectives)
+OVERLOAD_PENALTY = 1000
+
+# Local search methods
+LOCAL_SEARCH_METHODS = ["tabu", "annealing"]
+
+
+class MoveEvaluator:
+    """Keeps track of the metrics of a placement scheme and updates them incrementally as services are moved."""
+
+    def __init__(self, arrays: dict, assignment: object) -> object:
+        """Creates a MoveEvaluator object.
+        Args:
+            arrays (dict): Scenario arrays (see "simulator.vectorized.compile_scenario").
+            assignment (object): Index of the data center that hosts each service.
+        Returns:
+            object: Created MoveEvaluator object.
+        """
+        self.arrays = arrays
+        self.assignment = np.array(assignment, dtype=np.int64)
+
+        self.n_users = len(arrays["user_region"])
+        self.max_allocation_cost_possible = float(arrays["max_allocation_cost_possible"])
+
+        # Services of each user, following the order of the application's communication chain
+        next_service = {previous: service for service, previous in enumerate(arrays["service_previous"].tolist()) if previous >= 0}
+        self.user_services = [[] for _ in range(self.n_users)]
+        for service, previous in enumerate(arrays["service_previous"].tolist()):
+            if previous < 0:
+                chain = self.user_services[arrays["service_user"][service]]
+                while service is not None:
+                    chain.append(service)
+                    service = next_service.get(service)
+
+        # Metrics of the current placement
+        self.demands = np.bincount(self.assignment, weights=arrays["service_demand"], minlength=len(arrays["data_center_capacity"]))
+        self.user_delays = np.array([self.calculate_user_delay(user=user) for user in range(self.n_users)])
+        self.cost = float(arrays["service_cost"][np.arange(len(self.assignment)), self.assignment].sum())
+        self.overloaded_data_centers = int((self.demands > arrays["data_center_capacity"]).sum())
+        self.sla_violations = int((self.user_delays > arrays["user_delay_sla"]).sum())
+
+    def calculate_user_delay(self, user: int) -> float:
+        """Calculates the delay of a user based on the current assignment of its services.
+        Args:
+            user (int): User index.
+        Returns:
+            delay (float): User delay.
+        """
+        region_delays = self.arrays["region_delays"]
+        data_center_region = self.arrays["data_center_region"]
+
+        delay = 0
+        previous_region = self.arrays["user_region"][user]
+        for service in self.user_services[user]:
+            region = data_center_region[self.assignment[service]]
+            delay += region_delays[previous_region, region]
+            previous_region = region
+
+        return delay
+
+    def fitness(self, overloaded_data_centers: int = None, sla_violations: int = None, cost: float = None) -> float:
+        """Aggregates the placement metrics into a single value (the lower, the better).
+        Args:
+            overloaded_data_centers (int, optional): Number of overloaded data centers. Defaults to the current value.
+            sla_violations (int, optional): Number of SLA violations. Defaults to the current value.
+            cost (float, optional): Overall allocation cost. Defaults to the current value.
+        Returns:
+            fitness (float): Fitness value.
+        """
+        overloaded_data_centers = self.overloaded_data_centers if overloaded_data_centers is None else overloaded_data_centers
+        sla_violations = self.sla_violations if sla_violations is None else sla_violations
+        cost = self.cost if cost is None else cost
+
+        fitness = (
+            overloaded_data_centers * OVERLOAD_PENALTY
+            + sla_violations / self.n_users * 100
+            + cost / self.max_allocation_cost_possible * 100
+        )
+
+        return fitness
+
+    def move(self, service: int, data_center: int) -> float:
+        """Moves a service to another data center, updating the placement metrics incrementally.
+        Args:
+            service (int): Service index.
+            data_center (int): Index of the new host.
+        Returns:
+            fitness (float): Fitness of the placement after the move.
+        """
+        capacity = self.arrays["data_center_capacity"]
+        demand = self.arrays["service_demand"][service]
+        current_data_center = self.assignment[service]
+
+        if current_data_center == data_center:
+            return self.fitness()
+
+        # Updating the allocation cost
+        self.cost += self.arrays["service_cost"][service, data_center] - self.arrays["service_cost"][service, current_data_center]
+
+        # Updating the demand of the previous and new hosts
+        for host, variation in [(current_data_center, -demand), (data_center, demand)]:
+            was_overloaded = self.demands[host] > capacity[host]
+            self.demands[host] += variation
+            self.overloaded_data_centers += int(self.demands[host] > capacity[host]) - int(was_overloaded)
+
+        self.assignment[service] = data_center
+
+        # Updating the delay of the user that accesses the service
+        user = self.arrays["service_user"][service]
+        delay_sla = self.arrays["user_delay_sla"][user]
+        was_violated = self.user_delays[user] > delay_sla
+        self.user_delays[user] = self.calculate_user_delay(user=user)
+        self.sla_violations += int(self.user_delays[user] > delay_sla) - int(was_violated)
+
+        return self.fitness()
+
+    def evaluate_move(self, service: int, data_center: int) -> float:
+        """Calculates the fitness a placement would have after moving a service, without changing the placement.
+        Args:
+            service (int): Service index.
+            data_center (int): Index of the new host.
+        Returns:
+            fitness (float): Fitness of the placement after the move.
+        """
+        current_data_center = self.assignment[service]
+        fitness = self.move(service=service, data_center=data_center)
+        self.move(service=service, data_center=current_data_center)
+
+        return fitness
+
+    def swap(self, service_1: int, service_2: int) -> float:
+        """Swaps the hosts of two services.
+        Args:
+            service_1 (int): Index of the first service.
+            service_2 (int): Index of the second service.
+        Returns:
+            fitness (float): Fitness of the placement after the swap.
+        """
+        data_center_1 = self.assignment[service_1]
+        self.move(service=service_1, data_center=self.assignment[service_2])
+
+        return self.move(service=service_2, data_center=data_center_1)
+
+
+def tabu_search(evaluator: object, deadline: float, tabu_tenure: int = 10, neighborhood_size: int = 500) -> tuple:
+    """Tabu search over single-service moves and swaps of service hosts.
+    Args:
+        evaluator (object): Move evaluator initialized with the starting placement.
+        deadline (float): Time (as in "time.time()") at which the search stops.
+        tabu_tenure (int, optional): Number of iterations during which a service cannot return to the host it left. Defaults to 10.
+        neighborhood_size (int, optional): Number of moves sampled in each iteration. Defaults to 500.
+    Returns:
+        best (tuple): Best assignment found and its fitness.
+    """
+    n_services = len(evaluator.assignment)
+    n_data_centers = len(evaluator.arrays["data_center_capacity"])
+
+    best_assignment = evaluator.assignment.copy()
+    best_fitness = evaluator.fitness()
+
+    # Tabu list (service, data center) -> iteration until which the service cannot be moved back to the data center
+    tabu = {}
+    iteration = 0
+
+    while time.time() < deadline:
+        iteration += 1
+        best_move = None
+        best_move_fitness = float("inf")
+
+        for _ in range(neighborhood_size):
+            if random.random() < 0.8:
+                move = ("move", random.randrange(n_services), random.randrange(n_data_centers))
+                if evaluator.assignment[move[1]] == move[2]:
+                    continue
+                fitness = evaluator.evaluate_move(service=move[1], data_center=move[2])
+                is_tabu = tabu.get((move[1], move[2]), 0) >= iteration
+            else:
+                move = ("swap", random.randrange(n_services), random.randrange(n_services))
+                if evaluator.assignment[move[1]] == evaluator.assignment[move[2]]:
+                    continue
+                fitness = evaluator.swap(service_1=move[1], service_2=move[2])
+                evaluator.swap(service_1=move[1], service_2=move[2])
+                is_tabu = (
+                    tabu.get((move[1], evaluator.assignment[move[2]]), 0) >= iteration
+                    or tabu.get((move[2], evaluator.assignment[move[1]]), 0) >= iteration
+                )
+
+            # Tabu moves are only accepted if they lead to a new best solution (aspiration criterion)
+            if fitness < best_move_fitness and (not is_tabu or fitness < best_fitness):
+                best_move = move
+                best_move_fitness = fitness
+
+        if best_move is None:
+            continue
+
+        # Forbidding the moved services from returning to the hosts they left for a while
+        if best_move[0] == "move":
+            tabu[(best_move[1], evaluator.assignment[best_move[1]])] = iteration + tabu_tenure
+            evaluator.move(service=best_move[1], data_center=best_move[2])
+        else:
+            tabu[(best_move[1], evaluator.assignment[best_move[1]])] = iteration + tabu_tenure
+            tabu[(best_move[2], evaluator.assignment[best_move[2]])] = iteration + tabu_tenure
+            evaluator.swap(service_1=best_move[1], service_2=best_move[2])
+
+        if best_move_fitness < best_fitness:
+            best_assignment = evaluator.assignment.copy()
+            best_fitness = best_move_fitness
+
+    return best_assignment, best_fitness
+
+
+def simulated_annealing(evaluator: object, deadline: float, initial_temperature: float = 10, cooling_rate: float = 0.9995) -> tuple:
+    """Simulated annealing over single-service moves and swaps of service hosts.
+    Args:
+        evaluator (object): Move evaluator initialized with the starting placement.
+        deadline (float): Time (as in "time.time()") at which the search stops.
+        initial_temperature (float, optional): Initial temperature. Defaults to 10.
+        cooling_rate (float, optional): Factor applied to the temperature after each iteration. Defaults to 0.9995.
+    Returns:
+        best (tuple): Best assignment found and its fitness.
+    """
+    n_services = len(evaluator.assignment)
+    n_data_centers = len(evaluator.arrays["data_center_capacity"])
+
+    current_fitness = evaluator.fitness()
+    best_assignment = evaluator.assignment.copy()
+    best_fitness = current_fitness
+    temperature = initial_temperature
+
+    while time.time() < deadline:
+        # Checking the deadline in blocks of iterations to keep the overhead of reading the clock low
+        for _ in range(100):
+            if random.random() < 0.8:
+                service = random.randrange(n_services)
+                previous_data_center = evaluator.assignment[service]
+                fitness = evaluator.move(service=service, data_center=random.randrange(n_data_centers))
+                undo = (evaluator.move, {"service": service, "data_center": previous_data_center})
+            else:
+                service_1, service_2 = random.randrange(n_services), random.randrange(n_services)
+                fitness = evaluator.swap(service_1=service_1, service_2=service_2)
+                undo = (evaluator.swap, {"service_1": service_1, "service_2": service_2})
+
+            # Accepting improving moves and, with a probability that decreases over time, worsening moves
+            if fitness <= current_fitness or random.random() < math.exp((current_fitness - fitness) / max(temperature, 1e-9)):
+                current_fitness = fitness
+                if fitness < best_fitness:
+                    best_assignment = evaluator.assignment.copy()
+                    best_fitness = fitness
+            else:
+                undo[0](**undo[1])
+
+            temperature *= cooling_rate
+
+    return best_assignment, best_fitness
+
+
+def local_search(parameters: dict = {}) -> dict:
+    """Refines the placement currently applied (e.g., by a heuristic) through local search within a wall-clock budget.
+
+    Parameters:
+        - local_search: search method ("tabu" or "annealing"). Defaults to "tabu".
+        - local_search_time: time budget (in seconds). Defaults to 10.
+        - deadline: time (as in "time.time()") at which the overall execution must stop, cutting the search short if needed.
+
+    Args:
+        parameters (dict, optional): Algorithm parameters. Defaults to {}.
+
+    Returns:
+        dict: Information about the execution (fitness before and after the search and the reason for stopping).
+    """
+    method = parameters.get("local_search", "tabu")
+    deadline = time.time() + parameters.get("local_search_time", 10)
+
+    # Validating the method before the scenario is changed by the provisioning of unplaced services
+    if method not in LOCAL_SEARCH_METHODS:
+        raise Exception(f"Unknown local search method: {method}. Valid options: {LOCAL_SEARCH_METHODS}.")
+
+    # The overall time budget takes precedence over the local search's own budget
+    stop_reason = "local_search_time"
+    if parameters.get("deadline") is not None and parameters["deadline"] < deadline:
+        deadline = parameters["deadline"]
+        stop_reason = "time_budget"
+
+    arrays = get_scenario_arrays()
+    data_centers = DataCenter.all()
+    data_center_indices = {data_center: index for index, data_center in enumerate(data_centers)}
+
+    # Services left unplaced by the previous strategy start on the data center with the largest amount of free resources among
+    # the ones within their users' delay SLA that can host them (or among every data center, when none of those can host them)
+    services = [Service.find_by_id(service_id) for service_id in range(1, Service.count() + 1)]
+    for service in services:
+        if service.data_center is None:
+            reachable_data_centers = get_reachable_data_centers(
+                origin_region=get_previous_region(service=service), delay_sla=service.application.user.delay_sla
+            )
+            candidates = [
+                data_center for data_center in reachable_data_centers if data_center.capacity >= data_center.demand + service.demand
+            ]
+            data_center = max(candidates or data_centers, key=lambda data_center: data_center.capacity - data_center.demand)
+            provision_service(user=service.application.user, service=service, data_center=data_center)
+
+    evaluator = MoveEvaluator(arrays=arrays, assignment=[data_center_indices[service.data_center] for service in services])
+    initial_fitness = evaluator.fitness()
+
+    if method == "tabu":
+        best_assignment, best_fitness = tabu_search(evaluator=evaluator, deadline=deadline)
+    else:
+        best_assignment, best_fitness = simulated_annealing(evaluator=evaluator, deadline=deadline)
+
+    print(f"Local search ({method}): fitness {round(initial_fitness, 4)} -> {round(best_fitness, 4)}")
+
+    # Applying the best placement scheme found
+    reset_scenario()
+    apply_placement(solution=[data_centers[index].id for index in best_assignment])
+
+    execution_metadata = {
+        "local_search_initial_fitness": initial_fitness,
+        "local_search_fitness": best_fitness,
+        "local_search_stop_reason": stop_reason,
+    }
+
+    return execution_metadata
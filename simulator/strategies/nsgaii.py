@@ -5,20 +5,44 @@ from simulator.components.service import Service
 # Importing helper methods
 from simulator.helper_methods import *
 
+# Importing the archive of evaluated chromosomes
+from simulator.archive import ChromosomeArchive
+
+# Importing the instrumentation registry
+from simulator import instrumentation
+
+# Importing the scenario arrays of the vectorized evaluator and the NumPy backend
+from simulator.shared_scenario import get_scenario_arrays
+from simulator.strategies.numpy_nsgaii import NumpyNSGA2
+
+# Importing the heuristics used to warm-start the NSGA-II's population
+from simulator.strategies.proposed_algorithm import proposed_algorithm
+from simulator.strategies.best_fit import best_fit
+from simulator.strategies.worst_fit import worst_fit
+
 # Importing Pymoo components
+from pymoo.core.callback import Callback
+from pymoo.core.termination import Termination
 from pymoo.util.display import Display
 from pymoo.core.problem import Problem
 from pymoo.optimize import minimize
-from pymoo.factory import get_crossover, get_mutation
+from pymoo.factory import get_crossover, get_mutation, get_performance_indicator
 from pymoo.algorithms.moo.nsga2 import NSGA2
 
 # Importing Python libraries
 import numpy as np
-from random import sample
+from collections import OrderedDict
+from random import sample, choice, random
+import time
+import sys
 
 # Variable that defines the NSGA-II algorithm's verbosity
 VERBOSE = True
 
+# Implementations of the NSGA-II algorithm ("pymoo" evaluates chromosomes one by one on the scenario objects, whereas "numpy"
+# evolves integer matrices scored in batches by the vectorized evaluator)
+BACKENDS = ["pymoo", "numpy"]
+
 
 def random_fit() -> list:
     """Custom algorithm that generates random placement solutions.
@@ -43,6 +67,211 @@ def random_fit() -> list:
     return placement
 
 
+def generate_heuristic_placements(n_placements: int, mutation_rate: float = 0.05) -> list:
+    """Generates placement solutions from the greedy heuristics and randomized variants of them.
+    Args:
+        n_placements (int): Number of placement solutions.
+        mutation_rate (float, optional): Probability of moving each service when creating variants. Defaults to 0.05.
+    Returns:
+        placements (list): Generated placement solutions.
+    """
+    # Gathering the placements found by each heuristic
+    seeds = []
+    for heuristic in [proposed_algorithm, best_fit, worst_fit]:
+        heuristic(parameters={})
+
+        # Services that the heuristic could not provision are assigned to random data centers able to host them
+        placement = []
+        for service in Service.all():
+            if service.data_center:
+                placement.append(service.data_center.id)
+            else:
+                placement.append(choice([dc for dc in DataCenter.all() if dc.capacity >= service.demand]).id)
+
+        reset_scenario()
+
+        if placement not in seeds:
+            seeds.append(placement)
+
+    placements = seeds[:n_placements]
+
+    # Creating randomized variants of the heuristic placements
+    attempts = 0
+    while len(placements) < n_placements and attempts < n_placements * 100:
+        attempts += 1
+        variant = [gene if random() >= mutation_rate else choice(DataCenter.all()).id for gene in choice(seeds)]
+        if variant not in placements:
+            placements.append(variant)
+
+    return placements
+
+
+def generate_initial_population(pop_size: int, warm_start: float = 0) -> list:
+    """Generates a set of distinct placement solutions used as the NSGA-II's initial population.
+    Args:
+        pop_size (int): Number of chromosomes in the population.
+        warm_start (float, optional): Fraction of the population seeded with heuristic placements. Defaults to 0.
+    Returns:
+        initial_population (list): Generated placement solutions.
+    """
+    initial_population = generate_heuristic_placements(n_placements=round(pop_size * warm_start)) if warm_start > 0 else []
+
+    while len(initial_population) < pop_size:
+        placement = random_fit()
+        if placement not in initial_population:
+            initial_population.append(placement)
+
+    return initial_population
+
+
+class ConvergenceTracker(Callback):
+    """Records the quality of the best feasible solution found by the NSGA-II algorithm after each generation."""
+
+    def __init__(self) -> None:
+        """Initializes the callback."""
+        super().__init__()
+
+        # Quality (sum of the normalized objectives, the lower the better) of the best feasible solution after each generation
+        self.history = []
+
+    def notify(self, algorithm: object):
+        """Stores the quality of the best feasible solution within the current population.
+        Args:
+            algorithm (object): Algorithm being executed.
+        """
+        F, CV = algorithm.pop.get("F", "CV")
+        self.record(F=F, CV=CV)
+
+    def record(self, F: object, CV: object):
+        """Stores the quality of the best feasible solution within a population.
+        Args:
+            F (object): Fitness scores of the population.
+            CV (object): Constraint violations of the population.
+        """
+        feasible = CV[:, 0] <= 0
+        self.history.append(float(F[feasible].sum(axis=1).min()) if feasible.any() else float("inf"))
+
+    def generations_to_target(self, target_quality: float) -> int:
+        """Finds the first generation in which the best feasible solution reached a target quality.
+        Args:
+            target_quality (float): Target quality (sum of the normalized objectives).
+        Returns:
+            generation (int): Generation number (or None if the target was not reached).
+        """
+        return next((generation for generation, quality in enumerate(self.history, 1) if quality <= target_quality), None)
+
+    def generations_to_feasible(self) -> int:
+        """Finds the first generation in which the population had a feasible solution.
+        Returns:
+            generation (int): Generation number (or None if no feasible solution was found).
+        """
+        return next((generation for generation, quality in enumerate(self.history, 1) if quality < float("inf")), None)
+
+
+class PlacementTermination(Termination):
+    """Stops the NSGA-II algorithm after a number of generations, once a wall-clock deadline is reached, or once it converges."""
+
+    def __init__(
+        self, n_gen: int, deadline: float = None, stagnation_window: int = 0, hv_window: int = 0, hv_tol: float = 0.001
+    ) -> None:
+        """Initializes the termination criterion.
+        Args:
+            n_gen (int): Maximum number of generations.
+            deadline (float, optional): Time (as in "time.time()") at which the algorithm stops. Defaults to None.
+            stagnation_window (int, optional): Generations without improving the best feasible solution. Defaults to 0 (disabled).
+            hv_window (int, optional): Generations over which the hypervolume improvement is measured. Defaults to 0 (disabled).
+            hv_tol (float, optional): Relative hypervolume improvement below which the algorithm stops. Defaults to 0.001.
+        """
+        super().__init__()
+        self.n_gen = n_gen
+        self.deadline = deadline
+        self.stagnation_window = stagnation_window
+        self.hv_window = hv_window
+        self.hv_tol = hv_tol
+
+        # Quality of the best feasible solution found so far and generation in which it was found
+        self.best_quality = float("inf")
+        self.best_quality_generation = 0
+
+        # Hypervolume of the feasible solutions after each generation (both objectives are normalized between 0 and 100)
+        self.hypervolumes = []
+        self.hv_indicator = get_performance_indicator("hv", ref_point=np.array([100.0, 100.0])) if hv_window > 0 else None
+
+        # Reason why the algorithm stopped (None while it is running)
+        self.stop_reason = None
+
+    def _do_continue(self, algorithm: object) -> bool:
+        """Checks whether the algorithm should run another generation.
+        Args:
+            algorithm (object): Algorithm being executed.
+        Returns:
+            bool: Whether the algorithm should continue.
+        """
+        if self.stagnation_window > 0 or self.hv_window > 0:
+            F, CV = algorithm.pop.get("F", "CV")
+            self.update_convergence_history(generation=algorithm.n_gen, F=F, CV=CV)
+
+        return self.should_continue(generation=algorithm.n_gen)
+
+    def should_continue(self, generation: int) -> bool:
+        """Checks the stopping conditions after a given generation, recording the reason why the algorithm stops.
+        Args:
+            generation (int): Current generation.
+        Returns:
+            bool: Whether the algorithm should continue.
+        """
+        if generation >= self.n_gen:
+            self.stop_reason = "max_generations"
+        elif self.deadline is not None and time.time() >= self.deadline:
+            self.stop_reason = "time_budget"
+        elif self.stagnation_window > 0 and self.has_stagnated(generation=generation):
+            self.stop_reason = "stagnation"
+        elif self.hv_window > 0 and self.has_hypervolume_stagnated():
+            self.stop_reason = "hypervolume_stagnation"
+
+        return self.stop_reason is None
+
+    def update_convergence_history(self, generation: int, F: object, CV: object):
+        """Records the convergence indicators of the current population.
+        Args:
+            generation (int): Current generation.
+            F (object): Fitness scores of the population.
+            CV (object): Constraint violations of the population.
+        """
+        if self.stagnation_window == 0 and self.hv_window == 0:
+            return
+
+        feasible_F = F[CV[:, 0] <= 0]
+
+        if len(feasible_F) > 0 and feasible_F.sum(axis=1).min() < self.best_quality:
+            self.best_quality = float(feasible_F.sum(axis=1).min())
+            self.best_quality_generation = generation
+
+        if self.hv_indicator is not None:
+            self.hypervolumes.append(float(self.hv_indicator.do(feasible_F)) if len(feasible_F) > 0 else 0)
+
+    def has_stagnated(self, generation: int) -> bool:
+        """Checks whether the best feasible solution has not improved during the stagnation window.
+        Args:
+            generation (int): Current generation.
+        Returns:
+            bool: Whether the algorithm has stagnated.
+        """
+        # The algorithm keeps searching while it has not found any feasible solution
+        return self.best_quality < float("inf") and generation - self.best_quality_generation >= self.stagnation_window
+
+    def has_hypervolume_stagnated(self) -> bool:
+        """Checks whether the hypervolume of the feasible solutions has not improved significantly within the sliding window.
+        Returns:
+            bool: Whether the hypervolume has stagnated.
+        """
+        if len(self.hypervolumes) <= self.hv_window:
+            return False
+
+        reference = self.hypervolumes[-1 - self.hv_window]
+        return reference > 0 and self.hypervolumes[-1] - reference <= self.hv_tol * reference
+
+
 class TheaDisplay(Display):
     """Creates a visualization on how the genetic algorithm is evolving throughout the generations."""
 
@@ -62,15 +291,138 @@ class TheaDisplay(Display):
 
         self.output.append("SLAV", objective_1)
         self.output.append("Cost", objective_2)
-        self.output.append("Overloaded SVs", overloaded_data_centers)
+        self.output.append("Overloaded SVs" if problem.constraint == "count" else "Overload", overloaded_data_centers)
+
+
+class FitnessCache:
+    """Memoizes the fitness of chromosomes across generations, evicting the least recently used entries when full."""
+
+    # Approximate memory (in bytes) taken by the bookkeeping of each entry (dictionary slot and linked list node)
+    ENTRY_OVERHEAD = 120
+
+    def __init__(self, max_memory: float) -> object:
+        """Creates a FitnessCache object.
+        Args:
+            max_memory (float): Memory bound (in megabytes) for the cached entries.
+        Returns:
+            object: Created FitnessCache object.
+        """
+        self.max_memory = int(max_memory * 1024 * 1024)
+        self.memory = 0
+
+        # Cached entries (packed chromosome bytes -> fitness scores and penalties), ordered from least to most recently used
+        self.entries = OrderedDict()
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Narrowest integer type able to represent the data center IDs, used to pack chromosomes into compact keys
+        self.dtype = np.min_scalar_type(DataCenter.count())
+
+    def key(self, solution: list) -> bytes:
+        """Packs a chromosome into the bytes used as its cache key.
+        Args:
+            solution (list): Placement scheme.
+        Returns:
+            key (bytes): Packed chromosome.
+        """
+        return np.asarray(solution).astype(self.dtype).tobytes()
+
+    def get(self, key: bytes) -> tuple:
+        """Looks up the fitness of a chromosome.
+        Args:
+            key (bytes): Packed chromosome.
+        Returns:
+            output (tuple): Cached fitness scores and penalties (or None if the chromosome is not cached).
+        """
+        output = self.entries.get(key)
+
+        if output is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        return output
+
+    def put(self, key: bytes, output: tuple):
+        """Stores the fitness of a chromosome, evicting the least recently used entries if the memory bound is exceeded.
+        Args:
+            key (bytes): Packed chromosome.
+            output (tuple): Fitness scores and penalties of the chromosome.
+        """
+        if key in self.entries:
+            return
+
+        self.entries[key] = output
+        self.memory += self.entry_size(key=key, output=output)
+
+        while self.memory > self.max_memory and len(self.entries) > 0:
+            evicted_key, evicted_output = self.entries.popitem(last=False)
+            self.memory -= self.entry_size(key=evicted_key, output=evicted_output)
+            self.evictions += 1
+
+    def entry_size(self, key: bytes, output: tuple) -> int:
+        """Estimates the memory taken by a cache entry.
+        Args:
+            key (bytes): Packed chromosome.
+            output (tuple): Fitness scores and penalties of the chromosome.
+        Returns:
+            size (int): Estimated entry size in bytes.
+        """
+        return sys.getsizeof(key) + sys.getsizeof(output) + sys.getsizeof(output[0]) + self.ENTRY_OVERHEAD
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of lookups answered by the cache.
+        Returns:
+            float: Cache hit rate (0.0 to 1.0).
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0
+
+    def statistics(self) -> dict:
+        """Summarizes the cache usage.
+        Returns:
+            dict: Cache statistics.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "memory": self.memory,
+        }
 
 
 class PlacementProblem(Problem):
     """Describes the application placement as an optimization problem."""
 
-    def __init__(self, **kwargs):
-        """Initializes the problem instance."""
-        super().__init__(n_var=Service.count(), n_obj=2, n_constr=1, xl=1, xu=DataCenter.count(), type_var=int, **kwargs)
+    # Ways of expressing the capacity constraint
+    CONSTRAINTS = ["count", "overload", "per_data_center"]
+
+    def __init__(self, fitness_cache: object = None, archive: object = None, constraint: str = "count", **kwargs):
+        """Initializes the problem instance.
+        Args:
+            fitness_cache (object, optional): Cache used to avoid re-evaluating chromosomes seen before. Defaults to None.
+            archive (object, optional): Archive that stores every evaluated chromosome. Defaults to None.
+            constraint (str, optional): Capacity constraint: number of overloaded data centers ("count"), total overload
+                ("overload"), or overload of each data center ("per_data_center"). Defaults to "count".
+        """
+        if constraint not in self.CONSTRAINTS:
+            raise Exception(f"Unknown constraint: {constraint}. Valid options: {self.CONSTRAINTS}.")
+
+        invariants = get_scenario_invariants()
+        n_constr = invariants["data_centers"] if constraint == "per_data_center" else 1
+        super().__init__(
+            n_var=invariants["services"], n_obj=2, n_constr=n_constr, xl=1, xu=invariants["data_centers"], type_var=int, **kwargs
+        )
+        self.fitness_cache = fitness_cache
+        self.archive = archive
+        self.constraint = constraint
 
     def _evaluate(self, x, out, *args, **kwargs):
         """Evaluates solutions according to the problem objectives.
@@ -78,11 +430,29 @@ class PlacementProblem(Problem):
             x (list): Solution or set of solutions that solve the problem.
             out (dict): Output of the evaluation function.
         """
-        output = [self.get_fitness_score_and_constraints(solution=solution) for solution in x]
+        if self.fitness_cache is None:
+            output = [self.get_fitness_score_and_constraints(solution=solution) for solution in x]
+        else:
+            output = []
+            for solution in x:
+                key = self.fitness_cache.key(solution=solution)
+                fitness = self.fitness_cache.get(key=key)
+
+                if fitness is None:
+                    fitness = self.get_fitness_score_and_constraints(solution=solution)
+                    self.fitness_cache.put(key=key, output=fitness)
+
+                output.append(fitness)
 
         out["F"] = np.array([item[0] for item in output])
         out["G"] = np.array([item[1] for item in output])
 
+        if self.archive is not None:
+            # The initial population is archived as generation 0 and offspring as the generation in which they were created
+            algorithm = kwargs.get("algorithm")
+            generation = algorithm.n_gen if algorithm is not None and algorithm.is_initialized else 0
+            self.archive.append(generation=generation, X=x, F=out["F"], G=out["G"])
+
     def get_fitness_score_and_constraints(self, solution: list) -> tuple:
         """Calculates the fitness score and penalties of a solution based on the problem definition.
         Args:
@@ -96,56 +466,176 @@ class PlacementProblem(Problem):
         # Calculating objectives and penalties
         output = evaluate_placement()
 
+        # Graded constraints tell apart data centers slightly overloaded from heavily overloaded ones
+        if self.constraint == "overload":
+            output = (output[0], sum(calculate_data_center_overloads()))
+        elif self.constraint == "per_data_center":
+            output = (output[0], calculate_data_center_overloads())
+
         # Resetting the placement scheme suggested by the chromosome
         reset_scenario()
 
         return output
 
 
-def nsgaii(parameters: dict = {}):
+def select_best_solution(X: object, F: object, CV: object) -> list:
+    """Picks the placement scheme that will be applied out of a set of solutions found by the NSGA-II algorithm.
+    Args:
+        X (object): Chromosomes of the solutions.
+        F (object): Fitness scores of the solutions.
+        CV (object): Constraint violations of the solutions.
+    Returns:
+        best_solution (list): Placement scheme chosen.
+    """
+    # Parsing the NSGA-II's output
+    solutions = []
+    for i in range(len(X)):
+        solution = {
+            "Placement": X[i].tolist(),
+            "SLAV": F[i][0],
+            "COST": F[i][1],
+            "Overloaded DCs": CV[i][0].tolist(),
+        }
+        solutions.append(solution)
+
+    min_and_max = find_minimum_and_maximum(metadata=solutions)
+
+    best_solution = sorted(
+        solutions, key=lambda solution: (solution["Overloaded DCs"], min_and_max["minimum"]["SLAV"] + min_and_max["minimum"]["COST"])
+    )[0]["Placement"]
+
+    return best_solution
+
+
+def nsgaii(parameters: dict = {}) -> dict:
+    """Multi-objective placement based on the NSGA-II algorithm.
+
+    Besides the population size, number of generations, and crossover and mutation probabilities, the algorithm accepts:
+        - backend: NSGA-II implementation ("pymoo" or "numpy", see "BACKENDS"). Defaults to "pymoo".
+        - warm_start: fraction of the initial population seeded with heuristic placements and variants of them. Defaults to 0.
+        - target_quality: sum of the normalized objectives used to report how many generations it took to reach it.
+        - deadline: time (as in "time.time()") at which the algorithm stops and returns its current front.
+        - constraint: capacity constraint ("count", "overload" or "per_data_center", see "PlacementProblem"). Defaults to "count".
+        - stagnation_window: stops after this many generations without improving the best feasible solution. Defaults to 0 (disabled).
+        - hv_window and hv_tol: stops when the hypervolume of the feasible solutions improves less than "hv_tol" (relative) within
+          the last "hv_window" generations. Default to 0 (disabled) and 0.001.
+        - fitness_cache_size: memory bound (in megabytes) of the fitness cache (Pymoo backend only). Defaults to 0 (disabled).
+
+    Args:
+        parameters (dict, optional): Algorithm parameters. Defaults to {}.
+
+    Returns:
+        dict: Information about the execution (e.g., quality of the best feasible solution and reason for stopping).
+    """
     print(parameters)
     # Parsing the NSGA-II parameters
     pop_size = parameters["pop_size"]
     n_gen = parameters["n_gen"]
     cross_prob = parameters["cross_prob"]
     mut_prob = parameters["mut_prob"]
+    backend = parameters.get("backend", "pymoo")
+    constraint = parameters.get("constraint", "count")
+    fitness_cache_size = parameters.get("fitness_cache_size", 0)
+    archive_dir = parameters.get("archive_dir")
+    warm_start = parameters.get("warm_start", 0)
+    target_quality = parameters.get("target_quality")
+    deadline = parameters.get("deadline")
+
+    if backend not in BACKENDS:
+        raise Exception(f"Unknown NSGA-II backend: {backend}. Valid options: {BACKENDS}.")
+    if constraint not in PlacementProblem.CONSTRAINTS:
+        raise Exception(f"Unknown constraint: {constraint}. Valid options: {PlacementProblem.CONSTRAINTS}.")
 
     # Generating initial population for the NSGA-II algorithm
-    initial_population = []
-    while len(initial_population) < pop_size:
-        placement = random_fit()
-        if placement not in initial_population:
-            initial_population.append(placement)
-
-    # Defining the NSGA-II attributes
-    algorithm = NSGA2(
-        pop_size=pop_size,
-        sampling=np.array(initial_population),
-        crossover=get_crossover("int_ux", prob=cross_prob),
-        mutation=get_mutation("int_pm", prob=mut_prob),
-        eliminate_duplicates=True,
+    initial_population = generate_initial_population(pop_size=pop_size, warm_start=warm_start)
+
+    archive = ChromosomeArchive(directory=archive_dir, n_data_centers=DataCenter.count()) if archive_dir else None
+    termination = PlacementTermination(
+        n_gen=n_gen,
+        deadline=deadline,
+        stagnation_window=parameters.get("stagnation_window", 0),
+        hv_window=parameters.get("hv_window", 0),
+        hv_tol=parameters.get("hv_tol", 0.001),
     )
+    convergence_tracker = ConvergenceTracker()
+    execution_metadata = {}
 
     # Running the NSGA-II algorithm
-    problem = PlacementProblem()
-    res = minimize(problem, algorithm, termination=("n_gen", n_gen), seed=1, verbose=VERBOSE, display=TheaDisplay())
-
-    # Parsing the NSGA-II's output
-    solutions = []
-    for i in range(len(res.X)):
-        solution = {
-            "Placement": res.X[i].tolist(),
-            "SLAV": res.F[i][0],
-            "COST": res.F[i][1],
-            "Overloaded DCs": res.CV[i][0].tolist(),
-        }
-        solutions.append(solution)
+    if backend == "numpy":
+        engine = NumpyNSGA2(
+            arrays=get_scenario_arrays(),
+            pop_size=pop_size,
+            cross_prob=cross_prob,
+            mut_prob=mut_prob,
+            constraint=constraint,
+            archive=archive,
+        )
+        engine.initialize(X=initial_population)
+        engine.run(termination=termination, callback=convergence_tracker, verbose=VERBOSE)
+
+        X, F, CV = engine.result()
+        generations = engine.n_gen
+        execution_metadata.update({"evaluation_time": engine.evaluation_time, "operator_time": engine.operator_time})
+
+    else:
+        # Defining the NSGA-II attributes
+        algorithm = NSGA2(
+            pop_size=pop_size,
+            sampling=np.array(initial_population),
+            crossover=get_crossover("int_ux", prob=cross_prob),
+            mutation=get_mutation("int_pm", prob=mut_prob),
+            eliminate_duplicates=True,
+        )
+
+        fitness_cache = FitnessCache(max_memory=fitness_cache_size) if fitness_cache_size > 0 else None
+        if fitness_cache is not None:
+            instrumentation.register_cache(name="fitness_cache", statistics=fitness_cache.statistics)
+        problem = PlacementProblem(fitness_cache=fitness_cache, archive=archive, constraint=constraint)
+        res = minimize(
+            problem,
+            algorithm,
+            termination=termination,
+            seed=1,
+            verbose=VERBOSE,
+            display=TheaDisplay(),
+            callback=convergence_tracker,
+        )
+
+        if fitness_cache is not None:
+            print(f"Fitness cache: {fitness_cache.statistics()}")
+        if VERBOSE:
+            print(f"Chain delay cache: {Topology.first().chain_delay_statistics()}")
+
+        # Pymoo only reports feasible solutions, so the least infeasible one is picked from the population when there are none
+        X, F, CV = (res.X, res.F, res.CV) if res.X is not None else res.pop.get("X", "F", "CV")
+
+        # Pymoo works on a copy of the termination criterion, so its final state is read from the algorithm
+        termination = res.algorithm.termination
+        generations = res.algorithm.n_gen
+
+    if archive is not None:
+        archive.close()
+        print(f"Archived {archive.rows} evaluated chromosomes in {archive_dir}")
 
     # Applying the a placement scheme found by the NSGA-II algorithm
-    min_and_max = find_minimum_and_maximum(metadata=solutions)
-
-    best_solution = sorted(
-        solutions, key=lambda solution: (solution["Overloaded DCs"], min_and_max["minimum"]["SLAV"] + min_and_max["minimum"]["COST"])
-    )[0]["Placement"]
-
+    best_solution = select_best_solution(X=X, F=F, CV=CV)
     apply_placement(solution=best_solution)
+
+    # Hypervolume of the feasible solutions found (both objectives are normalized between 0 and 100)
+    feasible_F = np.asarray(F, dtype=np.float64)[np.asarray(CV)[:, 0] <= 0]
+    hypervolume = get_performance_indicator("hv", ref_point=np.array([100.0, 100.0])).do(feasible_F) if len(feasible_F) > 0 else 0
+
+    execution_metadata = {
+        "stop_reason": termination.stop_reason,
+        "generations": generations,
+        "best_quality": convergence_tracker.history[-1],
+        "hypervolume": float(hypervolume),
+        "generations_to_feasible": convergence_tracker.generations_to_feasible(),
+        **execution_metadata,
+    }
+    if VERBOSE:
+        print(f"NSGA-II stopped at generation {execution_metadata['generations']} ({execution_metadata['stop_reason']})")
+    if target_quality is not None:
+        execution_metadata["generations_to_target"] = convergence_tracker.generations_to_target(target_quality=target_quality)
+
+    return execution_metadata
@@ -0,0 +1,635 @@
+"""Contains a native NumPy implementation of the NSGA-II algorithm that works directly on integer placement matrices.
+
+The Pymoo backend evaluates chromosomes one by one, applying each of them to the scenario objects. This engine instead keeps the
+population as a matrix (one row per chromosome, one column per service) and scores whole generations at once with the vectorized
+evaluator. Its operators mirror the ones configured for the Pymoo backend, so both backends produce comparable Pareto fronts:
+    - Binary tournament selection (constraint violation, then Pareto dominance, then crowding distance).
+    - Uniform crossover.
+    - Polynomial mutation rounded to integer data center IDs.
+    - Elimination of offspring that duplicate each other or chromosomes of the current population.
+    - Rank and crowding survival (infeasible chromosomes only survive when there are not enough feasible ones).
+
+The operators are vectorized over the whole population, but they do not cost less than the evaluation on small scenarios: with
+a population of 400 on "datasets/dataset1.json" (132 services), a generation spends about 2.2 ms on the operators and 1.5 ms
+on the evaluation ("benchmark.py" reports both times). The remaining cost is spread over a few dozen NumPy calls per
+generation, of which drawing the random numbers of the mutation is the largest, and the non-dominated sort still loops once
+per front needed to fill the population (about 15 fronts), as each front is only known once the previous ones are removed.
+"""
+# Importing the vectorized evaluator
+from simulator.vectorized import get_data_center_indices, calculate_data_center_demands, evaluate_placements
+
+# Python libraries
+import numpy as np
+import time
+
+
+# Maximum number of mating rounds used to gather offspring that are not duplicates
+MAX_MATING_ITERATIONS = 100
+
+
+def evaluate_population(arrays: dict, X: object, constraint: str = "count") -> tuple:
+    """Evaluates a population of placement schemes.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        X (object): Placement matrix (one row per chromosome).
+        constraint (str, optional): Capacity constraint ("count", "overload" or "per_data_center"). Defaults to "count".
+
+    Returns:
+        output (tuple): Fitness scores, constraint values, and constraint violations of the population.
+    """
+    F, G = evaluate_placements(arrays=arrays, placements=X)
+
+    # Graded constraints tell apart data centers slightly overloaded from heavily overloaded ones
+    if constraint != "count":
+        demands = calculate_data_center_demands(arrays=arrays, indices=get_data_center_indices(arrays=arrays, placements=X))
+        overloads = np.maximum(demands - arrays["data_center_capacity"], 0)
+        G = overloads.sum(axis=1, keepdims=True) if constraint == "overload" else overloads
+
+    CV = np.maximum(G, 0).sum(axis=1, keepdims=True)
+    output = (F, G, CV)
+
+    return output
+
+
+def calculate_domination_matrix(F: object) -> object:
+    """Computes the Pareto dominance relation among a set of solutions (all objectives are minimized).
+
+    Args:
+        F (object): Fitness scores (one row per solution).
+
+    Returns:
+        dominates (object): Boolean matrix in which element (i, j) tells whether solution "i" dominates solution "j".
+    """
+    not_worse = (F[:, None, :] <= F[None, :, :]).all(axis=2)
+    better = (F[:, None, :] < F[None, :, :]).any(axis=2)
+
+    return not_worse & better
+
+
+def fast_non_dominated_sort(F: object, n_stop_if_ranked: int = None) -> object:
+    """Sorts a set of solutions into Pareto fronts.
+
+    Args:
+        F (object): Fitness scores (one row per solution).
+        n_stop_if_ranked (int, optional): Number of solutions after which no more fronts are needed. Defaults to None (all fronts).
+
+    Returns:
+        rank (object): Front of each solution (0 is the non-dominated front). Solutions left out when the sort stops early get
+            the rank that follows the last front found.
+    """
+    if F.shape[1] != 2:
+        return sort_by_domination_matrix(F=F)
+
+    if n_stop_if_ranked is None:
+        n_stop_if_ranked = len(F)
+
+    # Bi-objective fronts are peeled from the distinct solutions in lexicographic order. Solutions visited earlier are never
+    # worse in the first objective, so a solution is only dominated by the remaining solutions if one of the solutions visited
+    # before it is not worse in the second objective either, i.e., if its second objective is not below the running minimum.
+    order = np.lexsort((F[:, 1], F[:, 0]))
+    sorted_F = F[order]
+
+    # Solutions equal to the previous one in lexicographic order share its front
+    is_distinct = np.ones(len(F), dtype=bool)
+    is_distinct[1:] = (sorted_F[1:] != sorted_F[:-1]).any(axis=1)
+    distinct = np.flatnonzero(is_distinct)
+    multiplicity = np.diff(np.append(distinct, len(F)))
+
+    remaining = np.arange(len(distinct))
+    values = sorted_F[distinct, 1]
+    unique_rank = np.empty(len(distinct), dtype=np.int64)
+
+    current_rank, n_ranked = 0, 0
+    while len(remaining) > 0 and n_ranked < n_stop_if_ranked:
+        remaining_values = values[remaining]
+        running_minimum = np.empty(len(remaining))
+        running_minimum[0] = np.inf
+        np.minimum.accumulate(remaining_values[:-1], out=running_minimum[1:])
+
+        in_front = remaining_values < running_minimum
+        unique_rank[remaining[in_front]] = current_rank
+        n_ranked += int(multiplicity[remaining[in_front]].sum())
+
+        remaining = remaining[~in_front]
+        current_rank += 1
+
+    unique_rank[remaining] = current_rank
+
+    rank = np.empty(len(F), dtype=np.int64)
+    rank[order] = unique_rank[np.cumsum(is_distinct) - 1]
+
+    return rank
+
+
+def sort_by_domination_matrix(F: object) -> object:
+    """Sorts a set of solutions with any number of objectives into Pareto fronts by peeling off one front at a time.
+
+    Args:
+        F (object): Fitness scores (one row per solution).
+
+    Returns:
+        rank (object): Front of each solution (0 is the non-dominated front).
+    """
+    dominates = calculate_domination_matrix(F=F)
+    n_dominators = dominates.sum(axis=0)
+
+    rank = np.full(len(F), -1, dtype=np.int64)
+    front = np.flatnonzero(n_dominators == 0)
+    current_rank = 0
+
+    # Solutions only dominated by previous fronts form the next front
+    while len(front) > 0:
+        rank[front] = current_rank
+        n_dominators -= dominates[front].sum(axis=0)
+        n_dominators[front] = -1
+
+        front = np.flatnonzero(n_dominators == 0)
+        current_rank += 1
+
+    return rank
+
+
+def calculate_crowding_distance(F: object, rank: object = None) -> object:
+    """Computes the crowding distance of solutions within their fronts.
+
+    Args:
+        F (object): Fitness scores (one row per solution).
+        rank (object, optional): Front of each solution. Defaults to a single front.
+
+    Returns:
+        crowding (object): Crowding distance of each solution (boundary solutions of each front have infinite distance).
+    """
+    n_solutions, n_objectives = F.shape
+    if rank is None:
+        rank = np.zeros(n_solutions, dtype=np.int64)
+
+    crowding = np.zeros(n_solutions)
+    if n_solutions == 0:
+        return crowding
+
+    for objective in range(n_objectives):
+        # Sorting solutions by front and then by objective value (ties keep the order of the solutions)
+        order = np.lexsort((F[:, objective], rank))
+        values = F[order, objective]
+        fronts = rank[order]
+
+        is_first = np.ones(n_solutions, dtype=bool)
+        is_first[1:] = fronts[1:] != fronts[:-1]
+        is_last = np.ones(n_solutions, dtype=bool)
+        is_last[:-1] = is_first[1:]
+
+        # Objectives with the same value for every solution of a front do not contribute to the distance
+        span = values[is_last] - values[is_first]
+        span[span == 0] = np.inf
+        front_index = np.cumsum(is_first) - 1
+
+        distances = np.empty(n_solutions)
+        distances[1:-1] = (values[2:] - values[:-2]) / span[front_index[1:-1]]
+        distances[is_first | is_last] = np.inf
+
+        crowding[order] += distances
+
+    return crowding
+
+
+def rank_and_crowding_survival(F: object, CV: object, n_survive: int, rng: object) -> tuple:
+    """Selects the chromosomes that survive to the next generation.
+
+    Args:
+        F (object): Fitness scores (one row per chromosome).
+        CV (object): Constraint violations (one row per chromosome).
+        n_survive (int): Number of survivors.
+        rng (object): Random number generator (breaks ties in the crowding distance).
+
+    Returns:
+        output (tuple): Indices, ranks and crowding distances of the survivors.
+    """
+    violations = CV[:, 0]
+    feasible = np.flatnonzero(violations <= 0)
+    infeasible = np.flatnonzero(violations > 0)
+
+    survivors, ranks, crowding = [], [], []
+
+    # Feasible chromosomes are selected front by front, and the last front that fits partially is truncated by crowding distance
+    if len(feasible) > 0:
+        rank = fast_non_dominated_sort(F=F[feasible], n_stop_if_ranked=n_survive)
+
+        # Fronts after the one that fills the population are discarded before computing crowding distances
+        n_fronts = int(np.searchsorted(np.cumsum(np.bincount(rank)), n_survive)) + 1
+        kept = np.flatnonzero(rank < n_fronts)
+        kept = kept[np.argsort(rank[kept], kind="stable")]
+        kept_rank = rank[kept]
+        kept_crowding = calculate_crowding_distance(F=F[feasible[kept]], rank=kept_rank)
+
+        selected = np.arange(len(kept))
+        if len(kept) > n_survive:
+            last_front = np.flatnonzero(kept_rank == n_fronts - 1)
+            n_remaining = n_survive - last_front[0]
+            order = np.lexsort((rng.random(len(last_front)), -kept_crowding[last_front]))[:n_remaining]
+            selected = np.concatenate([selected[: last_front[0]], last_front[order]])
+
+        survivors.append(feasible[kept[selected]])
+        ranks.append(kept_rank[selected])
+        crowding.append(kept_crowding[selected])
+
+    # Infeasible chromosomes fill the remaining slots, from the least to the most infeasible
+    n_remaining = n_survive - sum(len(front) for front in survivors)
+    if n_remaining > 0 and len(infeasible) > 0:
+        least_infeasible = infeasible[np.argsort(violations[infeasible], kind="stable")[:n_remaining]]
+        survivors.append(least_infeasible)
+        ranks.append(np.full(len(least_infeasible), np.iinfo(np.int64).max))
+        crowding.append(np.zeros(len(least_infeasible)))
+
+    output = (np.concatenate(survivors), np.concatenate(ranks), np.concatenate(crowding))
+
+    return output
+
+
+def binary_tournament(F: object, CV: object, crowding: object, n_winners: int, rng: object) -> object:
+    """Selects parents through binary tournaments. Tournaments are decided by the constraint violation when any of the contenders
+    is infeasible, and by Pareto dominance and then crowding distance otherwise (remaining ties are broken randomly).
+
+    Args:
+        F (object): Fitness scores of the population.
+        CV (object): Constraint violations of the population.
+        crowding (object): Crowding distances of the population.
+        n_winners (int): Number of parents selected.
+        rng (object): Random number generator.
+
+    Returns:
+        winners (object): Indices of the selected parents.
+    """
+    # Every chromosome takes part in the same number of tournaments (up to one) by drawing contenders from random permutations
+    n_permutations = int(np.ceil(2 * n_winners / len(F)))
+    contenders = np.concatenate([rng.permutation(len(F)) for _ in range(n_permutations)])[: 2 * n_winners].reshape(n_winners, 2)
+    a, b = contenders[:, 0], contenders[:, 1]
+
+    violations_a, violations_b = CV[a, 0], CV[b, 0]
+    crowding_a, crowding_b = crowding[a], crowding[b]
+    coin = rng.random(n_winners) < 0.5
+
+    # Dominance in both directions comes from the same two comparisons ("b" is not worse than "a" in an objective where "a" is
+    # not better, and better where "a" is worse), which are reduced objective by objective as there are only a few of them
+    a_not_worse = np.ones(n_winners, dtype=bool)
+    a_better = np.zeros(n_winners, dtype=bool)
+    for objective in range(F.shape[1]):
+        a_not_worse &= F[a, objective] <= F[b, objective]
+        a_better |= F[a, objective] < F[b, objective]
+    a_dominates = a_not_worse & a_better
+    b_dominates = ~a_better & ~a_not_worse
+
+    a_wins = np.where(
+        (violations_a > 0) | (violations_b > 0),
+        np.where(violations_a == violations_b, coin, violations_a < violations_b),
+        np.where(
+            a_dominates | b_dominates,
+            a_dominates,
+            np.where(crowding_a == crowding_b, coin, crowding_a > crowding_b),
+        ),
+    )
+
+    winners = np.where(a_wins, a, b)
+
+    return winners
+
+
+def uniform_crossover(parents_a: object, parents_b: object, prob: float, rng: object) -> object:
+    """Creates two offspring from each pair of parents by swapping each gene with a 50% chance.
+
+    Args:
+        parents_a (object): First parent of each mating.
+        parents_b (object): Second parent of each mating.
+        prob (float): Probability of each pair of parents being recombined (otherwise the offspring copy their parents).
+        rng (object): Random number generator.
+
+    Returns:
+        offspring (object): Offspring matrix (twice as many rows as matings).
+    """
+    recombined = rng.random(len(parents_a)) < prob
+
+    # Each random bit decides the swap of one gene, which takes one byte of random data for every eight genes
+    n_matings, n_genes = parents_a.shape
+    random_bytes = np.frombuffer(rng.bytes(n_matings * ((n_genes + 7) // 8)), dtype=np.uint8).reshape(n_matings, -1)
+    swap = np.unpackbits(random_bytes, axis=1, count=n_genes).view(bool) & recombined[:, None]
+
+    # Genes are swapped arithmetically (selecting them with "np.where" is slower on random masks), and the second offspring
+    # takes the genes that the first offspring did not take
+    first = parents_a + swap * (parents_b - parents_a)
+    offspring = np.concatenate([first, parents_a + parents_b - first])
+
+    return offspring
+
+
+def polynomial_mutation(X: object, prob: float, xl: int, xu: int, eta: float, rng: object) -> object:
+    """Perturbs genes with the polynomial mutation and rounds them to the nearest integer.
+
+    Args:
+        X (object): Chromosomes.
+        prob (float): Probability of each gene being mutated.
+        xl (int): Lowest gene value.
+        xu (int): Highest gene value.
+        eta (float): Distribution index (higher values create smaller perturbations).
+        rng (object): Random number generator.
+
+    Returns:
+        Y (object): Mutated chromosomes.
+    """
+    Y = X.copy()
+    if prob <= 0:
+        return Y
+
+    # A single draw per gene both selects the mutated genes (draws below "prob") and, rescaled by "prob", gives the uniform
+    # number that sets the perturbation of each mutated gene
+    draws = rng.random(X.size, dtype=np.float32)
+    mutated = np.flatnonzero(draws < prob)
+    if len(mutated) == 0:
+        return Y
+
+    # Widening the bounds by half a unit gives the boundary values the same chance of being picked after rounding
+    lower, upper = xl - (0.5 - 1e-16), xu + (0.5 - 1e-16)
+    half_range = (upper - lower) / 2
+
+    x = X.reshape(-1)[mutated].astype(np.float64)
+    rand = draws[mutated].astype(np.float64) / prob
+
+    # Both branches of the mutation (moving genes down when "rand <= 0.5" and up otherwise) share the same formula once the
+    # uniform number is folded onto [0, 0.5] and the distance to the opposite bound is measured from the moving direction, so
+    # they are computed together rather than on separate subsets (indexing random subsets is slower than the arithmetic)
+    direction = 1.0 - 2.0 * (rand > 0.5)
+    folded = np.minimum(rand, 1.0 - rand)
+    distance = (half_range + direction * (half_range - (x - lower))) / (upper - lower)
+
+    # Powers are computed through logarithms, which is much faster than "np.power" with fractional exponents (a base of zero
+    # gives a logarithm of minus infinity and thus a power of zero)
+    with np.errstate(divide="ignore"):
+        base = 2.0 * folded + (1.0 - 2.0 * folded) * np.exp((eta + 1.0) * np.log(distance))
+        deltaq = direction * (np.exp(np.log(base) / (eta + 1.0)) - 1.0)
+
+    # Mutated values are kept within the widened bounds, rounded, and kept within the gene bounds
+    values = np.rint(np.minimum(np.maximum(x + deltaq * (upper - lower), lower), upper))
+    Y.reshape(-1)[mutated] = np.minimum(np.maximum(values, xl), xu).astype(X.dtype)
+
+    return Y
+
+
+def hash_rows(X: object, weights: object) -> object:
+    """Hashes each row of an integer matrix into a 64-bit key (a weighted sum of its genes that wraps around on overflow). Distinct
+    rows share a key with a negligible probability, in which case the later one is merely discarded as a duplicate.
+
+    Args:
+        X (object): Integer matrix.
+        weights (object): Odd 64-bit weight of each column.
+
+    Returns:
+        object: Key of each row.
+    """
+    return np.ascontiguousarray(X, dtype=np.int64).view(np.uint64) @ weights
+
+
+def find_new_rows(hashes: object, existing: object) -> object:
+    """Finds the rows whose keys appear neither among the keys already known nor earlier among the candidate keys.
+
+    Args:
+        hashes (object): Keys of the candidate rows (see "hash_rows").
+        existing (object): Keys already known.
+
+    Returns:
+        new (object): Boolean mask of the candidate rows that are new.
+    """
+    # A single stable sort puts the known keys and the earlier candidates ahead of the candidates that repeat them, so a
+    # candidate is new if its key differs from the key sorted before it
+    keys = np.concatenate([existing, hashes])
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    is_first = np.ones(len(keys), dtype=bool)
+    is_first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+
+    new = np.empty(len(keys), dtype=bool)
+    new[order] = is_first
+    new = new[len(existing) :]
+
+    return new
+
+
+class NumpyNSGA2:
+    """NSGA-II algorithm that evolves integer placement matrices scored by the vectorized evaluator. Its state (population,
+    generation and random number generator) is kept in the object, so executions can be resumed by calling "run" again."""
+
+    def __init__(
+        self,
+        arrays: dict,
+        pop_size: int,
+        cross_prob: float,
+        mut_prob: float,
+        constraint: str = "count",
+        eta: float = 20,
+        seed: int = 1,
+        archive: object = None,
+    ) -> object:
+        """Creates a NumpyNSGA2 object.
+
+        Args:
+            arrays (dict): Scenario arrays.
+            pop_size (int): Number of chromosomes in the population.
+            cross_prob (float): Crossover probability.
+            mut_prob (float): Probability of each gene being mutated.
+            constraint (str, optional): Capacity constraint ("count", "overload" or "per_data_center"). Defaults to "count".
+            eta (float, optional): Distribution index of the polynomial mutation. Defaults to 20.
+            seed (int, optional): Seed of the random number generator. Defaults to 1.
+            archive (object, optional): Archive that stores every evaluated chromosome. Defaults to None.
+
+        Returns:
+            object: Created NumpyNSGA2 object.
+        """
+        self.arrays = arrays
+        self.pop_size = pop_size
+        self.cross_prob = cross_prob
+        self.mut_prob = mut_prob
+        self.constraint = constraint
+        self.eta = eta
+        self.archive = archive
+        self.rng = np.random.default_rng(seed)
+
+        # Genes are data center IDs
+        valid_ids = np.flatnonzero(arrays["data_center_index"] >= 0)
+        self.xl, self.xu = int(valid_ids.min()), int(valid_ids.max())
+
+        # Weights that hash chromosomes to detect duplicates (drawn from their own generator so that they do not change the
+        # random sequence of the operators)
+        self.hash_weights = np.random.default_rng(0).integers(0, 2**63, size=len(arrays["service_demand"]), dtype=np.uint64) * 2 + 1
+
+        # Population (chromosomes, fitness scores, constraint values and violations, ranks and crowding distances)
+        self.X = None
+        self.F = None
+        self.G = None
+        self.CV = None
+        self.rank = None
+        self.crowding = None
+        self.hashes = None
+
+        # Execution counters
+        self.n_gen = 0
+        self.n_eval = 0
+
+        # Time spent evaluating chromosomes and running the genetic operators (in seconds)
+        self.evaluation_time = 0.0
+        self.operator_time = 0.0
+
+    def evaluate(self, X: object) -> tuple:
+        """Evaluates chromosomes, archiving them if an archive was informed.
+
+        Args:
+            X (object): Chromosomes.
+
+        Returns:
+            output (tuple): Fitness scores, constraint values, and constraint violations of the chromosomes.
+        """
+        start = time.perf_counter()
+        output = evaluate_population(arrays=self.arrays, X=X, constraint=self.constraint)
+        self.evaluation_time += time.perf_counter() - start
+        self.n_eval += len(X)
+
+        # The initial population is archived as generation 0 and offspring as the generation in which they were created
+        if self.archive is not None:
+            self.archive.append(generation=self.n_gen, X=X, F=output[0], G=output[1])
+
+        return output
+
+    def initialize(self, X: object):
+        """Evaluates the initial population.
+
+        Args:
+            X (object): Chromosomes of the initial population.
+        """
+        X = np.asarray(X, dtype=np.int64)
+        F, G, CV = self.evaluate(X=X)
+        self.survive(X=X, F=F, G=G, CV=CV)
+        self.n_gen = 1
+
+    def survive(self, X: object, F: object, G: object, CV: object, hashes: object = None):
+        """Replaces the population with the survivors of a set of chromosomes.
+
+        Args:
+            X (object): Chromosomes.
+            F (object): Fitness scores.
+            G (object): Constraint values.
+            CV (object): Constraint violations.
+            hashes (object, optional): Keys of the chromosomes (see "hash_rows"). Defaults to None (computed from the chromosomes).
+        """
+        if hashes is None:
+            hashes = hash_rows(X=X, weights=self.hash_weights)
+
+        survivors, self.rank, self.crowding = rank_and_crowding_survival(F=F, CV=CV, n_survive=self.pop_size, rng=self.rng)
+        self.X, self.F, self.G, self.CV = X[survivors], F[survivors], G[survivors], CV[survivors]
+        self.hashes = hashes[survivors]
+
+    def mate(self, n_offspring: int) -> object:
+        """Creates offspring through tournament selection, crossover and mutation.
+
+        Args:
+            n_offspring (int): Number of offspring.
+
+        Returns:
+            offspring (object): Offspring chromosomes.
+        """
+        n_matings = int(np.ceil(n_offspring / 2))
+        parents = binary_tournament(F=self.F, CV=self.CV, crowding=self.crowding, n_winners=2 * n_matings, rng=self.rng)
+
+        offspring = uniform_crossover(
+            parents_a=self.X[parents[:n_matings]], parents_b=self.X[parents[n_matings:]], prob=self.cross_prob, rng=self.rng
+        )
+        offspring = polynomial_mutation(X=offspring, prob=self.mut_prob, xl=self.xl, xu=self.xu, eta=self.eta, rng=self.rng)
+
+        return offspring[:n_offspring]
+
+    def generate_offspring(self) -> tuple:
+        """Creates offspring that duplicate neither each other nor the current population.
+
+        Returns:
+            output (tuple): Offspring chromosomes (fewer than the population size if not enough distinct ones were found) and
+                their keys (see "hash_rows").
+        """
+        offspring = np.empty((0, self.X.shape[1]), dtype=self.X.dtype)
+        known_hashes = self.hashes
+
+        for _ in range(MAX_MATING_ITERATIONS):
+            candidates = self.mate(n_offspring=self.pop_size - len(offspring))
+            hashes = hash_rows(X=candidates, weights=self.hash_weights)
+            new = find_new_rows(hashes=hashes, existing=known_hashes)
+            offspring = np.concatenate([offspring, candidates[new]])
+            known_hashes = np.concatenate([known_hashes, hashes[new]])
+
+            if len(offspring) >= self.pop_size:
+                break
+
+        output = (offspring, known_hashes[len(self.hashes) :])
+
+        return output
+
+    def next(self):
+        """Runs one generation."""
+        start = time.perf_counter()
+        offspring, hashes = self.generate_offspring()
+        self.operator_time += time.perf_counter() - start
+
+        F, G, CV = self.evaluate(X=offspring)
+
+        start = time.perf_counter()
+        self.survive(
+            X=np.concatenate([self.X, offspring]),
+            F=np.concatenate([self.F, F]),
+            G=np.concatenate([self.G, G]),
+            CV=np.concatenate([self.CV, CV]),
+            hashes=np.concatenate([self.hashes, hashes]),
+        )
+        self.operator_time += time.perf_counter() - start
+
+        self.n_gen += 1
+
+    def run(self, termination: object, callback: object = None, verbose: bool = False) -> object:
+        """Runs generations until the termination criterion stops the algorithm.
+
+        Args:
+            termination (object): Termination criterion (see "PlacementTermination").
+            callback (object, optional): Object whose "record" method receives the population after each generation. Defaults to None.
+            verbose (bool, optional): Whether the progress is printed after each generation. Defaults to False.
+
+        Returns:
+            object: NumpyNSGA2 object.
+        """
+        while True:
+            if callback is not None:
+                callback.record(F=self.F, CV=self.CV)
+
+            if verbose:
+                print(
+                    f"n_gen: {self.n_gen}. n_eval: {self.n_eval}. SLAV: {int(self.F[:, 0].min())}. Cost: {int(self.F[:, 1].min())}. "
+                    f"CV: {int(self.CV[:, 0].min())}"
+                )
+
+            if termination.stagnation_window > 0 or termination.hv_window > 0:
+                termination.update_convergence_history(generation=self.n_gen, F=self.F, CV=self.CV)
+
+            if not termination.should_continue(generation=self.n_gen):
+                break
+
+            self.next()
+
+        return self
+
+    def result(self) -> tuple:
+        """Gathers the solutions found by the algorithm: the feasible non-dominated chromosomes of the population or, when
+        there are none, the whole population (so that the least infeasible solution can be picked).
+
+        Returns:
+            output (tuple): Chromosomes, fitness scores and constraint violations.
+        """
+        optimal = (self.CV[:, 0] <= 0) & (self.rank == 0)
+        if not optimal.any():
+            return self.X, self.F, self.CV
+
+        output = (self.X[optimal], self.F[optimal], self.CV[optimal])
+
+        return output
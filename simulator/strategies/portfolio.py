@@ -0,0 +1,208 @@
+# Importing simulator components
+from simulator.simulator import Simulator
+from simulator.components.application import Application
+from simulator.components.service import Service
+
+# Importing helper methods
+from simulator.helper_methods import *
+
+# Importing the heuristics that compose the portfolio
+from simulator.strategies.proposed_algorithm import proposed_algorithm, provision_application
+from simulator.strategies.best_fit import best_fit
+from simulator.strategies.worst_fit import worst_fit
+
+# Importing Python libraries
+import multiprocessing as mp
+from random import sample, seed
+import time
+import os
+
+
+def randomized_greedy(parameters: dict = {}):
+    """Randomized variant of the proposed heuristic that provisions applications in random order (used in randomized restarts).
+
+    Args:
+        parameters (dict, optional): Algorithm parameters. Defaults to {}.
+    """
+    for application in sample(Application.all(), Application.count()):
+        provision_application(application=application)
+
+
+# Heuristics that can be included in the portfolio
+HEURISTICS = {
+    "proposed_algorithm": proposed_algorithm,
+    "best_fit": best_fit,
+    "worst_fit": worst_fit,
+    "randomized_greedy": randomized_greedy,
+}
+
+# Default ordering of the metrics used to compare placements (services left unprovisioned are always compared first)
+OBJECTIVES = ["overloaded_data_centers", "sla_violations", "overall_allocation_cost"]
+
+
+def parse_list(value: object) -> list:
+    """Parses list parameters, which can be informed as lists or as comma-separated strings (e.g., from the command line).
+
+    Args:
+        value (object): List or comma-separated string.
+
+    Returns:
+        list: Parsed list.
+    """
+    return [item.strip() for item in value.split(",") if item.strip()] if isinstance(value, str) else list(value)
+
+
+def run_heuristic(heuristic: str, input_file: str, seed_value: int) -> dict:
+    """Runs a heuristic on a clean scenario and undoes its placement afterwards.
+
+    Args:
+        heuristic (str): Name of the heuristic (see "HEURISTICS").
+        input_file (str): Dataset used to rebuild the scenario when the heuristic runs in a fresh interpreter.
+        seed_value (int): Seed value used by randomized heuristics.
+
+    Returns:
+        result (dict): Placement found by the heuristic, its metrics, and the heuristic's execution time.
+    """
+    # Rebuilding the simulation scenario if the worker does not share the memory of the process that launched it
+    if Service.count() == 0:
+        Simulator().initialize(input_file=input_file)
+
+    seed(seed_value)
+
+    start_time = time.time()
+    HEURISTICS[heuristic](parameters={})
+    execution_time = time.time() - start_time
+
+    # Services that the heuristic could not provision are represented by None
+    placement = [service.data_center.id if service.data_center else None for service in Service.all()]
+
+    result = {
+        "heuristic": heuristic,
+        "seed": seed_value,
+        "placement": placement,
+        "metrics": {**calculate_metrics(), "unprovisioned_services": placement.count(None)},
+        "execution_time": execution_time,
+    }
+
+    reset_scenario()
+
+    return result
+
+
+def get_run_name(result: dict) -> str:
+    """Names a heuristic run (randomized restarts are identified by their seeds).
+
+    Args:
+        result (dict): Result of the heuristic.
+
+    Returns:
+        str: Name of the run.
+    """
+    return f"{result['heuristic']}-{result['seed']}" if result["heuristic"] == "randomized_greedy" else result["heuristic"]
+
+
+def portfolio_worker(task: dict) -> dict:
+    """Entry point of the processes that run the heuristics.
+
+    Args:
+        task (dict): Arguments of "run_heuristic".
+
+    Returns:
+        dict: Result of the heuristic.
+    """
+    return run_heuristic(**task)
+
+
+def apply_portfolio_placement(placement: list):
+    """Applies a placement found by a heuristic, leaving the services it could not provision unprovisioned.
+
+    Args:
+        placement (list): Data center ID of each service (None for unprovisioned services).
+    """
+    for service_id, data_center_id in enumerate(placement, 1):
+        if data_center_id is not None:
+            service = Service.find_by_id(service_id)
+            data_center = DataCenter.find_by_id(data_center_id)
+            provision_service(user=service.application.user, service=service, data_center=data_center, update_communication_path=False)
+
+    # Defining the communication paths only once all services are provisioned
+    set_communication_paths()
+
+
+def portfolio(parameters: dict = {}) -> dict:
+    """Runs a portfolio of heuristics concurrently in worker processes and applies the best placement found among them.
+
+    The algorithm accepts the following parameters:
+        - heuristics: heuristics included in the portfolio (see "HEURISTICS"). Defaults to "proposed_algorithm", "best_fit"
+          and "worst_fit".
+        - restarts: number of randomized restarts ("randomized_greedy" runs with different seeds). Defaults to 0.
+        - objectives: metrics (as in "calculate_metrics") compared in lexicographic order to pick the best placement.
+          Defaults to "OBJECTIVES".
+        - processes: number of worker processes. Defaults to one per heuristic run (bounded by the number of CPU cores).
+        - seed: seed of the heuristics (randomized restarts use the following seeds). Defaults to 1.
+        - deadline: time (as in "time.time()") after which heuristic runs still executing are discarded (the portfolio waits
+          for at least one run to finish).
+
+    Args:
+        parameters (dict, optional): Algorithm parameters. Defaults to {}.
+
+    Returns:
+        dict: Information about the execution (best heuristic and execution time of each heuristic run).
+    """
+    heuristics = parse_list(parameters.get("heuristics", ["proposed_algorithm", "best_fit", "worst_fit"]))
+    restarts = parameters.get("restarts", 0)
+    objectives = parse_list(parameters.get("objectives", OBJECTIVES))
+    first_seed = parameters.get("seed", 1)
+    deadline = parameters.get("deadline")
+
+    for heuristic in heuristics:
+        if heuristic not in HEURISTICS:
+            raise Exception(f"Unknown heuristic: {heuristic}. Valid options: {list(HEURISTICS)}.")
+    for objective in objectives:
+        if objective not in OBJECTIVES:
+            raise Exception(f"Unknown objective: {objective}. Valid options: {OBJECTIVES}.")
+
+    input_file = Simulator.last().input_file
+    tasks = [{"heuristic": heuristic, "input_file": input_file, "seed_value": first_seed} for heuristic in heuristics]
+    for restart in range(1, restarts + 1):
+        tasks.append({"heuristic": "randomized_greedy", "input_file": input_file, "seed_value": first_seed + restart})
+
+    processes = min(parameters.get("processes", os.cpu_count()), len(tasks))
+
+    # Gathering the results as heuristic runs finish (runs still executing once the deadline is reached are discarded)
+    results = []
+    if processes > 1:
+        with mp.Pool(processes=processes) as pool:
+            iterator = pool.imap_unordered(portfolio_worker, tasks)
+            for _ in tasks:
+                timeout = max(deadline - time.time(), 0) if deadline is not None and len(results) > 0 else None
+                try:
+                    results.append(iterator.next(timeout=timeout))
+                except mp.TimeoutError:
+                    break
+    else:
+        for task in tasks:
+            if deadline is not None and len(results) > 0 and time.time() >= deadline:
+                break
+            results.append(portfolio_worker(task=task))
+
+    # Picking the best placement (services left unprovisioned are penalized before any other metric)
+    best_result = min(
+        results, key=lambda result: [result["metrics"]["unprovisioned_services"]] + [result["metrics"][key] for key in objectives]
+    )
+    apply_portfolio_placement(placement=best_result["placement"])
+
+    print(f"{'heuristic':>20} | {'metrics':>80} | {'execution_time':>14}")
+    for result in sorted(results, key=lambda result: (result["heuristic"], result["seed"])):
+        label = f"{get_run_name(result=result)}{'*' if result is best_result else ''}"
+        print(f"{label:>20} | {str(result['metrics']):>80} | {round(result['execution_time'], 4):>14}")
+
+    execution_metadata = {
+        "stop_reason": "time_budget" if len(results) < len(tasks) else "completed",
+        "best_heuristic": get_run_name(result=best_result),
+        "completed_runs": len(results),
+    }
+    for result in results:
+        execution_metadata[f"{get_run_name(result=result)}_time"] = result["execution_time"]
+
+    return execution_metadata
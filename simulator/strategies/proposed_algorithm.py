@@ -18,25 +18,64 @@ def proposed_algorithm(parameters: dict = {}):
 
     # Iterating over the sorted list of applications to provision their services
     for application_metadata in applications_metadata:
-        application = application_metadata["object"]
-        for service in application.services:
-            data_centers_metadata = get_candidate_data_centers(service=service)
+        provision_application(application=application_metadata["object"])
+
+
+def provision_application(application: object):
+    """Provisions the services of an application following its communication chain, favoring data centers that respect the
+    user's delay SLA and have lower allocation costs.
+
+    Args:
+        application (object): Application to be provisioned.
+    """
+    for service in application.services:
+        delay_sla = service.application.user.delay_sla
+        reachable_data_centers = get_reachable_data_centers(origin_region=get_previous_region(service=service), delay_sla=delay_sla)
+
+        # Data centers within the delay SLA score at least 1 while the others score at most 1, so the others are only scored
+        # when none of the reachable data centers that score above 1 can host the service (reachable data centers are
+        # evaluated in the order of "DataCenter.all()", which breaks ties between equal scores)
+        data_centers_metadata = get_candidate_data_centers(
+            service=service,
+            data_centers=sorted(reachable_data_centers, key=lambda data_center: data_center.id),
+            reachable_data_centers=reachable_data_centers,
+        )
+        preferred_data_centers_metadata = [metadata for metadata in data_centers_metadata if metadata["score"] > 1]
+        data_center = select_data_center(service=service, data_centers_metadata=preferred_data_centers_metadata)
+
+        if data_center is None:
+            discarded_data_centers = {metadata["object"] for metadata in preferred_data_centers_metadata}
+            data_centers_metadata = get_candidate_data_centers(
+                service=service,
+                data_centers=[data_center for data_center in DataCenter.all() if data_center not in discarded_data_centers],
+                reachable_data_centers=reachable_data_centers,
+            )
+            data_center = select_data_center(service=service, data_centers_metadata=data_centers_metadata)
 
-            data_centers = sorted(
-                data_centers_metadata,
-                key=lambda data_center: (data_center["respects_delay_sla"] + data_center["norm_allocation_cost_score"]),
-                reverse=True,
+        if data_center is not None:
+            provision_service(
+                service=service,
+                user=service.application.user,
+                data_center=data_center,
             )
 
-            for data_center_metadata in data_centers:
-                data_center = data_center_metadata["object"]
-                if data_center.capacity >= data_center.demand + service.demand:
-                    provision_service(
-                        service=service,
-                        user=service.application.user,
-                        data_center=data_center,
-                    )
-                    break
+
+def select_data_center(service: object, data_centers_metadata: list) -> object:
+    """Picks the data center with the highest score that has enough resources to host a service.
+
+    Args:
+        service (object): Service to be provisioned.
+        data_centers_metadata (list): Candidate data centers and their scores (see "get_candidate_data_centers").
+
+    Returns:
+        data_center (object): Selected data center (None if no candidate can host the service).
+    """
+    for data_center_metadata in sorted(data_centers_metadata, key=lambda data_center: data_center["score"], reverse=True):
+        data_center = data_center_metadata["object"]
+        if data_center.capacity >= data_center.demand + service.demand:
+            return data_center
+
+    return None
 
 
 def get_application_scores() -> float:
@@ -47,25 +86,26 @@ def get_application_scores() -> float:
     """
     applications = []
 
+    # Gathering the allocation costs of each type of service precomputed for the scenario
+    invariants = get_scenario_invariants()
+
     for application in Application.all():
         # Gathering the list of data centers with enough resources to host the application services
         # that are close enough to the application's user that could be used to host the application
         # services without violating the delay SLA
         free_resources_that_dont_violate_sla = 0
 
-        for data_center in DataCenter.all():
-            data_center_delay = calculate_path_delay(origin_region=application.user.region, target_region=data_center.region)
-            if data_center_delay <= application.user.delay_sla:
-                free_resources_that_dont_violate_sla += data_center.capacity - data_center.demand
+        for data_center in get_reachable_data_centers(origin_region=application.user.region, delay_sla=application.user.delay_sla):
+            free_resources_that_dont_violate_sla += data_center.capacity - data_center.demand
 
         delay_score = 1 / free_resources_that_dont_violate_sla
 
         # Finding the minimum and maximum allocation costs for each type of service that composes the application
         allocation_cost_score = 0
         for service in application.services:
-            allocation_costs = [data_center.allocation_cost[service.label] for data_center in DataCenter.all()]
-            min_cost = min(allocation_costs)
-            max_cost = max(allocation_costs)
+            allocation_costs = invariants["allocation_costs"][service.label]
+            min_cost = invariants["min_allocation_cost"][service.label]
+            max_cost = invariants["max_allocation_cost"][service.label]
 
             potential_cost_reduction = max(1, max_cost - min_cost)
             items_max_profit = 1 / (sum(1 for cost in allocation_costs if cost == min_cost) * min_cost)
@@ -102,49 +142,64 @@ def get_application_scores() -> float:
     return applications
 
 
-def get_candidate_data_centers(service: object):
-    """Function that calculates delay SLA and allocation cost scores for the data centers that could host a given service.
+def get_previous_region(service: object) -> object:
+    """Gets the region of the item that precedes a service in its application's communication chain.
 
     Args:
         service (object): Service to be provisioned.
+
+    Returns:
+        previous_region (object): Region of the user or of the data center that hosts the previous service.
     """
-    # Gathering information about the previous item in the application's communication chain
     communication_chain = list([service.application.user] + service.application.services)
     previous_item_in_chain = communication_chain[communication_chain.index(service) - 1]
-    previous_region = (
-        previous_item_in_chain.region if type(previous_item_in_chain) == User else previous_item_in_chain.data_center.region
-    )
+    if type(previous_item_in_chain) == User:
+        previous_region = previous_item_in_chain.region
+    elif previous_item_in_chain.data_center is not None:
+        previous_region = previous_item_in_chain.data_center.region
+    else:
+        # Services that follow a service left unprovisioned (e.g., for lack of resources) are placed as close to the user as possible
+        previous_region = service.application.user.region
+
+    return previous_region
+
+
+def get_candidate_data_centers(service: object, data_centers: list, reachable_data_centers: list) -> list:
+    """Function that calculates delay SLA and allocation cost scores for the data centers that could host a given service.
 
-    # Declaring a list that will host the data centers metadata
-    data_centers = []
+    Args:
+        service (object): Service to be provisioned.
+        data_centers (list): Data centers evaluated.
+        reachable_data_centers (list): Data centers that can host the service without violating the application's user delay SLA.
 
-    for data_center in DataCenter.all():
-        # Checking if the data center would violate the application's user delay SLA
-        delay = calculate_path_delay(origin_region=previous_region, target_region=data_center.region)
-        respects_delay_sla = 1 if delay <= service.application.user.delay_sla else 0
+    Returns:
+        data_centers_metadata (list): Data centers and their scores.
+    """
+    # Allocation cost scores are normalized by the lowest and highest costs of the service's type across every data center
+    invariants = get_scenario_invariants()
+    min_max_scores = {
+        "minimum": {"allocation_cost_score": 1 / invariants["max_allocation_cost"][service.label]},
+        "maximum": {"allocation_cost_score": 1 / invariants["min_allocation_cost"][service.label]},
+    }
 
-        # Calculating the data center's allocation cost score
-        allocation_cost_score = 1 / data_center.allocation_cost[service.label]
+    reachable_data_centers = set(reachable_data_centers)
 
+    data_centers_metadata = []
+    for data_center in data_centers:
         data_center_metadata = {
             "object": data_center,
-            "delay": delay,
-            "respects_delay_sla": respects_delay_sla,
-            "allocation_cost_score": allocation_cost_score,
+            "respects_delay_sla": 1 if data_center in reachable_data_centers else 0,
+            "allocation_cost_score": 1 / data_center.allocation_cost[service.label],
         }
 
-        data_centers.append(data_center_metadata)
-
-    # Calculating the normalized data centers' allocation cost scores
-    min_max_scores = find_minimum_and_maximum(data_centers)
-    for data_center_metadata in data_centers:
-        norm_allocation_cost_score = get_norm(
+        data_center_metadata["norm_allocation_cost_score"] = get_norm(
             metadata=data_center_metadata,
             attr_name="allocation_cost_score",
             min=min_max_scores["minimum"],
             max=min_max_scores["maximum"],
         )
+        data_center_metadata["score"] = data_center_metadata["respects_delay_sla"] + data_center_metadata["norm_allocation_cost_score"]
 
-        data_center_metadata["norm_allocation_cost_score"] = norm_allocation_cost_score
+        data_centers_metadata.append(data_center_metadata)
 
-    return data_centers
+    return data_centers_metadata
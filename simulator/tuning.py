@@ -0,0 +1,223 @@
+"""Contains a successive-halving search over the NSGA-II parameters (population size, crossover and mutation probabilities).
+
+Every configuration starts with a small generation budget. After each rung, only the best "1 / eta" of the configurations are
+kept, and their budget is multiplied by "eta" until it reaches the maximum number of generations. Configurations run on the NumPy
+backend, whose state is kept between rungs, so survivors resume from the generation where they stopped instead of restarting.
+The number of generations is thus the budget of the search, and the configurations that survive the last rung are the ones that
+deserve a full run.
+
+Example:
+    results = successive_halving(configurations=get_configurations(pop_sizes=[100, 400], cross_probs=[1], mut_probs=[0.1, 0.5]))
+"""
+# Scenario arrays (compiled or attached from a shared scenario) and NumPy backend of the NSGA-II algorithm
+from simulator.shared_scenario import get_scenario_arrays
+from simulator.strategies.numpy_nsgaii import NumpyNSGA2
+from simulator.strategies.nsgaii import PlacementTermination, generate_initial_population
+
+# Importing Pymoo components
+from pymoo.factory import get_performance_indicator
+
+# Python libraries
+from random import seed
+import numpy as np
+import itertools
+import math
+import time
+import csv
+
+# Metrics used to compare configurations ("best_quality" is the sum of the normalized objectives of the best feasible solution,
+# the lower the better, while "hypervolume" is the hypervolume of the feasible front, the higher the better)
+TUNING_METRICS = ["best_quality", "hypervolume"]
+
+# Columns of the output
+OUTPUT_FIELDS = [
+    "rank",
+    "pop_size",
+    "cross_prob",
+    "mut_prob",
+    "generations",
+    "eliminated_at_rung",
+    "best_quality",
+    "hypervolume",
+    "evaluations",
+]
+
+
+def get_configurations(pop_sizes: list, cross_probs: list, mut_probs: list) -> list:
+    """Lists every combination of NSGA-II parameters.
+
+    Args:
+        pop_sizes (list): Population sizes.
+        cross_probs (list): Crossover probabilities.
+        mut_probs (list): Mutation probabilities.
+
+    Returns:
+        list: Configurations.
+    """
+    return [
+        {"pop_size": int(pop_size), "cross_prob": float(cross_prob), "mut_prob": float(mut_prob)}
+        for pop_size, cross_prob, mut_prob in itertools.product(pop_sizes, cross_probs, mut_probs)
+    ]
+
+
+def score_engine(engine: object, hv_indicator: object) -> dict:
+    """Measures the quality of the population evolved by a NSGA-II engine.
+
+    Args:
+        engine (object): NumPy NSGA-II engine.
+        hv_indicator (object): Hypervolume indicator.
+
+    Returns:
+        dict: Best quality and hypervolume of the feasible solutions.
+    """
+    feasible_F = engine.F[engine.CV[:, 0] <= 0]
+
+    return {
+        "best_quality": float(feasible_F.sum(axis=1).min()) if len(feasible_F) > 0 else float("inf"),
+        "hypervolume": float(hv_indicator.do(feasible_F)) if len(feasible_F) > 0 else 0.0,
+    }
+
+
+def get_sort_key(result: dict, metric: str) -> float:
+    """Gets the value that sorts configurations from the best to the worst according to a metric.
+
+    Args:
+        result (dict): Result of the configuration.
+        metric (str): Metric compared (see "TUNING_METRICS").
+
+    Returns:
+        float: Sort key.
+    """
+    return result[metric] if metric == "best_quality" else -result[metric]
+
+
+def successive_halving(
+    configurations: list,
+    min_gen: int = 100,
+    max_gen: int = 1500,
+    eta: int = 3,
+    metric: str = "best_quality",
+    constraint: str = "count",
+    seed_value: int = 1,
+    arrays: dict = None,
+) -> list:
+    """Searches for the best NSGA-II configuration with successive halving.
+
+    Args:
+        configurations (list): Configurations evaluated (see "get_configurations").
+        min_gen (int, optional): Generation budget of the first rung. Defaults to 100.
+        max_gen (int, optional): Generation budget of the last rung. Defaults to 1500.
+        eta (int, optional): Factor by which configurations are cut and budgets grow at each rung. Defaults to 3.
+        metric (str, optional): Metric compared (see "TUNING_METRICS"). Defaults to "best_quality".
+        constraint (str, optional): Capacity constraint of the NSGA-II algorithm. Defaults to "count".
+        seed_value (int, optional): Seed of every configuration. Defaults to 1.
+        arrays (dict, optional): Scenario arrays. Defaults to the arrays of the current scenario (see "get_scenario_arrays").
+
+    Returns:
+        results (list): Results of each configuration, ranked from the best to the worst.
+    """
+    if metric not in TUNING_METRICS:
+        raise Exception(f"Unknown tuning metric: {metric}. Valid options: {TUNING_METRICS}.")
+    if eta < 2:
+        raise ValueError("The halving factor (eta) must be at least 2.")
+
+    if arrays is None:
+        arrays = get_scenario_arrays()
+
+    hv_indicator = get_performance_indicator("hv", ref_point=np.array([100.0, 100.0]))
+
+    results = [{**configuration, "eliminated_at_rung": None} for configuration in configurations]
+    engines = {}
+    survivors = list(range(len(results)))
+
+    for rung in itertools.count():
+        budget = min(min_gen * eta**rung, max_gen)
+
+        for index in survivors:
+            result = results[index]
+
+            # Starting the configuration on its first rung (every configuration starts from the same random state)
+            if index not in engines:
+                seed(seed_value)
+                engines[index] = NumpyNSGA2(
+                    arrays=arrays,
+                    pop_size=result["pop_size"],
+                    cross_prob=result["cross_prob"],
+                    mut_prob=result["mut_prob"],
+                    constraint=constraint,
+                    seed=seed_value,
+                )
+                engines[index].initialize(X=generate_initial_population(pop_size=result["pop_size"]))
+
+            # Resuming the configuration from the generation where it stopped on the previous rung
+            engines[index].run(termination=PlacementTermination(n_gen=budget))
+
+            result.update({"generations": engines[index].n_gen, "evaluations": engines[index].n_eval})
+            result.update(score_engine(engine=engines[index], hv_indicator=hv_indicator))
+
+        survivors.sort(key=lambda index: get_sort_key(result=results[index], metric=metric))
+        print(f"[Rung {rung}] {len(survivors)} configurations with {budget} generations. Best: {results[survivors[0]]}")
+
+        if budget >= max_gen or len(survivors) == 1:
+            break
+
+        # Keeping the best fraction of the configurations (the engines of the others are discarded to free memory)
+        n_survivors = max(math.ceil(len(survivors) / eta), 1)
+        for index in survivors[n_survivors:]:
+            results[index]["eliminated_at_rung"] = rung
+            del engines[index]
+        survivors = survivors[:n_survivors]
+
+    # Configurations that went further are ranked ahead of the ones eliminated before them
+    results.sort(key=lambda result: (-result["generations"], get_sort_key(result=result, metric=metric)))
+    for rank, result in enumerate(results, 1):
+        result["rank"] = rank
+
+    return results
+
+
+def run_tuning(configurations: list, parameters: dict = {}, output_file: str = None) -> dict:
+    """Runs a successive-halving search and compares its cost with the cost of running every configuration to the end.
+
+    Args:
+        configurations (list): Configurations evaluated (see "get_configurations").
+        parameters (dict, optional): Arguments of "successive_halving". Defaults to {}.
+        output_file (str, optional): CSV file that receives the ranked table of configurations. Defaults to None.
+
+    Returns:
+        summary (dict): Best configuration, evaluations spent by the search and fraction of the evaluations of an exhaustive grid.
+    """
+    start_time = time.time()
+    results = successive_halving(configurations=configurations, **parameters)
+    execution_time = time.time() - start_time
+
+    if output_file:
+        with open(output_file, "w", newline="", encoding="UTF-8") as file:
+            writer = csv.DictWriter(file, fieldnames=OUTPUT_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(results)
+
+    # An exhaustive grid would run every configuration for as many generations as the configurations that reached the last rung
+    max_gen = max(result["generations"] for result in results)
+    evaluations = sum(result["evaluations"] for result in results)
+    exhaustive_evaluations = sum(result["pop_size"] * max_gen for result in results)
+
+    print(
+        f"{'rank':>4} | {'pop_size':>8} | {'cross_prob':>10} | {'mut_prob':>8} | {'generations':>11} | {'best_quality':>12} | "
+        f"{'hypervolume':>11}"
+    )
+    for result in results:
+        print(
+            f"{result['rank']:>4} | {result['pop_size']:>8} | {result['cross_prob']:>10} | {result['mut_prob']:>8} | "
+            f"{result['generations']:>11} | {result['best_quality']:>12.4f} | {result['hypervolume']:>11.2f}"
+        )
+
+    summary = {
+        "best_configuration": {key: results[0][key] for key in ["pop_size", "cross_prob", "mut_prob", "generations"]},
+        "evaluations": evaluations,
+        "exhaustive_evaluations": exhaustive_evaluations,
+        "evaluation_fraction": evaluations / exhaustive_evaluations if exhaustive_evaluations > 0 else 0,
+        "execution_time": execution_time,
+    }
+
+    return summary
@@ -0,0 +1,257 @@
+"""Contains a vectorized evaluator that scores batches of placement schemes using flat NumPy arrays compiled from the scenario.
+
+Placements are integer matrices with one row per placement scheme and one column per service (column "i" holds the ID of the
+data center that hosts the service whose ID is "i + 1", following the convention used by "apply_placement").
+"""
+# Simulation components
+from simulator.components.topology import Topology
+from simulator.components.region import Region
+from simulator.components.data_center import DataCenter
+from simulator.components.user import User
+from simulator.components.service import Service
+
+# Helper methods
+from simulator.helper_methods import get_scenario_invariants
+
+# Python libraries
+import networkx as nx
+import numpy as np
+
+
+def compute_region_delay_matrix(topology: object, regions: list) -> object:
+    """Computes the delay of the shortest path between every pair of regions.
+
+    Args:
+        topology (object): Network topology.
+        regions (list): List of regions (defines the order of the matrix rows and columns).
+
+    Returns:
+        region_delays (object): Matrix of delays between regions (unreachable regions have infinite delay).
+    """
+    region_index = {region: index for index, region in enumerate(regions)}
+    region_delays = np.full((len(regions), len(regions)), np.inf)
+
+    for origin in regions:
+        region_delays[region_index[origin], region_index[origin]] = 0
+
+        if origin in topology:
+            for target, delay in nx.single_source_dijkstra_path_length(G=topology, source=origin, weight="delay").items():
+                if target in region_index:
+                    region_delays[region_index[origin], region_index[target]] = delay
+
+    return region_delays
+
+
+def compile_scenario() -> dict:
+    """Compiles the scenario into flat arrays used by the vectorized evaluator.
+
+    Returns:
+        arrays (dict): Scenario arrays.
+    """
+    invariants = get_scenario_invariants()
+
+    regions = Region.all()
+    data_centers = DataCenter.all()
+    users = User.all()
+    services = [Service.find_by_id(service_id) for service_id in range(1, Service.count() + 1)]
+
+    region_index = {region: index for index, region in enumerate(regions)}
+    user_index = {user: index for index, user in enumerate(users)}
+    service_index = {service: index for index, service in enumerate(services)}
+
+    # Lookup table that translates data center IDs into data center indices (invalid IDs are mapped to -1)
+    data_center_index = np.full(max(data_center.id for data_center in data_centers) + 1, -1, dtype=np.int64)
+    for index, data_center in enumerate(data_centers):
+        data_center_index[data_center.id] = index
+
+    # Index of the service that precedes each service in its application's communication chain (-1 for the first service)
+    service_previous = np.full(len(services), -1, dtype=np.int64)
+    for service in services:
+        position = service.application.services.index(service)
+        if position > 0:
+            service_previous[service_index[service]] = service_index[service.application.services[position - 1]]
+
+    arrays = {
+        "data_center_index": data_center_index,
+        "data_center_region": np.array([region_index[data_center.region] for data_center in data_centers], dtype=np.int64),
+        "data_center_capacity": np.array([data_center.capacity for data_center in data_centers], dtype=np.float64),
+        "service_demand": np.array([service.demand for service in services], dtype=np.float64),
+        "service_cost": np.array(
+            [[data_center.allocation_cost[service.label] * service.demand for data_center in data_centers] for service in services],
+            dtype=np.float64,
+        ).reshape(len(services), len(data_centers)),
+        "service_user": np.array([user_index[service.application.user] for service in services], dtype=np.int64),
+        "service_previous": service_previous,
+        "user_region": np.array([region_index[user.region] for user in users], dtype=np.int64),
+        "user_delay_sla": np.array([user.delay_sla for user in users], dtype=np.float64),
+        "region_delays": compute_region_delay_matrix(topology=Topology.first(), regions=regions),
+        "max_allocation_cost_possible": np.array(invariants["max_allocation_cost_possible"], dtype=np.float64),
+    }
+
+    return arrays
+
+
+def get_data_center_indices(arrays: dict, placements: object) -> object:
+    """Translates a batch of placements (data center IDs) into data center indices.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        placements (object): Placement matrix (one row per placement scheme).
+
+    Returns:
+        indices (object): Matrix of data center indices.
+    """
+    placements = np.asarray(placements, dtype=np.int64)
+    if placements.ndim == 1:
+        placements = placements.reshape(1, -1)
+
+    if placements.shape[1] != len(arrays["service_demand"]):
+        raise ValueError(f"Placements must have one data center ID per service ({len(arrays['service_demand'])} columns).")
+
+    if placements.min(initial=0) < 0 or placements.max(initial=0) >= len(arrays["data_center_index"]):
+        raise ValueError("Placements reference invalid data center IDs.")
+
+    indices = arrays["data_center_index"][placements]
+    if (indices < 0).any():
+        raise ValueError("Placements reference invalid data center IDs.")
+
+    return indices
+
+
+def get_hop_regions(arrays: dict, indices: object) -> tuple:
+    """Gets the regions at both ends of each hop of the communication chains (one hop per service) under a batch of placements.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        indices (object): Matrix of data center indices (one row per placement scheme).
+
+    Returns:
+        output (tuple): Matrices with the region that precedes each service in its chain and the region hosting the service.
+    """
+    service_regions = arrays["data_center_region"][indices]
+    has_previous = arrays["service_previous"] >= 0
+    previous_regions = np.where(
+        has_previous,
+        service_regions[:, np.maximum(arrays["service_previous"], 0)],
+        arrays["user_region"][arrays["service_user"]],
+    )
+
+    output = (previous_regions, service_regions)
+
+    return output
+
+
+def calculate_user_delays(arrays: dict, indices: object, region_delays: object = None) -> object:
+    """Calculates the delay perceived by each user under a batch of placements.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        indices (object): Matrix of data center indices (one row per placement scheme).
+        region_delays (object, optional): Matrix of delays between regions, or a stack with one matrix per placement scheme.
+            Defaults to the scenario's region delays.
+
+    Returns:
+        user_delays (object): Matrix of user delays (one row per placement scheme).
+    """
+    if region_delays is None:
+        region_delays = arrays["region_delays"]
+
+    n_placements = indices.shape[0]
+    n_users = len(arrays["user_region"])
+
+    # Regions hosting each service and regions of the previous items in their communication chains
+    previous_regions, service_regions = get_hop_regions(arrays=arrays, indices=indices)
+
+    # Summing the delays of each hop into the delay of the user that accesses the service
+    if region_delays.ndim == 3:
+        hop_delays = region_delays[np.arange(n_placements)[:, None], previous_regions, service_regions]
+    else:
+        hop_delays = region_delays[previous_regions, service_regions]
+    offsets = (np.arange(n_placements) * n_users)[:, None] + arrays["service_user"]
+    user_delays = np.bincount(offsets.ravel(), weights=hop_delays.ravel(), minlength=n_placements * n_users)
+
+    return user_delays.reshape(n_placements, n_users)
+
+
+def calculate_data_center_demands(arrays: dict, indices: object, service_demand: object = None) -> object:
+    """Calculates the demand of each data center under a batch of placements.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        indices (object): Matrix of data center indices (one row per placement scheme).
+        service_demand (object, optional): Service demands (vector or one row per placement). Defaults to the scenario's demands.
+
+    Returns:
+        demands (object): Matrix of data center demands (one row per placement scheme).
+    """
+    if service_demand is None:
+        service_demand = arrays["service_demand"]
+
+    n_placements = indices.shape[0]
+    n_data_centers = len(arrays["data_center_capacity"])
+
+    offsets = (np.arange(n_placements) * n_data_centers)[:, None] + indices
+    weights = np.broadcast_to(service_demand, indices.shape)
+    demands = np.bincount(offsets.ravel(), weights=weights.ravel(), minlength=n_placements * n_data_centers)
+
+    return demands.reshape(n_placements, n_data_centers)
+
+
+def calculate_metrics_batch(arrays: dict, placements: object) -> dict:
+    """Vectorized version of "calculate_metrics" that evaluates a batch of placements at once.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        placements (object): Placement matrix (one row per placement scheme).
+
+    Returns:
+        metrics (dict): Arrays with the metrics of each placement scheme.
+    """
+    indices = get_data_center_indices(arrays=arrays, placements=placements)
+
+    user_delays = calculate_user_delays(arrays=arrays, indices=indices)
+    demands = calculate_data_center_demands(arrays=arrays, indices=indices)
+
+    metrics = {
+        "sla_violations": (user_delays > arrays["user_delay_sla"]).sum(axis=1),
+        "overall_allocation_cost": arrays["service_cost"][np.arange(indices.shape[1]), indices].sum(axis=1),
+        "overloaded_data_centers": (demands > arrays["data_center_capacity"]).sum(axis=1),
+    }
+
+    return metrics
+
+
+def evaluate_placements(arrays: dict, placements: object) -> tuple:
+    """Vectorized version of "evaluate_placement" that evaluates a batch of placements at once.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        placements (object): Placement matrix (one row per placement scheme).
+
+    Returns:
+        output (tuple): Matrices of objectives (SLA violations and allocation cost, both normalized) and penalties.
+    """
+    metrics = calculate_metrics_batch(arrays=arrays, placements=placements)
+    output = get_objectives_and_penalties(arrays=arrays, metrics=metrics)
+
+    return output
+
+
+def get_objectives_and_penalties(arrays: dict, metrics: dict) -> tuple:
+    """Normalizes a batch of metrics into the objectives and penalties of the placement problem.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        metrics (dict): Arrays with the metrics of each placement scheme.
+
+    Returns:
+        output (tuple): Matrices of objectives (SLA violations and allocation cost, both normalized) and penalties.
+    """
+    sla_violations = metrics["sla_violations"] / len(arrays["user_region"]) * 100
+    overall_allocation_cost = metrics["overall_allocation_cost"] / arrays["max_allocation_cost_possible"] * 100
+
+    objectives = np.column_stack([sla_violations, overall_allocation_cost])
+    penalties = metrics["overloaded_data_centers"].reshape(-1, 1).astype(np.float64)
+    output = (objectives, penalties)
+
+    return output
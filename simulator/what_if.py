@@ -0,0 +1,379 @@
+"""Contains a what-if engine that estimates how a placement degrades when single data centers or network links fail.
+
+Failure scenarios are evaluated in batch with the vectorized evaluator:
+    - Data center failures: the failed data center loses its capacity. Its services are either left unavailable (their users
+      count as SLA violations) or failed over to the closest surviving data centers with enough free capacity.
+    - Link failures: the link is removed from the topology. Only the delays of region pairs whose shortest paths use the link
+      are recomputed, while every other delay is reused from the intact topology.
+
+Example:
+    results = analyze_failures(scenarios=get_single_failure_scenarios(), failover="nearest")
+"""
+# Simulation components
+from simulator.components.region import Region
+from simulator.components.data_center import DataCenter
+from simulator.components.network_link import NetworkLink
+from simulator.components.service import Service
+
+# Vectorized evaluator
+from simulator.vectorized import get_data_center_indices, calculate_user_delays, calculate_data_center_demands
+
+# Scenario arrays (compiled or attached from a shared scenario)
+from simulator.shared_scenario import get_scenario_arrays
+
+# Python libraries
+import numpy as np
+import time
+import csv
+
+# Components that can fail
+FAILURE_TYPES = ["data_center", "link"]
+
+# Ways of handling the services of failed data centers
+FAILOVER_POLICIES = ["none", "nearest"]
+
+# Columns of the output
+OUTPUT_FIELDS = [
+    "type",
+    "id",
+    "sla_violations",
+    "overall_allocation_cost",
+    "overloaded_data_centers",
+    "unavailable_users",
+    "migrated_services",
+    "lost_capacity",
+    "recomputed_regions",
+    "delta_sla_violations",
+    "delta_overloaded_data_centers",
+]
+
+
+def get_single_failure_scenarios(failure_types: list = FAILURE_TYPES) -> list:
+    """Lists the scenarios in which a single component fails (N-1 analysis).
+
+    Args:
+        failure_types (list, optional): Types of components that fail. Defaults to data centers and links.
+
+    Returns:
+        scenarios (list): Pairs of failure type and component ID.
+    """
+    for failure_type in failure_types:
+        if failure_type not in FAILURE_TYPES:
+            raise Exception(f"Unknown failure type: {failure_type}. Valid options: {FAILURE_TYPES}.")
+
+    scenarios = []
+    if "data_center" in failure_types:
+        scenarios += [("data_center", data_center.id) for data_center in DataCenter.all()]
+    if "link" in failure_types:
+        scenarios += [("link", link.id) for link in NetworkLink.all()]
+
+    return scenarios
+
+
+def compile_network() -> dict:
+    """Compiles the network links into arrays used to repair the delays between regions after link failures.
+
+    Returns:
+        network (dict): Network arrays.
+    """
+    region_index = {region: index for index, region in enumerate(Region.all())}
+    links = NetworkLink.all()
+
+    link_origin = np.array([region_index[link.nodes[0]] for link in links], dtype=np.int64)
+    link_target = np.array([region_index[link.nodes[1]] for link in links], dtype=np.int64)
+    link_delay = np.array([link.delay for link in links], dtype=np.float64)
+
+    # Links are traversed in both directions. Directed edges are sorted by the region they reach, so that the shortest way of
+    # reaching each region is found with a single segmented minimum ("np.minimum.reduceat").
+    edge_link = np.concatenate([np.arange(len(links)), np.arange(len(links))])
+    edge_from = np.concatenate([link_origin, link_target])
+    edge_to = np.concatenate([link_target, link_origin])
+    order = np.argsort(edge_to, kind="stable")
+    edge_starts = np.flatnonzero(np.r_[True, edge_to[order][1:] != edge_to[order][:-1]]) if len(order) > 0 else order
+
+    network = {
+        "link_index": {link.id: index for index, link in enumerate(links)},
+        "link_origin": link_origin,
+        "link_target": link_target,
+        "link_delay": link_delay,
+        "edge_link": edge_link[order],
+        "edge_from": edge_from[order],
+        "edge_delay": link_delay[edge_link[order]],
+        "edge_starts": edge_starts,
+        "edge_targets": edge_to[order][edge_starts],
+    }
+
+    return network
+
+
+def compute_link_failure_delays(arrays: dict, network: dict, link_id: int) -> tuple:
+    """Computes the delays between regions after a link fails, reusing every delay whose shortest path avoids the link.
+
+    A pair of regions depends on the link only if crossing it is as short as their shortest path. As links have positive delays,
+    one region of each such pair is closer to one end of the link and the other region is closer to the other end, so only the
+    regions on the side with fewer dependent regions are recomputed (the delay matrix is symmetric). Their invalidated delays
+    are repaired by relaxing the remaining links until no delay improves.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        network (dict): Network arrays (see "compile_network").
+        link_id (int): ID of the failed link.
+
+    Returns:
+        output (tuple): Matrix of delays between regions and indices of the regions whose delays were recomputed.
+    """
+    region_delays = arrays["region_delays"]
+
+    link = network["link_index"][link_id]
+    origin, target, delay = network["link_origin"][link], network["link_target"][link], network["link_delay"][link]
+
+    through_link = np.minimum(
+        region_delays[:, origin][:, None] + delay + region_delays[target][None, :],
+        region_delays[:, target][:, None] + delay + region_delays[origin][None, :],
+    )
+    uses_link = np.isclose(through_link, region_delays) & np.isfinite(region_delays)
+    np.fill_diagonal(uses_link, False)
+    affected = uses_link.any(axis=1)
+
+    if delay > 0:
+        origin_side = affected & (region_delays[:, origin] < region_delays[:, target])
+        target_side = affected & (region_delays[:, target] < region_delays[:, origin])
+        sources = np.flatnonzero(origin_side if origin_side.sum() <= target_side.sum() else target_side)
+    else:
+        sources = np.flatnonzero(affected)
+
+    delays = region_delays.copy()
+    if len(sources) == 0:
+        return delays, sources
+
+    # Bellman-Ford relaxation that starts from the delays that remain valid (invalidated delays start as unreachable). Columns
+    # hold the delays from each recomputed region, which are relaxed independently until they stop improving.
+    columns = region_delays[:, sources].copy()
+    columns[uses_link[sources].T] = np.inf
+
+    edge_delay = np.where(network["edge_link"] == link, np.inf, network["edge_delay"])[:, None]
+    edge_targets = network["edge_targets"]
+
+    active = np.arange(len(sources))
+    for _ in range(len(region_delays)):
+        current = columns[:, active]
+        incoming = np.minimum.reduceat(current[network["edge_from"]] + edge_delay, network["edge_starts"], axis=0)
+        improving = (incoming < current[edge_targets]).any(axis=0)
+        if not improving.any():
+            break
+        current[edge_targets] = np.minimum(current[edge_targets], incoming)
+        columns[:, active] = current
+        active = active[improving]
+
+    delays[:, sources] = columns
+    delays[sources, :] = columns.T
+
+    output = (delays, sources)
+
+    return output
+
+
+def fail_over(arrays: dict, indices: object, failed: int, free_capacity: object) -> object:
+    """Moves the services of a failed data center to the closest surviving data centers with enough free capacity (services
+    that fit nowhere go to the closest surviving data center, overloading it).
+
+    Args:
+        arrays (dict): Scenario arrays.
+        indices (object): Data center index of each service.
+        failed (int): Index of the failed data center.
+        free_capacity (object): Free capacity of each data center under the placement.
+
+    Returns:
+        indices (object): Data center index of each service after the failover.
+    """
+    indices = indices.copy()
+    free_capacity = free_capacity.copy()
+    free_capacity[failed] = -np.inf
+
+    # Surviving data centers sorted by their delay from the failed data center's region
+    delays = arrays["region_delays"][arrays["data_center_region"][failed], arrays["data_center_region"]]
+    candidates = [candidate for candidate in np.argsort(delays, kind="stable") if candidate != failed]
+    if len(candidates) == 0:
+        return indices
+
+    for service in np.flatnonzero(indices == failed):
+        demand = arrays["service_demand"][service]
+        host = next((candidate for candidate in candidates if free_capacity[candidate] >= demand), candidates[0])
+        indices[service] = host
+        free_capacity[host] -= demand
+
+    return indices
+
+
+def evaluate_scenarios(arrays: dict, indices: object, capacities: object, region_delays: object = None) -> dict:
+    """Evaluates a batch of failure scenarios.
+
+    Args:
+        arrays (dict): Scenario arrays.
+        indices (object): Data center index of each service in each scenario (-1 for unavailable services).
+        capacities (object): Capacity of each data center in each scenario.
+        region_delays (object, optional): Delays between regions (one matrix for all scenarios or one per scenario). Defaults
+            to the scenario's region delays.
+
+    Returns:
+        metrics (dict): Arrays with the metrics of each scenario.
+    """
+    available = indices >= 0
+    hosts = np.where(available, indices, 0)
+
+    # Users that access any unavailable service are treated as having an infinite delay
+    user_delays = calculate_user_delays(arrays=arrays, indices=hosts, region_delays=region_delays)
+    unavailable_users = np.zeros(user_delays.shape, dtype=bool)
+    rows, services = np.nonzero(~available)
+    unavailable_users[rows, arrays["service_user"][services]] = True
+    user_delays[unavailable_users] = np.inf
+
+    demands = calculate_data_center_demands(arrays=arrays, indices=hosts, service_demand=arrays["service_demand"] * available)
+    costs = arrays["service_cost"][np.arange(indices.shape[1]), hosts] * available
+
+    metrics = {
+        "sla_violations": (user_delays > arrays["user_delay_sla"]).sum(axis=1),
+        "overall_allocation_cost": costs.sum(axis=1),
+        "overloaded_data_centers": (demands > capacities).sum(axis=1),
+        "unavailable_users": unavailable_users.sum(axis=1),
+    }
+
+    return metrics
+
+
+def analyze_failures(
+    placement: list = None, scenarios: list = None, failover: str = "nearest", arrays: dict = None, batch_size: int = 64
+) -> list:
+    """Evaluates how a placement degrades under a set of failure scenarios.
+
+    Args:
+        placement (list, optional): Data center ID of each service. Defaults to the placement applied to the scenario.
+        scenarios (list, optional): Pairs of failure type and component ID. Defaults to every single failure (N-1 analysis).
+        failover (str, optional): Handling of the services of failed data centers ("none" or "nearest"). Defaults to "nearest".
+        arrays (dict, optional): Scenario arrays. Defaults to the arrays of the scenario currently loaded (see "get_scenario_arrays").
+        batch_size (int, optional): Number of link failures evaluated at once (each holds a matrix of region delays). Defaults to 64.
+
+    Returns:
+        results (list): Metrics of each scenario (and their difference to the metrics without failures).
+    """
+    if failover not in FAILOVER_POLICIES:
+        raise Exception(f"Unknown failover policy: {failover}. Valid options: {FAILOVER_POLICIES}.")
+
+    if placement is None:
+        if any(service.data_center is None for service in Service.all()):
+            raise Exception("Every service must be provisioned before analyzing failures.")
+        placement = [service.data_center.id for service in Service.all()]
+    if scenarios is None:
+        scenarios = get_single_failure_scenarios()
+    if arrays is None:
+        arrays = get_scenario_arrays()
+
+    for failure_type, _ in scenarios:
+        if failure_type not in FAILURE_TYPES:
+            raise Exception(f"Unknown failure type: {failure_type}. Valid options: {FAILURE_TYPES}.")
+
+    indices = get_data_center_indices(arrays=arrays, placements=placement)[0]
+    capacity = arrays["data_center_capacity"]
+    free_capacity = capacity - calculate_data_center_demands(arrays=arrays, indices=indices.reshape(1, -1))[0]
+
+    baseline = evaluate_scenarios(arrays=arrays, indices=indices.reshape(1, -1), capacities=capacity.reshape(1, -1))
+    results = [None] * len(scenarios)
+
+    # Data center failures share the intact topology, so they are evaluated together
+    data_center_scenarios = [i for i, (failure_type, _) in enumerate(scenarios) if failure_type == "data_center"]
+    if len(data_center_scenarios) > 0:
+        failed = arrays["data_center_index"][[scenarios[i][1] for i in data_center_scenarios]]
+
+        scenario_indices = np.tile(indices, (len(failed), 1))
+        capacities = np.tile(capacity, (len(failed), 1))
+        for row, failed_data_center in enumerate(failed):
+            capacities[row, failed_data_center] = 0
+            if failover == "nearest":
+                scenario_indices[row] = fail_over(
+                    arrays=arrays, indices=indices, failed=failed_data_center, free_capacity=free_capacity
+                )
+            else:
+                scenario_indices[row, indices == failed_data_center] = -1
+
+        metrics = evaluate_scenarios(arrays=arrays, indices=scenario_indices, capacities=capacities)
+        for row, i in enumerate(data_center_scenarios):
+            results[i] = {
+                "type": "data_center",
+                "id": scenarios[i][1],
+                **{key: value[row].item() for key, value in metrics.items()},
+                "migrated_services": int((scenario_indices[row] != indices).sum()) if failover == "nearest" else 0,
+                "lost_capacity": float(capacity[failed[row]]),
+                "recomputed_regions": 0,
+            }
+
+    # Each link failure has its own delay matrix, so link failures are evaluated in batches of stacked matrices
+    link_scenarios = [i for i, (failure_type, _) in enumerate(scenarios) if failure_type == "link"]
+    network = compile_network() if len(link_scenarios) > 0 else None
+    for start in range(0, len(link_scenarios), batch_size):
+        batch = link_scenarios[start : start + batch_size]
+
+        stack = np.empty((len(batch),) + arrays["region_delays"].shape)
+        recomputed_regions = []
+        for row, i in enumerate(batch):
+            stack[row], affected_regions = compute_link_failure_delays(arrays=arrays, network=network, link_id=scenarios[i][1])
+            recomputed_regions.append(len(affected_regions))
+
+        metrics = evaluate_scenarios(
+            arrays=arrays,
+            indices=np.tile(indices, (len(batch), 1)),
+            capacities=np.tile(capacity, (len(batch), 1)),
+            region_delays=stack,
+        )
+        for row, i in enumerate(batch):
+            results[i] = {
+                "type": "link",
+                "id": scenarios[i][1],
+                **{key: value[row].item() for key, value in metrics.items()},
+                "migrated_services": 0,
+                "lost_capacity": 0.0,
+                "recomputed_regions": recomputed_regions[row],
+            }
+
+    for result in results:
+        result["delta_sla_violations"] = result["sla_violations"] - baseline["sla_violations"][0].item()
+        result["delta_overloaded_data_centers"] = result["overloaded_data_centers"] - baseline["overloaded_data_centers"][0].item()
+
+    return results
+
+
+def run_what_if_analysis(failure_types: list = FAILURE_TYPES, failover: str = "nearest", output_file: str = None) -> dict:
+    """Runs an N-1 failure analysis of the placement applied to the scenario.
+
+    Args:
+        failure_types (list, optional): Types of components that fail. Defaults to data centers and links.
+        failover (str, optional): Handling of the services of failed data centers ("none" or "nearest"). Defaults to "nearest".
+        output_file (str, optional): CSV file that receives the metrics of each scenario. Defaults to None.
+
+    Returns:
+        summary (dict): Summary of the analysis (worst scenarios and execution time).
+    """
+    start_time = time.time()
+    results = analyze_failures(scenarios=get_single_failure_scenarios(failure_types=failure_types), failover=failover)
+    execution_time = time.time() - start_time
+
+    if output_file:
+        with open(output_file, "w", newline="", encoding="UTF-8") as file:
+            writer = csv.DictWriter(file, fieldnames=OUTPUT_FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+
+    summary = {"scenarios": len(results), "execution_time": execution_time}
+    if len(results) > 0:
+        worst_sla = max(results, key=lambda result: result["delta_sla_violations"])
+        worst_overload = max(results, key=lambda result: result["delta_overloaded_data_centers"])
+        summary.update(
+            {
+                "worst_sla_scenario": f"{worst_sla['type']} {worst_sla['id']}",
+                "worst_sla_delta": worst_sla["delta_sla_violations"],
+                "worst_overload_scenario": f"{worst_overload['type']} {worst_overload['id']}",
+                "worst_overload_delta": worst_overload["delta_overloaded_data_centers"],
+                "critical_scenarios": sum(1 for result in results if result["delta_sla_violations"] > 0),
+            }
+        )
+
+    return summary
@@ -0,0 +1,315 @@
+"""Contains a work queue kept in a shared directory, used to distribute sweep runs among worker processes on any number of nodes.
+
+The queue only relies on atomic file operations, so it works on any directory mounted by every node (e.g., over NFS):
+    - "jobs/<job>.json": command of each job, written by the coordinator.
+    - "claims/<job>.<attempt>": claim of each attempt to run a job. Claims are created exclusively ("O_EXCL"), so only one worker
+      gets each attempt, and workers refresh the modification time of their claims while the job runs (heartbeat). Claims that
+      are not refreshed within the lease (e.g., because the worker crashed) expire, and the job is claimed again with the next
+      attempt number. Jobs are abandoned after a maximum number of attempts.
+    - "done/<job>.json": outcome of each finished job.
+    - "logs/<job>.<attempt>.log": output of each attempt.
+    - "closed": marks that the coordinator submitted every job, so that idle workers can exit once every job is done.
+
+Worker clocks should be synchronized with the shared file system within a small fraction of the lease.
+"""
+# Python libraries
+from subprocess import Popen, STDOUT, TimeoutExpired
+import socket
+import json
+import time
+import os
+
+# Subdirectories of the queue
+QUEUE_DIRECTORIES = ["jobs", "claims", "done", "logs"]
+
+
+def write_json_atomically(file_name: str, content: dict):
+    """Writes a JSON file atomically, so that other processes never see it partially written.
+
+    Args:
+        file_name (str): File name.
+        content (dict): File content.
+    """
+    temporary_file_name = f"{file_name}.{socket.gethostname()}.{os.getpid()}.tmp"
+    with open(temporary_file_name, "w", encoding="UTF-8") as file:
+        json.dump(content, file, indent=4, default=str)
+    os.replace(temporary_file_name, file_name)
+
+
+def read_json(file_name: str) -> dict:
+    """Reads a JSON file.
+
+    Args:
+        file_name (str): File name.
+
+    Returns:
+        dict: File content.
+    """
+    with open(file_name, "r", encoding="UTF-8") as file:
+        return json.load(file)
+
+
+def create_queue(queue: str):
+    """Creates the directories of a queue (existing queues are kept).
+
+    Args:
+        queue (str): Directory of the queue.
+    """
+    for directory in QUEUE_DIRECTORIES:
+        os.makedirs(f"{queue}/{directory}", exist_ok=True)
+
+
+def submit_job(queue: str, job_id: str, command: list, priority: float = 0) -> bool:
+    """Adds a job to the queue. Jobs that completed are kept, while jobs that failed are submitted again.
+
+    Args:
+        queue (str): Directory of the queue.
+        job_id (str): Job ID (e.g., the run key in the result store).
+        command (list): Command executed by the job.
+        priority (float, optional): Priority of the job (workers claim jobs with higher priorities first). Defaults to 0.
+
+    Returns:
+        bool: Whether the job was submitted.
+    """
+    done_file_name = f"{queue}/done/{job_id}.json"
+    if os.path.exists(done_file_name):
+        if read_json(file_name=done_file_name)["status"] == "completed":
+            return False
+
+        # Discarding the claims of the failed job so that its attempts are counted from scratch
+        for claim in get_claims(queue=queue, job_id=job_id):
+            os.remove(f"{queue}/claims/{claim}")
+        os.remove(done_file_name)
+
+    write_json_atomically(file_name=f"{queue}/jobs/{job_id}.json", content={"id": job_id, "command": command, "priority": priority})
+
+    return True
+
+
+def open_queue(queue: str):
+    """Marks that the coordinator may submit more jobs (idle workers wait for them instead of exiting).
+
+    Args:
+        queue (str): Directory of the queue.
+    """
+    if os.path.exists(f"{queue}/closed"):
+        os.remove(f"{queue}/closed")
+
+
+def close_queue(queue: str):
+    """Marks that the coordinator submitted every job (idle workers exit once every job is done).
+
+    Args:
+        queue (str): Directory of the queue.
+    """
+    with open(f"{queue}/closed", "w", encoding="UTF-8") as file:
+        file.write(f"{time.time()}\n")
+
+
+def get_claims(queue: str, job_id: str) -> list:
+    """Lists the claims of a job, sorted by attempt (attempts are claimed in sequence, so the first missing attempt ends the list).
+
+    Args:
+        queue (str): Directory of the queue.
+        job_id (str): Job ID.
+
+    Returns:
+        claims (list): Names of the claim files.
+    """
+    claims = []
+    while os.path.exists(f"{queue}/claims/{job_id}.{len(claims) + 1}"):
+        claims.append(f"{job_id}.{len(claims) + 1}")
+
+    return claims
+
+
+def is_expired(claim_file_name: str, lease: float) -> bool:
+    """Checks whether a claim was not refreshed within the lease.
+
+    Args:
+        claim_file_name (str): Claim file.
+        lease (float): Lease (in seconds).
+
+    Returns:
+        bool: Whether the claim expired.
+    """
+    try:
+        return time.time() - os.stat(claim_file_name).st_mtime > lease
+    except FileNotFoundError:
+        return True
+
+
+def claim_job(queue: str, job_id: str, worker_id: str, lease: float, max_attempts: int) -> str:
+    """Tries to claim a job that is not done and is not being executed by a live worker.
+
+    Args:
+        queue (str): Directory of the queue.
+        job_id (str): Job ID.
+        worker_id (str): ID of the worker.
+        lease (float): Lease of claims (in seconds).
+        max_attempts (int): Maximum number of attempts to run the job.
+
+    Returns:
+        claim_file_name (str): Claim file (None if the job could not be claimed).
+    """
+    if os.path.exists(f"{queue}/done/{job_id}.json"):
+        return None
+
+    claims = get_claims(queue=queue, job_id=job_id)
+    attempt = int(claims[-1].rsplit(".", 1)[1]) if claims else 0
+
+    if attempt > 0 and not is_expired(claim_file_name=f"{queue}/claims/{claims[-1]}", lease=lease):
+        return None
+
+    # Abandoning jobs whose attempts all failed or expired
+    if attempt >= max_attempts:
+        write_json_atomically(
+            file_name=f"{queue}/done/{job_id}.json",
+            content={"id": job_id, "status": "failed", "attempts": attempt, "worker": worker_id, "finished_at": time.time()},
+        )
+        return None
+
+    claim_file_name = f"{queue}/claims/{job_id}.{attempt + 1}"
+    try:
+        descriptor = os.open(claim_file_name, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        # Another worker claimed the attempt first
+        return None
+
+    with os.fdopen(descriptor, "w", encoding="UTF-8") as file:
+        file.write(f"{worker_id}\n")
+
+    return claim_file_name
+
+
+def run_job(queue: str, job: dict, claim_file_name: str, worker_id: str, lease: float) -> bool:
+    """Runs a claimed job, refreshing its claim while the job runs, and records its outcome.
+
+    Args:
+        queue (str): Directory of the queue.
+        job (dict): Job.
+        claim_file_name (str): Claim file of the job.
+        worker_id (str): ID of the worker.
+        lease (float): Lease of claims (in seconds).
+
+    Returns:
+        bool: Whether the job completed successfully.
+    """
+    attempt = int(claim_file_name.rsplit(".", 1)[1])
+    start_time = time.time()
+
+    with open(f"{queue}/logs/{job['id']}.{attempt}.log", "w", encoding="UTF-8") as log:
+        process = Popen(job["command"], stdout=log, stderr=STDOUT)
+
+        # Refreshing the claim well within the lease, so that the job is not claimed by other workers while it runs
+        while True:
+            try:
+                return_code = process.wait(timeout=lease / 4)
+                break
+            except TimeoutExpired:
+                os.utime(claim_file_name)
+
+    if return_code != 0:
+        # Expiring the claim right away so that the job is retried (until the maximum number of attempts is reached)
+        os.utime(claim_file_name, (0, 0))
+        return False
+
+    write_json_atomically(
+        file_name=f"{queue}/done/{job['id']}.json",
+        content={
+            "id": job["id"],
+            "status": "completed",
+            "attempts": attempt,
+            "worker": worker_id,
+            "execution_time": time.time() - start_time,
+            "finished_at": time.time(),
+        },
+    )
+
+    return True
+
+
+def get_queue_status(queue: str, lease: float) -> dict:
+    """Summarizes the state of the jobs of a queue.
+
+    Args:
+        queue (str): Directory of the queue.
+        lease (float): Lease of claims (in seconds).
+
+    Returns:
+        status (dict): Number of jobs in each state.
+    """
+    status = {"jobs": 0, "pending": 0, "running": 0, "completed": 0, "failed": 0}
+
+    for name in os.listdir(f"{queue}/jobs"):
+        if not name.endswith(".json"):
+            continue
+
+        job_id = name[: -len(".json")]
+        status["jobs"] += 1
+
+        if os.path.exists(f"{queue}/done/{job_id}.json"):
+            status[read_json(file_name=f"{queue}/done/{job_id}.json")["status"]] += 1
+        else:
+            claims = get_claims(queue=queue, job_id=job_id)
+            running = claims and not is_expired(claim_file_name=f"{queue}/claims/{claims[-1]}", lease=lease)
+            status["running" if running else "pending"] += 1
+
+    return status
+
+
+def run_worker(queue: str, worker_id: str = None, lease: float = 60, poll_interval: float = 5, max_attempts: int = 3) -> dict:
+    """Claims and runs jobs until the queue is closed and every job is done.
+
+    Args:
+        queue (str): Directory of the queue.
+        worker_id (str, optional): ID of the worker. Defaults to "<host name>:<process ID>".
+        lease (float, optional): Lease of claims (in seconds). Defaults to 60.
+        poll_interval (float, optional): Time (in seconds) between checks for new or expired jobs. Defaults to 5.
+        max_attempts (int, optional): Maximum number of attempts to run each job. Defaults to 3.
+
+    Returns:
+        summary (dict): Number of jobs completed and failed by the worker.
+    """
+    if worker_id is None:
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    create_queue(queue=queue)
+    summary = {"worker": worker_id, "completed": 0, "failed": 0}
+
+    # Jobs read so far (job files only change when failed jobs are submitted again, which does not change their commands)
+    jobs = {}
+
+    while True:
+        claimed = False
+        pending = False
+
+        for name in os.listdir(f"{queue}/jobs"):
+            if name.endswith(".json") and name not in jobs:
+                jobs[name] = read_json(file_name=f"{queue}/jobs/{name}")
+
+        for job in sorted(jobs.values(), key=lambda job: (-job.get("priority", 0), job["id"])):
+            job_id = job["id"]
+            if os.path.exists(f"{queue}/done/{job_id}.json"):
+                continue
+
+            pending = True
+            claim_file_name = claim_job(queue=queue, job_id=job_id, worker_id=worker_id, lease=lease, max_attempts=max_attempts)
+            if claim_file_name is None:
+                continue
+
+            claimed = True
+            print(f"[{worker_id}] Running {job_id[:12]} ({os.path.basename(claim_file_name)})")
+
+            if run_job(queue=queue, job=job, claim_file_name=claim_file_name, worker_id=worker_id, lease=lease):
+                summary["completed"] += 1
+            else:
+                summary["failed"] += 1
+
+        # Jobs claimed by other workers are watched until they finish, as their workers may crash and their claims expire
+        if not claimed:
+            if not pending and os.path.exists(f"{queue}/closed"):
+                break
+            time.sleep(poll_interval)
+
+    return summary